@@ -0,0 +1,3 @@
+"""
+Локальный стенд реестра и замеры производительности парсеров
+"""
@@ -0,0 +1,183 @@
+"""
+Замер памяти на запись: обычные и компактные модели
+
+Создает N записей каждой модели из синтетических данных, похожих на
+результат парсинга (каждая строка - отдельный объект, как после разбора
+HTML), и измеряет через tracemalloc объем памяти списка записей.
+
+Использование:
+    python -m benchmarks.memory_models --records 50000
+    python -m benchmarks.memory_models --records 100000 --json memory.json
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from models import (
+    Auditor,
+    Organization,
+    Certificate,
+    CompactAuditor,
+    CompactOrganization,
+    CompactCertificate,
+)
+
+REGIONS = ["Москва", "Санкт-Петербург", "Новосибирск", "Казань", "Екатеринбург"]
+STATUSES = ["Член СРО ААС", "Приостановлено членство"]
+QUALIFICATIONS = ["Единый аттестат", "Аттестат аудитора"]
+
+
+def _fresh(value: str) -> str:
+    # Новый объект str с тем же текстом: так строки приходят из парсера
+    return "".join(list(value))
+
+
+def auditor_fields(number: int) -> Dict[str, Any]:
+    """Поля аудитора в том виде, в каком их передает AuditorsParser"""
+    return {
+        "full_name": f"Иванов Иван Иванович {number}",
+        "ornz": f"{22006000000 + number}",
+        "certificate_number": f"06-{number:06d}",
+        "region": _fresh(REGIONS[number % len(REGIONS)]),
+        "status": _fresh(STATUSES[number % len(STATUSES)]),
+        "inn": f"{770000000000 + number}",
+        "qualification": _fresh(QUALIFICATIONS[number % len(QUALIFICATIONS)]),
+        "education": _fresh("Высшее"),
+        "experience_years": number % 40,
+        "source_url": f"https://sroaas.ru/reestr/auditory/detail/{number}/",
+    }
+
+
+def organization_fields(number: int) -> Dict[str, Any]:
+    """Поля организации в том виде, в каком их передает OrganizationsParser"""
+    return {
+        "name": f'ООО "Аудит {number}"',
+        "ornz": f"{12006000000 + number}",
+        "inn": f"{7700000000 + number}",
+        "region": _fresh(REGIONS[number % len(REGIONS)]),
+        "status": _fresh(STATUSES[number % len(STATUSES)]),
+        "ogrn": f"{1027700000000 + number}",
+        "address": f"г. Москва, ул. Примерная, д. {number % 100}",
+        "auditors_count": number % 25 + 1,
+        "source_url": f"https://sroaas.ru/reestr/organizatsiy/detail/{number}/",
+    }
+
+
+def certificate_fields(number: int) -> Dict[str, Any]:
+    """Поля квалификационного аттестата"""
+    return {
+        "certificate_number": f"06-{number:06d}",
+        "auditor_full_name": f"Иванов Иван Иванович {number}",
+        "issue_date": None,
+        "status": _fresh(STATUSES[number % len(STATUSES)]),
+        "qualification_type": _fresh(QUALIFICATIONS[number % len(QUALIFICATIONS)]),
+        "issuer": _fresh("СРО ААС"),
+    }
+
+
+# (название, обычная модель, компактная модель, поля записи)
+CASES = [
+    ("Auditor", Auditor, CompactAuditor, auditor_fields),
+    ("Organization", Organization, CompactOrganization, organization_fields),
+    ("Certificate", Certificate, CompactCertificate, certificate_fields),
+]
+
+
+def measure(
+    model: Callable[..., Any], make_fields: Callable[[int], Dict[str, Any]], count: int
+) -> int:
+    """
+    Память списка записей модели
+
+    Args:
+        model: Класс модели или фабрика записей
+        make_fields: Функция номер -> поля записи
+        count: Число записей
+
+    Returns:
+        Байт, занятых записями (по tracemalloc)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records: List[Any] = [model(**make_fields(number)) for number in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return after - before
+
+
+def run(count: int) -> List[Dict[str, Any]]:
+    """
+    Замер всех моделей
+
+    Args:
+        count: Записей каждой модели
+
+    Returns:
+        Результаты по моделям
+    """
+    # Компактные записи получают одну метку на обход, как в iter_objects
+    parsed_at = datetime.now()
+    results = []
+    for name, model, compact, make_fields in CASES:
+        regular_bytes = measure(model, make_fields, count)
+        compact_model = partial(compact, parsed_at=parsed_at)
+        compact_bytes = measure(compact_model, make_fields, count)
+        results.append(
+            {
+                "model": name,
+                "records": count,
+                "regular_bytes_per_record": regular_bytes / count,
+                "compact_bytes_per_record": compact_bytes / count,
+                "saving_percent": (
+                    100 * (regular_bytes - compact_bytes) / regular_bytes
+                    if regular_bytes
+                    else 0.0
+                ),
+            }
+        )
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]):
+    """Вывод таблицы результатов"""
+    header = f"{'Модель':<16}{'записей':>10}{'обычная Б':>12}{'компакт Б':>12}{'экономия':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['model']:<16}{result['records']:>10}"
+            f"{result['regular_bytes_per_record']:>12.0f}"
+            f"{result['compact_bytes_per_record']:>12.0f}"
+            f"{result['saving_percent']:>9.1f}%"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Замер памяти на запись: обычные и компактные модели"
+    )
+    parser.add_argument("--records", type=int, default=50000, help="Записей каждой модели")
+    parser.add_argument("--json", type=str, help="Сохранить результаты в JSON-файл")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = run(max(1, args.records))
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Результаты сохранены: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
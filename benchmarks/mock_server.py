@@ -0,0 +1,304 @@
+"""
+Локальный HTTP-стенд, имитирующий реестры sroaas.ru
+
+Отдает синтетические списочные страницы (таблица, блок b-pagination-block
+со ссылками ?PAGEN_1=page-N) и детальные страницы с парами label/value
+в div.info-block. Задержка ответа, доля ошибок и размер реестра задаются
+параметрами.
+
+Использование:
+    python -m benchmarks.mock_server --port 8000 --pages 20 --per-page 50
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+# Ссылка на детальную страницу: /reestr/<реестр>/detail/<номер>/
+DETAIL_PATH = re.compile(r"^/reestr/(?P<registry>[^/]+)/detail/(?P<record>\d+)/?$")
+PAGE_PARAM = re.compile(r"PAGEN_1=page-(\d+)")
+
+REGIONS = ["Москва", "Санкт-Петербург", "Новосибирск", "Казань", "Екатеринбург"]
+STATUSES = ["Член СРО ААС", "Приостановлено членство"]
+
+
+class MockRegistry:
+    """
+    Параметры синтетического реестра
+
+    Содержимое страниц детерминировано (зависит только от номеров страницы и
+    записи), поэтому повторные запросы возвращают одинаковые ответы.
+    """
+
+    def __init__(
+        self,
+        pages: int = 10,
+        per_page: int = 50,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        padding_kb: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            pages: Число страниц пагинации
+            per_page: Записей на странице
+            latency: Задержка ответа в секундах
+            jitter: Случайная добавка к задержке (от 0 до jitter секунд)
+            error_rate: Доля ответов 503 (от 0 до 1)
+            padding_kb: Объем служебной разметки на странице в КБ (вес страницы)
+            seed: Начальное значение генератора ошибок и задержек
+        """
+        self.pages = max(1, pages)
+        self.per_page = max(1, per_page)
+        self.latency = max(0.0, latency)
+        self.jitter = max(0.0, jitter)
+        self.error_rate = min(max(0.0, error_rate), 1.0)
+        self.padding = self._padding(padding_kb)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.list_requests = 0
+        self.detail_requests = 0
+        self.errors = 0
+
+    @staticmethod
+    def _padding(padding_kb: int) -> str:
+        if padding_kb <= 0:
+            return ""
+        item = '<li class="menu-item"><a href="/about/">Раздел сайта</a></li>'
+        count = padding_kb * 1024 // len(item.encode("utf-8")) + 1
+        return f'<ul class="menu">{item * count}</ul>'
+
+    def delay_and_fail(self) -> Tuple[float, bool]:
+        """
+        Задержка и признак ошибки для очередного запроса
+
+        Returns:
+            Пара (задержка в секундах, отвечать ли 503)
+        """
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay, failed
+
+    def list_page(self, base_url: str, registry: str, page: int) -> str:
+        """
+        HTML списочной страницы
+
+        Args:
+            base_url: Адрес стенда (http://host:port)
+            registry: Имя реестра из пути
+            page: Номер страницы
+
+        Returns:
+            HTML страницы
+        """
+        with self._lock:
+            self.list_requests += 1
+
+        rows = []
+        first = (page - 1) * self.per_page + 1
+        for record in range(first, first + self.per_page):
+            rows.append(
+                "<tr>"
+                f"<td>Запись {record}</td>"
+                f"<td>{12000000000 + record}</td>"
+                f"<td>{7700000000 + record}</td>"
+                f"<td>{REGIONS[record % len(REGIONS)]}</td>"
+                f"<td>{STATUSES[record % len(STATUSES)]}</td>"
+                f'<td><a href="{base_url}/reestr/{registry}/detail/{record}/">'
+                "Подробнее</a></td>"
+                "</tr>"
+            )
+
+        links = "".join(
+            f'<a href="?PAGEN_1=page-{number}">{number}</a>'
+            for number in range(1, self.pages + 1)
+        )
+        return (
+            "<html><head><title>Реестр</title></head><body>"
+            f"{self.padding}"
+            '<table class="b-table">'
+            "<tr><th>Наименование</th><th>ОРНЗ</th><th>ИНН</th>"
+            "<th>Регион</th><th>Статус</th><th>Карточка</th></tr>"
+            f"{''.join(rows)}</table>"
+            f'<div class="b-pagination-block">{links}</div>'
+            "</body></html>"
+        )
+
+    def detail_page(self, record: int) -> str:
+        """
+        HTML детальной страницы
+
+        Args:
+            record: Номер записи
+
+        Returns:
+            HTML страницы
+        """
+        with self._lock:
+            self.detail_requests += 1
+
+        fields = [
+            ("ИНН", f"{7700000000 + record}"),
+            ("СНИЛС", f"{record:03d}-000-000 00"),
+            ("Квалификация", "Единый аттестат"),
+            ("Образование", "Высшее"),
+            ("Стаж работы", f"{record % 40} лет"),
+            ("Полное наименование", f'ООО "Аудит {record}"'),
+            ("ОГРН", f"{1027700000000 + record}"),
+            ("КПП", "770101001"),
+            ("Адрес", f"г. Москва, ул. Примерная, д. {record % 100}"),
+            ("Телефон", f"+7 495 000-{record % 100:02d}-00"),
+            ("Email", f"audit{record}@example.ru"),
+            ("Руководитель", f"Руководитель {record}"),
+            ("Дата регистрации", "01.02.2003"),
+            ("Количество аудиторов", f"{record % 25 + 1}"),
+        ]
+        pairs = "".join(
+            f'<div class="label">{label}</div><div class="value">{value}</div>'
+            for label, value in fields
+        )
+        return (
+            "<html><head><title>Карточка</title></head><body>"
+            f"{self.padding}"
+            f'<div class="info-block">{pairs}</div>'
+            '<div class="certificates">'
+            f'<div class="certificate-item">Аттестат {record}</div></div>'
+            '<div class="networks"><div class="network-item">Сеть 1</div></div>'
+            "</body></html>"
+        )
+
+
+def _make_handler(registry: MockRegistry):
+    class MockRegistryHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Заголовки и тело пишутся отдельно: без TCP_NODELAY keep-alive
+        # соединение ждет delayed ACK клиента (~40 мс на ответ)
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            delay, failed = registry.delay_and_fail()
+            if delay:
+                time.sleep(delay)
+            if failed:
+                self._send(503, b"Service Unavailable")
+                return
+
+            url = urlparse(self.path)
+            base_url = f"http://{self.headers.get('Host')}"
+            detail = DETAIL_PATH.match(url.path)
+
+            if detail:
+                body = registry.detail_page(int(detail.group("record")))
+            elif url.path.startswith("/reestr/"):
+                match = PAGE_PARAM.search(url.query)
+                page = int(match.group(1)) if match else 1
+                if page > registry.pages:
+                    self._send(404, b"Not Found")
+                    return
+                name = url.path.strip("/").split("/")[1]
+                body = registry.list_page(base_url, name, page)
+            else:
+                self._send(404, b"Not Found")
+                return
+
+            self._send(200, body.encode("utf-8"), "text/html; charset=utf-8")
+
+        def _send(self, status: int, body: bytes, content_type: str = "text/plain"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return MockRegistryHandler
+
+
+def start_mock_server(
+    registry: MockRegistry, host: str = "127.0.0.1", port: int = 0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Запуск стенда в фоновом потоке
+
+    Args:
+        registry: Параметры реестра
+        host: Адрес для прослушивания
+        port: Порт (0 - любой свободный)
+
+    Returns:
+        Пара (сервер, адрес вида http://host:port)
+    """
+    server = ThreadingHTTPServer((host, port), _make_handler(registry))
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="mock-registry", daemon=True
+    )
+    thread.start()
+    return server, f"http://{host}:{server.server_port}"
+
+
+def add_registry_arguments(parser: argparse.ArgumentParser):
+    """Параметры синтетического реестра для командной строки"""
+    parser.add_argument("--pages", type=int, default=10, help="Страниц пагинации")
+    parser.add_argument("--per-page", type=int, default=50, help="Записей на странице")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Задержка ответа в секундах"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Случайная добавка к задержке (сек)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Доля ответов 503 (0..1)"
+    )
+    parser.add_argument(
+        "--padding-kb", type=int, default=0, help="Служебная разметка страницы в КБ"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed генератора")
+
+
+def registry_from_args(args) -> MockRegistry:
+    """Создание MockRegistry из аргументов add_registry_arguments"""
+    return MockRegistry(
+        pages=args.pages,
+        per_page=args.per_page,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        padding_kb=args.padding_kb,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный стенд реестров СРО ААС")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8000, help="Порт")
+    add_registry_arguments(parser)
+    args = parser.parse_args()
+
+    registry = registry_from_args(args)
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(registry))
+    print(f"Стенд запущен: http://{args.host}:{server.server_port}/reestr/<реестр>/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Замер пропускной способности парсеров на локальном стенде
+
+Запускает AuditorsParser, OrganizationsParser и GenericRegistryParser
+против benchmarks.mock_server и выводит страниц/с, записей/с, p50/p99
+задержки запроса и пиковый RSS. Каждый парсер работает в отдельном
+процессе, чтобы пиковая память не суммировалась между замерами.
+
+Использование:
+    python -m benchmarks.throughput --pages 20 --per-page 50 --latency 0.02
+    python -m benchmarks.throughput --engine async --concurrency 8 --json out.json
+"""
+
+import argparse
+import functools
+import importlib
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from benchmarks.mock_server import (
+    add_registry_arguments,
+    registry_from_args,
+    start_mock_server,
+)
+
+# Замеряемые парсеры: (ключ реестра, класс парсера)
+CASES = [
+    ("auditors", "parsers.auditors_parser.AuditorsParser"),
+    ("organizations", "parsers.organizations_parser.OrganizationsParser"),
+    ("certificates", "parsers.generic_parser.GenericRegistryParser"),
+]
+
+
+def percentile(samples: List[float], q: float) -> Optional[float]:
+    """
+    Перцентиль по методу ближайшего ранга
+
+    Args:
+        samples: Значения
+        q: Перцентиль от 0 до 100
+
+    Returns:
+        Значение перцентиля или None для пустой выборки
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Пиковый RSS текущего процесса в МБ
+
+    Returns:
+        Значение в МБ или None, если модуль resource недоступен (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux возвращает КБ, macOS - байты
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def _timed(method, latencies: List[float]):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+def _timed_async(method, latencies: List[float]):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+def run_case(
+    registry_key: str, class_path: str, base_url: str, options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Замер одного парсера (выполняется в отдельном процессе)
+
+    Args:
+        registry_key: Ключ реестра из config.REGISTRIES
+        class_path: Полное имя класса парсера
+        base_url: Адрес стенда
+        options: Настройки PARSER_CONFIG и режим обхода
+
+    Returns:
+        Словарь с результатами замера
+    """
+    from config import REGISTRIES, PARSER_CONFIG, CACHE_CONFIG, LOGGING_CONFIG
+
+    LOGGING_CONFIG["level"] = "WARNING"
+    CACHE_CONFIG["enabled"] = False
+    PARSER_CONFIG.update(options["parser_config"])
+    REGISTRIES[registry_key]["url"] = f"{base_url}/reestr/{registry_key}/"
+
+    module_name, class_name = class_path.rsplit(".", 1)
+    cls = getattr(importlib.import_module(module_name), class_name)
+    parser = cls.from_registry_key(registry_key)
+
+    # Задержка запроса с точки зрения парсера: повторы и ожидание включены
+    latencies: List[float] = []
+    parser._make_request = _timed(parser._make_request, latencies)
+    parser._make_request_async = _timed_async(parser._make_request_async, latencies)
+
+    pages = 0
+    records = 0
+    started = time.perf_counter()
+    for page_data in parser.iter_pages(detailed=options["detailed"]):
+        pages += 1
+        records += len(page_data)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "parser": class_name,
+        "registry": registry_key,
+        "list_pages": pages,
+        "requests": len(latencies),
+        "records": records,
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed if elapsed else 0.0,
+        "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "records_per_second": records / elapsed if elapsed else 0.0,
+        "latency_p50_ms": _ms(percentile(latencies, 50)),
+        "latency_p99_ms": _ms(percentile(latencies, 99)),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return seconds * 1000 if seconds is not None else None
+
+
+def _fmt(value: Optional[float], digits: int = 1) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def print_results(results: List[Dict[str, Any]]):
+    """Вывод таблицы результатов"""
+    # Страницы - страницы пагинации; запросы - все HTTP-запросы, включая
+    # детальные страницы и повторы
+    header = (
+        f"{'Парсер':<24}{'страниц':>9}{'запросов':>10}{'записей':>9}{'сек':>8}"
+        f"{'стр/с':>9}{'запр/с':>9}{'зап/с':>9}{'p50 мс':>9}{'p99 мс':>9}"
+        f"{'RSS МБ':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['parser']:<24}{result['list_pages']:>9}"
+            f"{result['requests']:>10}{result['records']:>9}"
+            f"{_fmt(result['seconds'], 2):>8}"
+            f"{_fmt(result['pages_per_second']):>9}"
+            f"{_fmt(result['requests_per_second']):>9}"
+            f"{_fmt(result['records_per_second']):>9}"
+            f"{_fmt(result['latency_p50_ms']):>9}"
+            f"{_fmt(result['latency_p99_ms']):>9}"
+            f"{_fmt(result['peak_rss_mb']):>9}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Замер пропускной способности парсеров на локальном стенде"
+    )
+    add_registry_arguments(parser)
+    parser.add_argument(
+        "--mode",
+        choices=["quick", "full"],
+        default="full",
+        help="quick - первая страница, full - все страницы с детальными",
+    )
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--detail-workers", type=int, default=1)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    parser.add_argument("--prefetch", type=int, default=2)
+    parser.add_argument(
+        "--parsers",
+        type=str,
+        default="auditors,organizations,certificates",
+        help="Ключи замеряемых реестров через запятую",
+    )
+    parser.add_argument("--json", type=str, help="Сохранить результаты в JSON-файл")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    registry = registry_from_args(args)
+    server, base_url = start_mock_server(registry)
+
+    options = {
+        "detailed": args.mode == "full",
+        "parser_config": {
+            "engine": args.engine,
+            "concurrent_requests_per_host": max(1, args.concurrency),
+            "detail_workers": max(1, args.detail_workers),
+            "parse_workers": max(0, args.parse_workers),
+            "prefetch_pages": max(0, args.prefetch),
+            "requests_per_second": 0,
+            "delay_between_requests": 0.05,
+            "incremental": False,
+            "resume": False,
+        },
+    }
+    selected = {key.strip() for key in args.parsers.split(",")}
+
+    print(
+        f"Стенд {base_url}: {registry.pages} стр. x {registry.per_page} записей, "
+        f"задержка {registry.latency} с, ошибок {registry.error_rate:.0%}, "
+        f"движок {args.engine}"
+    )
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    try:
+        for registry_key, class_path in CASES:
+            if registry_key not in selected:
+                continue
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(
+                    executor.submit(
+                        run_case, registry_key, class_path, base_url, options
+                    ).result()
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print()
+    print_results(results)
+    print(
+        f"\nЗапросов к стенду: списочных {registry.list_requests}, "
+        f"детальных {registry.detail_requests}, ответов 503 {registry.errors}"
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Результаты сохранены: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -86,16 +86,66 @@ REGISTRIES = {
 # Настройки парсера
 PARSER_CONFIG = {
     "timeout": 30,  # таймаут запроса в секундах
-    "delay_between_requests": 1,  # задержка между запросами в секундах
+    "delay_between_requests": 1,  # базовая задержка перед повтором после ошибки (сек)
     "max_retries": 3,  # максимальное количество попыток
+    "backoff_max": 60,  # верхняя граница экспоненциальной задержки повтора (сек)
+    "breaker_failure_threshold": 10,  # отказов хоста подряд до размыкания автомата
+    "breaker_cooldown": 120,  # пауза после размыкания автомата (сек)
+    "breaker_mode": "fail",  # при размыкании: fail - прервать обход, pause - ждать
+    "requests_per_second": 2.0,  # средняя частота запросов на процесс (0 - без ограничения)
+    "burst": 4,  # запросов подряд без ожидания
+    "max_retry_after": 300,  # верхняя граница паузы по Retry-After (сек)
+    "engine": "sync",  # движок загрузки: sync (requests) или async (aiohttp)
+    "pool_connections": 10,  # число пулов соединений (хостов) в общей сессии
+    "pool_maxsize": 32,  # keep-alive соединений на хост (>= потоков с запросами)
+    "concurrent_requests_per_host": 4,  # одновременных запросов к хосту (async)
+    "prefetch_pages": 2,  # страниц пагинации, загружаемых заранее (0 - выключено)
+    "incremental": False,  # детальные страницы только для новых/измененных строк
+    "max_parallel_registries": 3,  # реестров одновременно в режиме --registry all
+    "detail_workers": 1,  # потоков загрузки детальных страниц (1 - последовательно)
+    "partial_parse": True,  # строить дерево только из нужных парсеру блоков страницы
+    "list_backend": "lxml",  # извлечение таблиц списочных страниц: lxml или bs4
+    "stream_pages": False,  # разбирать страницы пагинации по мере загрузки (без кэша и архива)
+    "stream_chunk_size": 64 * 1024,  # размер части тела ответа при потоковом разборе
+    "parse_workers": 0,  # процессов разбора детальных страниц (0 - в основном процессе)
+    "resume": False,  # продолжить полный обход с контрольной точки
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 }
 
+# Настройки дискового кэша HTTP-ответов
+CACHE_CONFIG = {
+    "enabled": True,
+    "cache_dir": "data/cache/",
+    "ttl_days": 7,  # записи старше удаляются
+    "max_size_mb": 1024,  # при превышении удаляются давно не использованные записи
+}
+
+# Состояние инкрементального обхода (отпечатки строк и детальные данные)
+STATE_CONFIG = {
+    "state_dir": "data/state/",
+}
+
+# Контрольные точки полного обхода (возобновление после сбоя)
+CHECKPOINT_CONFIG = {
+    "checkpoint_dir": "data/checkpoints/",
+    "interval": 30,  # максимальный интервал между сохранениями (сек)
+}
+
+# Архив исходных HTML-страниц (--archive) и воспроизведение (--replay)
+ARCHIVE_CONFIG = {
+    "archive_dir": "data/archive/",
+    "run_id": None,  # идентификатор архивируемого запуска (None - архив выключен)
+    "replay_run_id": None,  # запуск, страницы которого разбираются без сети
+}
+
 # Настройки экспорта
 EXPORT_CONFIG = {
     "output_dir": "data/exports/",
     "date_format": "%Y-%m-%d_%H-%M-%S",
     "encoding": "utf-8",
+    "single_workbook": False,  # --registry all: все реестры листами одной книги
+    "batch_in_memory": False,  # реестр с моделью - одним пакетом в памяти (не потоком)
+    "width_sample_rows": 20000,  # записей для подбора ширины колонок (0 - все)
 }
 
 # Настройки логирования
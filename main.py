@@ -12,20 +12,36 @@
         python main.py --registry auditors --mode quick
         python main.py --registry organizations --mode full
         python main.py -r certificates -m quick
+        python main.py -r auditors -m full --engine async
+        python main.py -r organizations -m incremental
+        python main.py --registry all --mode quick --max-parallel 4
+        python main.py -r auditors -m full --archive
+        python main.py -r auditors -m full --replay 2024-01-31_02-00-00 --parse-workers 8
         python main.py --list  # Показать доступные реестры
 """
 
 import sys
 import os
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-
-from config import REGISTRIES
+from typing import List, Dict, Any, Optional
+
+from config import (
+    REGISTRIES,
+    PARSER_CONFIG,
+    CACHE_CONFIG,
+    ARCHIVE_CONFIG,
+    EXPORT_CONFIG,
+)
 from parsers.organizations_parser import OrganizationsParser
 from parsers.auditors_parser import AuditorsParser
 from parsers.generic_parser import GenericRegistryParser
-from utils.excel_exporter import ExcelExporter
+from utils.excel_exporter import ExcelExporter, SheetSpool
 from utils.logger import setup_logger
+from utils.transport import get_transport_stats
+from utils.archive import HtmlArchive
 
 
 def print_banner():
@@ -94,9 +110,11 @@ def list_registries():
     print("Режимы (--mode):")
     print("  quick - Быстрый (первая страница)")
     print("  full  - Полный (все страницы)")
+    print("  incremental - Полный, детальные страницы только для новых/измененных")
     print("=" * 60)
     print("\nПример:")
     print("  python main.py --registry auditors --mode quick")
+    print("  python main.py --registry all --mode quick")
     print("  python main.py -r organizations -m full\n")
 
 
@@ -134,12 +152,59 @@ def print_menu():
     print("\n⭐ - Полностью реализованный парсер")
 
 
-def parse_organizations(detailed=False):
+def export_registry(
+    parser, exporter: ExcelExporter, detailed: bool, filename: str, sheet_name: str
+) -> Optional[str]:
+    """
+    Парсинг реестра с экспортом в Excel
+
+    Реестры парсеров с record_model выгружаются потоком колоночных пакетов
+    по страницам (iter_batches + export_batches): типы и даты колонок
+    приводятся векторно, а память не зависит от размера реестра. При
+    EXPORT_CONFIG["batch_in_memory"] реестр собирается в один пакет
+    (parse_to_batch + export_batch) - без временного файла, но весь реестр
+    находится в памяти. Остальные реестры выгружаются потоком записей.
+
+    Args:
+        parser: Парсер реестра
+        exporter: Экспортер (число записей - в exporter.rows_exported)
+        detailed: Парсить ли детальные страницы
+        filename: Имя файла (без расширения)
+        sheet_name: Название листа
+
+    Returns:
+        Путь к созданному файлу или None
+    """
+    if parser.record_model is None:
+        return exporter.export_stream(
+            parser.iter_registry(detailed=detailed),
+            filename=filename,
+            sheet_name=sheet_name,
+        )
+    if EXPORT_CONFIG["batch_in_memory"]:
+        return exporter.export_batch(
+            parser.parse_to_batch(detailed=detailed),
+            filename=filename,
+            sheet_name=sheet_name,
+        )
+    return exporter.export_batches(
+        parser.iter_batches(detailed=detailed),
+        filename=filename,
+        sheet_name=sheet_name,
+    )
+
+
+def parse_organizations(detailed=False, confirm=True):
     """
     Парсинг реестра аудиторских организаций
 
     Args:
         detailed: Парсить ли детальные страницы
+        confirm: Запрашивать ли подтверждение детального парсинга
+            (False - неинтерактивный режим: ошибки пробрасываются)
+
+    Returns:
+        True, если записи собраны и экспортированы
     """
     logger = setup_logger("main")
 
@@ -148,51 +213,58 @@ def parse_organizations(detailed=False):
     print("=" * 60)
 
     # Подтверждение пользователя
-    if detailed:
+    if detailed and confirm:
         print("\n⚠️  ВНИМАНИЕ: Детальный парсинг может занять продолжительное время!")
         choice = input("Продолжить? (y/n): ").lower()
         if choice != "y":
             print("Операция отменена.")
-            return
+            return False
 
     try:
         # Создание парсера
         parser = OrganizationsParser()
 
-        # Парсинг данных
+        # Парсинг данных с потоковым экспортом в Excel
         print("\n🔄 Начало парсинга...")
-        organizations = parser.parse_to_objects(detailed=detailed)
-
-        if not organizations:
-            print("\n❌ Не удалось получить данные из реестра.")
-            return
-
-        print(f"\n✅ Успешно собрано записей: {len(organizations)}")
-
-        # Экспорт в Excel
-        print("\n📊 Экспорт данных в Excel...")
         exporter = ExcelExporter()
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"organizations_{timestamp}"
 
-        filepath = exporter.export_organizations(organizations, filename=filename)
+        filepath = export_registry(
+            parser, exporter, detailed, filename, sheet_name="Аудиторские организации"
+        )
+
+        if not exporter.rows_exported:
+            print("\n❌ Не удалось получить данные из реестра.")
+            return False
+
+        print(f"\n✅ Успешно собрано записей: {exporter.rows_exported}")
 
         if filepath:
             print(f"\n✅ Данные успешно экспортированы!")
             print(f"📁 Файл: {os.path.abspath(filepath)}")
-            print(f"📊 Количество записей: {len(organizations)}")
-        else:
-            print("\n❌ Ошибка при экспорте данных.")
+            print(f"📊 Количество записей: {exporter.rows_exported}")
+            return True
+
+        print("\n❌ Ошибка при экспорте данных.")
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Операция прервана пользователем.")
     except Exception as e:
         logger.error(f"Ошибка при парсинге: {e}")
         print(f"\n❌ Произошла ошибка: {e}")
+        # Без подтверждений (cron) ошибка, в т.ч. CircuitOpenError при
+        # недоступности сайта, передается вызывающему коду
+        if not confirm:
+            raise
 
+    return False
 
-def parse_generic_registry(registry_key: str, registry_name: str, detailed=False):
+
+def parse_generic_registry(
+    registry_key: str, registry_name: str, detailed=False, confirm=True
+):
     """
     Универсальная функция парсинга любого реестра
 
@@ -200,6 +272,11 @@ def parse_generic_registry(registry_key: str, registry_name: str, detailed=False
         registry_key: Ключ реестра из config.REGISTRIES
         registry_name: Название реестра для отображения
         detailed: Парсить ли детальные страницы
+        confirm: Запрашивать ли подтверждение детального парсинга
+            (False - неинтерактивный режим: ошибки пробрасываются)
+
+    Returns:
+        True, если записи собраны и экспортированы
     """
     logger = setup_logger("main")
 
@@ -208,105 +285,123 @@ def parse_generic_registry(registry_key: str, registry_name: str, detailed=False
     print("=" * 60)
 
     # Подтверждение пользователя
-    if detailed:
+    if detailed and confirm:
         print("\n⚠️  ВНИМАНИЕ: Детальный парсинг может занять продолжительное время!")
         choice = input("Продолжить? (y/n): ").lower()
         if choice != "y":
             print("Операция отменена.")
-            return
+            return False
 
     try:
         # Создание парсера
         parser = GenericRegistryParser(registry_key)
 
-        # Парсинг данных
+        # Парсинг данных с потоковым экспортом в Excel
         print("\n🔄 Начало парсинга...")
-        data = parser.parse_registry(detailed=detailed)
-
-        if not data:
-            print("\n❌ Не удалось получить данные из реестра.")
-            return
-
-        print(f"\n✅ Успешно собрано записей: {len(data)}")
-
-        # Экспорт в Excel
-        print("\n📊 Экспорт данных в Excel...")
         exporter = ExcelExporter()
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"{registry_key}_{timestamp}"
 
-        filepath = exporter.export_to_excel(
-            data=data,
-            filename=filename,
+        filepath = export_registry(
+            parser,
+            exporter,
+            detailed,
+            filename,
             sheet_name=registry_name[:30],  # Ограничение длины для Excel
         )
 
+        if not exporter.rows_exported:
+            print("\n❌ Не удалось получить данные из реестра.")
+            return False
+
+        print(f"\n✅ Успешно собрано записей: {exporter.rows_exported}")
+
         if filepath:
             print(f"\n✅ Данные успешно экспортированы!")
             print(f"📁 Файл: {os.path.abspath(filepath)}")
-            print(f"📊 Количество записей: {len(data)}")
-        else:
-            print("\n❌ Ошибка при экспорте данных.")
+            print(f"📊 Количество записей: {exporter.rows_exported}")
+            return True
+
+        print("\n❌ Ошибка при экспорте данных.")
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Операция прервана пользователем.")
     except Exception as e:
         logger.error(f"Ошибка при парсинге: {e}")
         print(f"\n❌ Произошла ошибка: {e}")
+        # Без подтверждений (cron) ошибка, в т.ч. CircuitOpenError при
+        # недоступности сайта, передается вызывающему коду
+        if not confirm:
+            raise
+
+    return False
 
 
-def parse_auditors(detailed=False):
-    """Парсинг реестра аудиторов"""
+def parse_auditors(detailed=False, confirm=True):
+    """
+    Парсинг реестра аудиторов
+
+    Args:
+        detailed: Парсить ли детальные страницы
+        confirm: Запрашивать ли подтверждение детального парсинга
+            (False - неинтерактивный режим: ошибки пробрасываются)
+
+    Returns:
+        True, если записи собраны и экспортированы
+    """
     logger = setup_logger("main")
 
     print("\n" + "=" * 60)
     print("ПАРСИНГ РЕЕСТРА АУДИТОРОВ")
     print("=" * 60)
 
-    if detailed:
+    if detailed and confirm:
         print("\n⚠️  ВНИМАНИЕ: Детальный парсинг может занять продолжительное время!")
         choice = input("Продолжить? (y/n): ").lower()
         if choice != "y":
             print("Операция отменена.")
-            return
+            return False
 
     try:
         parser = AuditorsParser()
-        print("\n🔄 Начало парсинга...")
-        auditors = parser.parse_to_objects(detailed=detailed)
-
-        if not auditors:
-            print("\n❌ Не удалось получить данные из реестра.")
-            return
 
-        print(f"\n✅ Успешно собрано записей: {len(auditors)}")
-
-        # Экспорт в Excel
-        print("\n📊 Экспорт данных в Excel...")
+        # Парсинг данных с потоковым экспортом в Excel
+        print("\n🔄 Начало парсинга...")
         exporter = ExcelExporter()
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"auditors_{timestamp}"
 
-        # Преобразуем в словари
-        data = [auditor.to_dict() for auditor in auditors]
-        filepath = exporter.export_to_excel(
-            data=data, filename=filename, sheet_name="Аудиторы"
+        filepath = export_registry(
+            parser, exporter, detailed, filename, sheet_name="Аудиторы"
         )
 
+        if not exporter.rows_exported:
+            print("\n❌ Не удалось получить данные из реестра.")
+            return False
+
+        print(f"\n✅ Успешно собрано записей: {exporter.rows_exported}")
+
         if filepath:
             print(f"\n✅ Данные успешно экспортированы!")
             print(f"📁 Файл: {os.path.abspath(filepath)}")
-            print(f"📊 Количество записей: {len(auditors)}")
-        else:
-            print("\n❌ Ошибка при экспорте данных.")
+            print(f"📊 Количество записей: {exporter.rows_exported}")
+            return True
+
+        print("\n❌ Ошибка при экспорте данных.")
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Операция прервана пользователем.")
     except Exception as e:
         logger.error(f"Ошибка при парсинге: {e}")
         print(f"\n❌ Произошла ошибка: {e}")
+        # Без подтверждений (cron) ошибка, в т.ч. CircuitOpenError при
+        # недоступности сайта, передается вызывающему коду
+        if not confirm:
+            raise
+
+    return False
 
 
 def not_implemented():
@@ -360,13 +455,239 @@ def main():
         input("\n⏸️  Нажмите Enter для возврата в меню...")
 
 
+def resolve_mode(mode: str):
+    """
+    Применение режима парсинга
+
+    Args:
+        mode: Режим парсинга (quick, full или incremental)
+
+    Returns:
+        Кортеж (детальный ли парсинг, название режима)
+    """
+    mode = mode.lower()
+    PARSER_CONFIG["incremental"] = mode == "incremental"
+    mode_str = {
+        "quick": "быстрый",
+        "full": "полный",
+        "incremental": "инкрементальный",
+    }[mode]
+    return mode in ("full", "incremental"), mode_str
+
+
+def resolve_registry_keys(registry_arg: str) -> List[str]:
+    """
+    Разбор аргумента --registry
+
+    Args:
+        registry_arg: Ключ реестра, список через запятую или "all"
+
+    Returns:
+        Список ключей реестров (без пробелов, в нижнем регистре)
+    """
+    if registry_arg.strip().lower() == "all":
+        return list(REGISTRIES)
+    return [key.strip().lower() for key in registry_arg.split(",") if key.strip()]
+
+
+def crawl_registry(
+    registry_key: str, detailed: bool, single_workbook: bool = False
+) -> Dict[str, Any]:
+    """
+    Неинтерактивный парсинг одного реестра с экспортом в Excel
+
+    Args:
+        registry_key: Ключ реестра из config.REGISTRIES
+        detailed: Парсить ли детальные страницы
+        single_workbook: Не создавать файл, а буферизовать записи листа
+            (SheetSpool в сводке) для общей книги
+
+    Returns:
+        Сводка: реестр, число записей, время, путь к файлу, ошибка
+        (и при single_workbook - название листа и SheetSpool)
+    """
+    logger = setup_logger("scheduler")
+    registry_name = REGISTRIES[registry_key]["name"]
+    started = time.monotonic()
+    summary = {
+        "registry": registry_key,
+        "records": 0,
+        "seconds": 0.0,
+        "filepath": None,
+        "error": None,
+    }
+
+    try:
+        if registry_key == "auditors":
+            parser = AuditorsParser()
+            sheet_name = "Аудиторы"
+        elif registry_key == "organizations":
+            parser = OrganizationsParser()
+            sheet_name = "Аудиторские организации"
+        else:
+            parser = GenericRegistryParser(registry_key)
+            sheet_name = registry_name[:30]
+
+        if single_workbook:
+            spool = summary["spool"] = SheetSpool()
+            summary["sheet_name"] = sheet_name
+            if parser.record_model is not None:
+                spool.extend_batches(parser.iter_batches(detailed=detailed))
+            else:
+                spool.extend(parser.iter_registry(detailed=detailed))
+            summary["records"] = spool.rows
+            if not spool.rows:
+                summary["error"] = "нет данных"
+        else:
+            exporter = ExcelExporter()
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            summary["filepath"] = export_registry(
+                parser, exporter, detailed, f"{registry_key}_{timestamp}", sheet_name
+            )
+            summary["records"] = exporter.rows_exported
+
+            if not summary["filepath"]:
+                summary["error"] = "нет данных или ошибка экспорта"
+
+    except Exception as e:
+        logger.error(f"Ошибка при парсинге {registry_key}: {e}")
+        summary["error"] = str(e)
+
+    summary["seconds"] = time.monotonic() - started
+    logger.info(
+        f"{registry_key}: записей {summary['records']}, "
+        f"{summary['seconds']:.1f} с"
+        + (f", ошибка: {summary['error']}" if summary["error"] else "")
+    )
+    return summary
+
+
+def run_all_mode(registry_keys: List[str], mode: str, max_parallel: int):
+    """
+    Парсинг нескольких реестров в одном процессе
+
+    Реестры обходятся параллельно, но не более max_parallel одновременно.
+    Все парсеры используют общую сессию (пул соединений) и общий
+    ограничитель частоты запросов. С EXPORT_CONFIG["single_workbook"]
+    записи реестров буферизуются на диске и в конце выгружаются листами
+    одной книги за одно сохранение. В конце выводится сводка.
+
+    Args:
+        registry_keys: Ключи реестров
+        mode: Режим парсинга (quick, full или incremental)
+        max_parallel: Максимум одновременно обходимых реестров
+    """
+    logger = setup_logger("cron")
+
+    unknown = [key for key in registry_keys if key not in REGISTRIES]
+    if unknown:
+        logger.error(f"Неизвестные реестры: {', '.join(unknown)}")
+        print(f"❌ Ошибка: Реестры не найдены: {', '.join(unknown)}")
+        print("Используйте --list для просмотра доступных реестров.")
+        sys.exit(1)
+
+    detailed, mode_str = resolve_mode(mode)
+    max_parallel = max(1, min(max_parallel, len(registry_keys)))
+
+    logger.info(
+        f"Запуск обхода {len(registry_keys)} реестров ({mode_str}), "
+        f"параллельно: {max_parallel}"
+    )
+    print(f"\n🤖 РЕЖИМ CRON: НЕСКОЛЬКО РЕЕСТРОВ")
+    print("=" * 60)
+    print(f"Реестров: {len(registry_keys)}")
+    print(f"Режим: {mode_str}")
+    print(f"Параллельно: {max_parallel}")
+    print("=" * 60 + "\n")
+
+    single_workbook = EXPORT_CONFIG["single_workbook"]
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        summaries = list(
+            executor.map(
+                lambda key: crawl_registry(key, detailed, single_workbook),
+                registry_keys,
+            )
+        )
+    workbook_path = None
+    if single_workbook:
+        workbook_path = export_single_workbook(summaries)
+    elapsed = time.monotonic() - started
+
+    print("\n" + "=" * 60)
+    print("СВОДКА")
+    print("=" * 60)
+    for summary in summaries:
+        status = "✅" if not summary["error"] else "❌"
+        print(
+            f"{status} {summary['registry']:<28} {summary['records']:>7} зап. "
+            f"{summary['seconds']:>8.1f} с"
+        )
+        if summary["error"]:
+            print(f"   Ошибка: {summary['error']}")
+    print("-" * 60)
+    total_records = sum(summary["records"] for summary in summaries)
+    failed = [summary for summary in summaries if summary["error"]]
+    print(f"Всего записей: {total_records}")
+    print(f"Суммарное время реестров: {sum(s['seconds'] for s in summaries):.1f} с")
+    print(f"Общее время: {elapsed:.1f} с")
+    if workbook_path:
+        print(f"Книга: {workbook_path}")
+    print(f"HTTP: {get_transport_stats().summary()}")
+    print("=" * 60)
+
+    logger.info(
+        f"Обход завершен: записей {total_records}, реестров с ошибками "
+        f"{len(failed)}, время {elapsed:.1f} с"
+    )
+    logger.info(f"HTTP: {get_transport_stats().summary()}")
+    sys.exit(1 if failed else 0)
+
+
+def export_single_workbook(summaries: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Выгрузка буферизованных реестров листами одной книги
+
+    Временные файлы листов удаляются после выгрузки. Если книгу не
+    удалось сохранить, ошибка записывается в сводки реестров.
+
+    Args:
+        summaries: Сводки crawl_registry(..., single_workbook=True)
+
+    Returns:
+        Путь к книге или None
+    """
+    exported = [
+        summary
+        for summary in summaries
+        if summary.get("spool") is not None and not summary["error"]
+    ]
+    exporter = ExcelExporter()
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    try:
+        filepath = exporter.export_spools(
+            [(summary["sheet_name"], summary["spool"]) for summary in exported],
+            filename=f"registries_{timestamp}",
+        )
+    finally:
+        for summary in summaries:
+            if summary.get("spool") is not None:
+                summary.pop("spool").close()
+
+    for summary in exported:
+        summary["filepath"] = filepath
+        if not filepath:
+            summary["error"] = "ошибка экспорта"
+    return filepath
+
+
 def run_cron_mode(registry_key: str, mode: str):
     """
     Запуск в режиме cron (неинтерактивный)
 
     Args:
         registry_key: Ключ реестра (auditors, organizations, и т.д.)
-        mode: Режим парсинга (quick или full)
+        mode: Режим парсинга (quick, full или incremental)
     """
     logger = setup_logger("cron")
 
@@ -378,8 +699,7 @@ def run_cron_mode(registry_key: str, mode: str):
         sys.exit(1)
 
     # Определение режима детализации
-    detailed = mode.lower() == "full"
-    mode_str = "полный" if detailed else "быстрый"
+    detailed, mode_str = resolve_mode(mode)
 
     registry_name = REGISTRIES[registry_key]["name"]
 
@@ -389,18 +709,30 @@ def run_cron_mode(registry_key: str, mode: str):
     print(f"Реестр: {registry_name}")
     print(f"Режим: {mode_str}")
     print(f"Детализация: {'Да' if detailed else 'Нет'}")
+    if ARCHIVE_CONFIG["replay_run_id"]:
+        print(f"Воспроизведение архива: {ARCHIVE_CONFIG['replay_run_id']}")
+    elif ARCHIVE_CONFIG["run_id"]:
+        print(f"Архив страниц: {ARCHIVE_CONFIG['run_id']}")
     print("=" * 60 + "\n")
 
     try:
         # Выбор парсера в зависимости от реестра
         if registry_key == "auditors":
-            parse_auditors(detailed=detailed)
+            success = parse_auditors(detailed=detailed, confirm=False)
         elif registry_key == "organizations":
-            parse_organizations(detailed=detailed)
+            success = parse_organizations(detailed=detailed, confirm=False)
         else:
-            parse_generic_registry(registry_key, registry_name, detailed=detailed)
+            success = parse_generic_registry(
+                registry_key, registry_name, detailed=detailed, confirm=False
+            )
+
+        if not success:
+            logger.error(f"Парсинг {registry_key}: нет данных или ошибка экспорта")
+            print("\n❌ Парсинг завершен без результата")
+            sys.exit(1)
 
         logger.info(f"Парсинг {registry_key} успешно завершен")
+        logger.info(f"HTTP: {get_transport_stats().summary()}")
         print("\n✅ Парсинг успешно завершен")
         sys.exit(0)
 
@@ -426,34 +758,207 @@ def parse_args():
   # Режим cron - полный парсинг организаций
   python main.py --registry organizations --mode full
 
+  # Полный парсинг аудиторов асинхронным движком
+  python main.py --registry auditors --mode full --engine async
+
+  # Все реестры в одном процессе (не более 4 одновременно)
+  python main.py --registry all --mode full --max-parallel 4
+
+  # Все реестры листами одной книги Excel
+  python main.py --registry all --mode quick --single-workbook
+
   # Список доступных реестров
   python main.py --list
         """,
     )
 
     parser.add_argument(
-        "-r", "--registry", type=str, help="Ключ реестра для парсинга (см. --list)"
+        "-r",
+        "--registry",
+        type=str,
+        help="Ключ реестра для парсинга (см. --list), список через запятую или all",
+    )
+
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=PARSER_CONFIG["max_parallel_registries"],
+        help="Максимум реестров, обходимых одновременно (для нескольких реестров)",
     )
 
     parser.add_argument(
         "-m",
         "--mode",
         type=str,
-        choices=["quick", "full"],
+        choices=["quick", "full", "incremental"],
         default="quick",
-        help="Режим парсинга: quick (быстрый) или full (полный)",
+        help="Режим парсинга: quick (быстрый), full (полный) или "
+        "incremental (полный, детальные страницы только для измененных строк)",
     )
 
     parser.add_argument(
         "-l", "--list", action="store_true", help="Показать список доступных реестров"
     )
 
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["sync", "async"],
+        default=PARSER_CONFIG["engine"],
+        help="Движок загрузки: sync (последовательный) или async (параллельный)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=PARSER_CONFIG["concurrent_requests_per_host"],
+        help="Число одновременных запросов к хосту для движка async",
+    )
+
+    parser.add_argument(
+        "--detail-workers",
+        type=int,
+        default=PARSER_CONFIG["detail_workers"],
+        help="Число потоков загрузки детальных страниц (движок sync)",
+    )
+
+    parser.add_argument(
+        "--list-backend",
+        type=str,
+        choices=["lxml", "bs4"],
+        default=PARSER_CONFIG["list_backend"],
+        help="Извлечение таблиц списочных страниц: lxml (быстро) или bs4",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Разбирать страницы пагинации по мере загрузки (движок sync, без кэша и архива)",
+    )
+
+
+    parser.add_argument(
+        "--full-dom",
+        action="store_true",
+        help="Строить дерево всей страницы (без частичного разбора)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=PARSER_CONFIG["parse_workers"],
+        help="Число процессов разбора детальных страниц (0 - в основном процессе)",
+    )
+
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=PARSER_CONFIG["prefetch_pages"],
+        help="Число страниц пагинации, загружаемых заранее (0 - выключено)",
+    )
+
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=PARSER_CONFIG["requests_per_second"],
+        help="Средняя частота запросов в секунду на процесс (0 - без ограничения)",
+    )
+
+    parser.add_argument(
+        "--on-outage",
+        type=str,
+        choices=["fail", "pause"],
+        default=PARSER_CONFIG["breaker_mode"],
+        help="Поведение при недоступности хоста: fail - прервать обход, "
+        "pause - ждать восстановления",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Продолжить прерванный полный обход с контрольной точки",
+    )
+
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Сохранять исходные страницы в архив для повторного разбора",
+    )
+
+    parser.add_argument(
+        "--replay",
+        type=str,
+        metavar="RUN_ID",
+        help="Разобрать страницы сохраненного запуска без обращения к сети",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=CACHE_CONFIG["cache_dir"],
+        help="Директория дискового кэша HTTP-ответов",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Не использовать дисковый кэш HTTP-ответов",
+    )
+
+    parser.add_argument(
+        "--single-workbook",
+        action="store_true",
+        help="Для нескольких реестров: выгрузить все листами одной книги Excel",
+    )
+
+    parser.add_argument(
+        "--batch-in-memory",
+        action="store_true",
+        help="Выгружать аудиторов и организации одним пакетом в памяти "
+        "(без временного файла; память растет с размером реестра)",
+    )
+
     return parser.parse_args()
 
 
+def apply_parser_options(args):
+    """
+    Перенос параметров командной строки в настройки config
+
+    Args:
+        args: Результат parse_args()
+    """
+    PARSER_CONFIG["engine"] = args.engine
+    PARSER_CONFIG["concurrent_requests_per_host"] = max(1, args.concurrency)
+    PARSER_CONFIG["detail_workers"] = max(1, args.detail_workers)
+    PARSER_CONFIG["parse_workers"] = max(0, args.parse_workers)
+    PARSER_CONFIG["list_backend"] = args.list_backend
+    PARSER_CONFIG["partial_parse"] = not args.full_dom
+    PARSER_CONFIG["stream_pages"] = args.stream
+    PARSER_CONFIG["prefetch_pages"] = max(0, args.prefetch)
+    PARSER_CONFIG["requests_per_second"] = max(0.0, args.rps)
+    PARSER_CONFIG["breaker_mode"] = args.on_outage
+    PARSER_CONFIG["resume"] = args.resume
+    CACHE_CONFIG["cache_dir"] = args.cache_dir
+    CACHE_CONFIG["enabled"] = not args.no_cache
+    EXPORT_CONFIG["single_workbook"] = args.single_workbook
+    EXPORT_CONFIG["batch_in_memory"] = args.batch_in_memory
+
+    if args.replay:
+        runs = HtmlArchive.list_runs()
+        if args.replay not in runs:
+            print(f"❌ Ошибка: Запуск '{args.replay}' не найден в архиве.")
+            print(f"Доступные запуски: {', '.join(runs) if runs else 'нет'}")
+            sys.exit(1)
+        ARCHIVE_CONFIG["replay_run_id"] = args.replay
+    elif args.archive:
+        ARCHIVE_CONFIG["run_id"] = datetime.now().strftime(EXPORT_CONFIG["date_format"])
+
+
 if __name__ == "__main__":
     try:
         args = parse_args()
+        apply_parser_options(args)
 
         # Режим показа списка реестров
         if args.list:
@@ -462,7 +967,14 @@ if __name__ == "__main__":
 
         # Режим cron (неинтерактивный)
         if args.registry:
-            run_cron_mode(args.registry, args.mode)
+            registry_keys = resolve_registry_keys(args.registry)
+            if len(registry_keys) > 1 or args.registry.strip().lower() == "all":
+                run_all_mode(registry_keys, args.mode, args.max_parallel)
+            else:
+                # Пустой список (например, ",") - реестр не найден в run_cron_mode
+                run_cron_mode(
+                    registry_keys[0] if registry_keys else args.registry, args.mode
+                )
 
         # Интерактивный режим (по умолчанию)
         else:
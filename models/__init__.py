@@ -8,6 +8,14 @@ from .certificate import Certificate
 from .training_center import TrainingCenter
 from .disciplinary_action import DisciplinaryAction
 from .audit_network import AuditNetwork
+from .compact import (
+    CompactOrganization,
+    CompactAuditor,
+    CompactCertificate,
+    CompactTrainingCenter,
+    CompactDisciplinaryAction,
+    CompactAuditNetwork,
+)
 
 __all__ = [
     "Organization",
@@ -16,4 +24,10 @@ __all__ = [
     "TrainingCenter",
     "DisciplinaryAction",
     "AuditNetwork",
+    "CompactOrganization",
+    "CompactAuditor",
+    "CompactCertificate",
+    "CompactTrainingCenter",
+    "CompactDisciplinaryAction",
+    "CompactAuditNetwork",
 ]
@@ -3,14 +3,43 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, ClassVar
 from datetime import datetime
 
 
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "name": "Название сети",
+    "network_type": "Тип",
+    "registration_number": "Регистрационный номер",
+    "member_count": "Количество участников",
+    "member_organizations": "Участники",
+    "country": "Страна",
+    "headquarters": "Штаб-квартира",
+    "website": "Сайт",
+    "description": "Описание",
+    "contact_person": "Контактное лицо",
+    "phone": "Телефон",
+    "email": "Email",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "member_count": "int",
+    "parsed_at": "datetime",
+}
+
+
 @dataclass
 class AuditNetwork:
     """Модель сети аудиторских организаций"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     name: str
     network_type: str  # "Российская" или "Международная"
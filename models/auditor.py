@@ -3,14 +3,56 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, ClassVar
 from datetime import datetime
 
+from .formatting import format_date
+
+
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "full_name": "ФИО",
+    "ornz": "ОРНЗ",
+    "certificate_number": "Номер аттестата",
+    "region": "Регион",
+    "status": "Статус",
+    "inn": "ИНН",
+    "snils": "СНИЛС",
+    "qualification": "Квалификация",
+    "organization_name": "Организация",
+    "organization_inn": "ИНН организации",
+    "certificate_issue_date": "Дата выдачи аттестата",
+    "membership_start_date": "Дата начала членства",
+    "membership_end_date": "Дата окончания членства",
+    "education": "Образование",
+    "experience_years": "Стаж (лет)",
+    "specializations": "Специализации",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "ornz": "digits",
+    "inn": "digits",
+    "snils": "digits",
+    "organization_inn": "digits",
+    "certificate_issue_date": "date",
+    "membership_start_date": "date",
+    "membership_end_date": "date",
+    "experience_years": "int",
+    "parsed_at": "datetime",
+}
+
 
 @dataclass
 class Auditor:
     """Модель аудитора или индивидуального аудитора"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     full_name: str
     ornz: str  # Основной регистрационный номер записи
@@ -54,21 +96,9 @@ class Auditor:
             "Квалификация": self.qualification or "",
             "Организация": self.organization_name or "",
             "ИНН организации": self.organization_inn or "",
-            "Дата выдачи аттестата": (
-                self.certificate_issue_date.strftime("%d.%m.%Y")
-                if self.certificate_issue_date
-                else ""
-            ),
-            "Дата начала членства": (
-                self.membership_start_date.strftime("%d.%m.%Y")
-                if self.membership_start_date
-                else ""
-            ),
-            "Дата окончания членства": (
-                self.membership_end_date.strftime("%d.%m.%Y")
-                if self.membership_end_date
-                else ""
-            ),
+            "Дата выдачи аттестата": format_date(self.certificate_issue_date),
+            "Дата начала членства": format_date(self.membership_start_date),
+            "Дата окончания членства": format_date(self.membership_end_date),
             "Образование": self.education or "",
             "Стаж (лет)": self.experience_years or "",
             "Специализации": ", ".join(self.specializations),
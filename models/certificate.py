@@ -3,14 +3,47 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import Optional, Dict, ClassVar
 from datetime import datetime
 
+from .formatting import format_date
+
+
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "certificate_number": "Номер аттестата",
+    "auditor_full_name": "ФИО аудитора",
+    "issue_date": "Дата выдачи",
+    "status": "Статус",
+    "qualification_type": "Тип квалификации",
+    "issuer": "Выдан",
+    "validity_period": "Срок действия",
+    "auditor_inn": "ИНН аудитора",
+    "auditor_snils": "СНИЛС аудитора",
+    "cancellation_reason": "Причина аннулирования",
+    "cancellation_date": "Дата аннулирования",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "issue_date": "date",
+    "auditor_inn": "digits",
+    "auditor_snils": "digits",
+    "cancellation_date": "date",
+    "parsed_at": "datetime",
+}
+
 
 @dataclass
 class Certificate:
     """Модель квалификационного аттестата аудитора"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     certificate_number: str
     auditor_full_name: str
@@ -39,9 +72,7 @@ class Certificate:
         return {
             "Номер аттестата": self.certificate_number,
             "ФИО аудитора": self.auditor_full_name,
-            "Дата выдачи": (
-                self.issue_date.strftime("%d.%m.%Y") if self.issue_date else ""
-            ),
+            "Дата выдачи": format_date(self.issue_date),
             "Статус": self.status,
             "Тип квалификации": self.qualification_type or "",
             "Выдан": self.issuer or "",
@@ -49,11 +80,7 @@ class Certificate:
             "ИНН аудитора": self.auditor_inn or "",
             "СНИЛС аудитора": self.auditor_snils or "",
             "Причина аннулирования": self.cancellation_reason or "",
-            "Дата аннулирования": (
-                self.cancellation_date.strftime("%d.%m.%Y")
-                if self.cancellation_date
-                else ""
-            ),
+            "Дата аннулирования": format_date(self.cancellation_date),
             "URL источника": self.source_url or "",
             "Дата сбора данных": self.parsed_at.strftime("%d.%m.%Y %H:%M:%S"),
         }
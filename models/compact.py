@@ -0,0 +1,112 @@
+"""
+Компактные варианты моделей данных
+
+Классы CompactAuditor, CompactOrganization и т.д. повторяют поля и
+to_dict() обычных моделей, но:
+    - хранят поля в __slots__ (без __dict__ у каждого экземпляра);
+    - интернируют категориальные строки (регион, статус, ...), так что
+      одинаковые значения всех записей - один объект str;
+    - используют общую для обхода метку parsed_at вместо собственного
+      datetime у каждой записи: parsed_at обязателен, его передает
+      фабрика записей парсера (iter_objects(compact=True)).
+
+Предназначены для полных снимков реестров в памяти.
+"""
+
+import sys
+from dataclasses import fields
+from typing import Dict, Tuple
+
+from .audit_network import AuditNetwork
+from .auditor import Auditor
+from .certificate import Certificate
+from .disciplinary_action import DisciplinaryAction
+from .organization import Organization
+from .training_center import TrainingCenter
+
+# Категориальные поля моделей: немного различных значений на весь реестр
+CATEGORICAL_FIELDS: Dict[type, Tuple[str, ...]] = {
+    Auditor: (
+        "region",
+        "status",
+        "qualification",
+        "education",
+        "organization_name",
+        "organization_inn",
+    ),
+    Organization: ("region", "status"),
+    Certificate: ("status", "qualification_type", "issuer", "validity_period"),
+    DisciplinaryAction: (
+        "subject_type",
+        "action_type",
+        "region",
+        "decision_body",
+        "appeal_status",
+    ),
+    TrainingCenter: ("region", "status"),
+    AuditNetwork: ("network_type", "country"),
+}
+
+
+def _compact(model: type) -> type:
+    """
+    Слотовый класс с полями и методами модели-dataclass
+
+    Args:
+        model: Класс модели из models/
+
+    Returns:
+        Новый класс Compact<Имя модели>
+    """
+    names = tuple(f.name for f in fields(model))
+    categorical = CATEGORICAL_FIELDS.get(model, ())
+    parsed_at_index = names.index("parsed_at")
+
+    # Как dataclass(slots=True) в Python 3.10+: класс создается заново,
+    # значения полей по умолчанию перестают быть атрибутами класса
+    namespace = {
+        key: value
+        for key, value in model.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+
+    init = model.__init__
+
+    def __init__(self, *args, **kwargs):
+        if len(args) <= parsed_at_index and "parsed_at" not in kwargs:
+            raise TypeError(
+                f"{type(self).__name__}: не передан обязательный аргумент parsed_at"
+            )
+        init(self, *args, **kwargs)
+        for name in categorical:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+    __init__.__doc__ = init.__doc__
+    namespace["__init__"] = __init__
+
+    name = f"Compact{model.__name__}"
+    namespace["__qualname__"] = name
+    namespace["__module__"] = __name__
+    namespace["__doc__"] = f"{model.__doc__} (компактное представление)"
+    return type(model)(name, model.__bases__, namespace)
+
+
+CompactAuditor = _compact(Auditor)
+CompactOrganization = _compact(Organization)
+CompactCertificate = _compact(Certificate)
+CompactDisciplinaryAction = _compact(DisciplinaryAction)
+CompactTrainingCenter = _compact(TrainingCenter)
+CompactAuditNetwork = _compact(AuditNetwork)
+
+COMPACT_MODELS: Dict[type, type] = {
+    Auditor: CompactAuditor,
+    Organization: CompactOrganization,
+    Certificate: CompactCertificate,
+    DisciplinaryAction: CompactDisciplinaryAction,
+    TrainingCenter: CompactTrainingCenter,
+    AuditNetwork: CompactAuditNetwork,
+}
+
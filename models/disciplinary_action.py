@@ -3,14 +3,50 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import Optional, Dict, ClassVar
 from datetime import datetime
 
+from .formatting import format_date
+
+
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "subject_name": "Субъект",
+    "subject_type": "Тип субъекта",
+    "ornz": "ОРНЗ",
+    "action_type": "Мера воздействия",
+    "violation_description": "Описание нарушения",
+    "decision_date": "Дата решения",
+    "decision_number": "Номер решения",
+    "inn": "ИНН",
+    "region": "Регион",
+    "effective_date": "Дата вступления в силу",
+    "expiry_date": "Дата окончания",
+    "decision_body": "Орган принявший решение",
+    "appeal_status": "Статус обжалования",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "ornz": "digits",
+    "decision_date": "date",
+    "inn": "digits",
+    "effective_date": "date",
+    "expiry_date": "date",
+    "parsed_at": "datetime",
+}
+
 
 @dataclass
 class DisciplinaryAction:
     """Модель меры дисциплинарного воздействия"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     subject_name: str  # ФИО аудитора или название организации
     subject_type: str  # "auditor" или "organization"
@@ -46,18 +82,12 @@ class DisciplinaryAction:
             "ОРНЗ": self.ornz,
             "Мера воздействия": self.action_type,
             "Описание нарушения": self.violation_description,
-            "Дата решения": (
-                self.decision_date.strftime("%d.%m.%Y") if self.decision_date else ""
-            ),
+            "Дата решения": format_date(self.decision_date),
             "Номер решения": self.decision_number or "",
             "ИНН": self.inn or "",
             "Регион": self.region or "",
-            "Дата вступления в силу": (
-                self.effective_date.strftime("%d.%m.%Y") if self.effective_date else ""
-            ),
-            "Дата окончания": (
-                self.expiry_date.strftime("%d.%m.%Y") if self.expiry_date else ""
-            ),
+            "Дата вступления в силу": format_date(self.effective_date),
+            "Дата окончания": format_date(self.expiry_date),
             "Орган принявший решение": self.decision_body or "",
             "Статус обжалования": self.appeal_status or "",
             "URL источника": self.source_url or "",
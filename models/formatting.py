@@ -0,0 +1,26 @@
+"""
+Форматирование значений моделей для экспорта
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+
+
+def format_date(
+    value: Optional[Union[datetime, str]], date_format: str = "%d.%m.%Y"
+) -> str:
+    """
+    Дата для выгрузки
+
+    Args:
+        value: Дата, исходный текст реестра (не распознанный как дата) или None
+        date_format: Формат даты
+
+    Returns:
+        Дата в формате date_format, текст как есть или "" для пустого значения
+    """
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return value.strftime(date_format)
@@ -3,14 +3,59 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, ClassVar
 from datetime import datetime
 
+from .formatting import format_date
+
+
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "name": "Наименование",
+    "full_name": "Полное наименование",
+    "ornz": "ОРНЗ",
+    "inn": "ИНН",
+    "kpp": "КПП",
+    "ogrn": "ОГРН",
+    "region": "Регион",
+    "status": "Статус",
+    "address": "Адрес",
+    "phone": "Телефон",
+    "email": "Email",
+    "website": "Сайт",
+    "director": "Руководитель",
+    "registration_date": "Дата регистрации",
+    "membership_start_date": "Дата начала членства",
+    "membership_end_date": "Дата окончания членства",
+    "auditors_count": "Количество аудиторов",
+    "certificates": "Сертификаты",
+    "networks": "Сети",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "ornz": "digits",
+    "inn": "digits",
+    "kpp": "digits",
+    "ogrn": "digits",
+    "registration_date": "date",
+    "membership_start_date": "date",
+    "membership_end_date": "date",
+    "auditors_count": "int",
+    "parsed_at": "datetime",
+}
+
 
 @dataclass
 class Organization:
     """Модель аудиторской организации"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     name: str
     ornz: str  # Основной регистрационный номер записи
@@ -58,21 +103,9 @@ class Organization:
             "Email": self.email or "",
             "Сайт": self.website or "",
             "Руководитель": self.director or "",
-            "Дата регистрации": (
-                self.registration_date.strftime("%d.%m.%Y")
-                if self.registration_date
-                else ""
-            ),
-            "Дата начала членства": (
-                self.membership_start_date.strftime("%d.%m.%Y")
-                if self.membership_start_date
-                else ""
-            ),
-            "Дата окончания членства": (
-                self.membership_end_date.strftime("%d.%m.%Y")
-                if self.membership_end_date
-                else ""
-            ),
+            "Дата регистрации": format_date(self.registration_date),
+            "Дата начала членства": format_date(self.membership_start_date),
+            "Дата окончания членства": format_date(self.membership_end_date),
             "Количество аудиторов": self.auditors_count or "",
             "Сертификаты": ", ".join(self.certificates),
             "Сети": ", ".join(self.networks),
@@ -3,14 +3,57 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, ClassVar
 from datetime import datetime
 
+from .formatting import format_date
+
+
+# Поля модели и названия колонок при экспорте (в порядке to_dict)
+EXPORT_COLUMNS: Dict[str, str] = {
+    "name": "Наименование",
+    "full_name": "Полное наименование",
+    "registration_number": "Регистрационный номер",
+    "inn": "ИНН",
+    "kpp": "КПП",
+    "ogrn": "ОГРН",
+    "region": "Регион",
+    "status": "Статус",
+    "address": "Адрес",
+    "phone": "Телефон",
+    "email": "Email",
+    "website": "Сайт",
+    "director": "Руководитель",
+    "accreditation_date": "Дата аккредитации",
+    "accreditation_number": "Номер аккредитации",
+    "programs": "Программы",
+    "registration_date": "Дата регистрации",
+    "exclusion_date": "Дата исключения",
+    "exclusion_reason": "Причина исключения",
+    "source_url": "URL источника",
+    "parsed_at": "Дата сбора данных",
+}
+
+
+# Типы полей для приведения значений из реестра (utils.normalizer)
+FIELD_TYPES: Dict[str, str] = {
+    "inn": "digits",
+    "ogrn": "digits",
+    "kpp": "digits",
+    "accreditation_date": "date",
+    "registration_date": "date",
+    "exclusion_date": "date",
+    "parsed_at": "datetime",
+}
+
 
 @dataclass
 class TrainingCenter:
     """Модель учебно-методического центра (УМЦ)"""
 
+    export_columns: ClassVar[Dict[str, str]] = EXPORT_COLUMNS
+    field_types: ClassVar[Dict[str, str]] = FIELD_TYPES
+
     # Основная информация
     name: str
     registration_number: str
@@ -58,21 +101,11 @@ class TrainingCenter:
             "Email": self.email or "",
             "Сайт": self.website or "",
             "Руководитель": self.director or "",
-            "Дата аккредитации": (
-                self.accreditation_date.strftime("%d.%m.%Y")
-                if self.accreditation_date
-                else ""
-            ),
+            "Дата аккредитации": format_date(self.accreditation_date),
             "Номер аккредитации": self.accreditation_number or "",
             "Программы": ", ".join(self.programs),
-            "Дата регистрации": (
-                self.registration_date.strftime("%d.%m.%Y")
-                if self.registration_date
-                else ""
-            ),
-            "Дата исключения": (
-                self.exclusion_date.strftime("%d.%m.%Y") if self.exclusion_date else ""
-            ),
+            "Дата регистрации": format_date(self.registration_date),
+            "Дата исключения": format_date(self.exclusion_date),
             "Причина исключения": self.exclusion_reason or "",
             "URL источника": self.source_url or "",
             "Дата сбора данных": self.parsed_at.strftime("%d.%m.%Y %H:%M:%S"),
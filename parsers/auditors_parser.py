@@ -2,15 +2,32 @@
 Парсер реестра аудиторов и индивидуальных аудиторов
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-import re
+import requests
 
 from parsers.base_parser import BaseParser
+from parsers.fast_extract import ListTable, extract_table_soup
+from parsers.field_spec import FieldRule, FieldSpec, first_int
 from models.auditor import Auditor
 from config import BASE_URL
 
+# Поля детальной страницы аудитора (первое подошедшее правило)
+FIELD_SPEC = FieldSpec(
+    [
+        FieldRule("organization_inn", ("организац+инн",)),
+        FieldRule("inn", ("инн",)),
+        FieldRule("snils", ("снилс",)),
+        FieldRule("qualification", ("квалификация",)),
+        FieldRule(
+            "organization_name", ("организац+назван", "организац+наименован")
+        ),
+        FieldRule("education", ("образован",)),
+        FieldRule("experience_years", ("стаж",), first_int),
+    ]
+)
+
 
 class AuditorsParser(BaseParser):
     """
@@ -18,11 +35,20 @@ class AuditorsParser(BaseParser):
     https://sroaas.ru/reestr/auditory/
     """
 
-    def __init__(self):
+    field_spec = FIELD_SPEC
+    record_model = Auditor
+    list_columns = ("full_name", "ornz", "certificate_number", "region", "status")
+    list_min_cells = 4
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: Сессия requests (по умолчанию общая для процесса)
+        """
         from config import REGISTRIES
 
         registry = REGISTRIES["auditors"]
-        super().__init__(registry["url"], registry["name"])
+        super().__init__(registry["url"], registry["name"], "auditors", session)
 
     def parse_list_page(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
@@ -31,60 +57,44 @@ class AuditorsParser(BaseParser):
         Args:
             soup: Parsed HTML страницы
 
+        Returns:
+            Список словарей с данными аудиторов
+        """
+        return self.items_from_table(extract_table_soup(soup))
+
+    def items_from_table(self, table: Optional[ListTable]) -> List[Dict[str, Any]]:
+        """
+        Построение записей аудиторов из таблицы списочной страницы
+
+        Args:
+            table: Таблица страницы или None, если она не найдена
+
         Returns:
             Список словарей с данными аудиторов
         """
         auditors = []
 
-        # Поиск таблицы с данными
-        table = soup.find("table")
-        if not table:
+        if table is None:
             self.logger.warning("Таблица с данными не найдена на странице")
             return auditors
 
-        # Парсинг строк таблицы
-        rows = table.find_all("tr")[1:]  # Пропускаем заголовок
+        batch = self.column_batch(table)
+        full_names, ornzs, certificate_numbers, regions, statuses = batch.columns
 
-        for row in rows:
-            try:
-                cols = row.find_all("td")
-                if len(cols) < 4:
-                    continue
-
-                # Извлечение данных
-                full_name = cols[0].get_text(strip=True)
-                ornz = cols[1].get_text(strip=True)
-                certificate_number = cols[2].get_text(strip=True)
-                region = cols[3].get_text(strip=True)
-
-                # Статус (если есть)
-                status = cols[4].get_text(strip=True) if len(cols) > 4 else None
-
-                # URL детальной страницы
-                detail_url = None
-                link = row.find("a")
-                if link:
-                    href = link.get("href")
-                    # Проверяем, что href - строка, а не список
-                    if isinstance(href, list):
-                        href = href[0] if href else None
-                    if href:
-                        detail_url = urljoin(BASE_URL, href)
-
-                auditor_data = {
+        for full_name, ornz, certificate_number, region, status, href in zip(
+            full_names, ornzs, certificate_numbers, regions, statuses, batch.hrefs
+        ):
+            auditors.append(
+                {
                     "full_name": full_name,
                     "ornz": ornz,
                     "certificate_number": certificate_number,
                     "region": region,
                     "status": status,
-                    "detail_url": detail_url,
+                    # URL детальной страницы
+                    "detail_url": urljoin(BASE_URL, href) if href else None,
                 }
-
-                auditors.append(auditor_data)
-
-            except Exception as e:
-                self.logger.error(f"Ошибка при парсинге строки таблицы: {e}")
-                continue
+            )
 
         return auditors
 
@@ -109,25 +119,9 @@ class AuditorsParser(BaseParser):
                 values = block.find_all(["dd", "div"], class_=["value", "info-value"])
 
                 for label, value in zip(labels, values):
-                    key = label.get_text(strip=True).lower()
-                    val = value.get_text(strip=True)
-
-                    if "инн" in key:
-                        detail_data["inn"] = val
-                    elif "снилс" in key:
-                        detail_data["snils"] = val
-                    elif "квалификация" in key:
-                        detail_data["qualification"] = val
-                    elif "организация" in key and "название" in key:
-                        detail_data["organization_name"] = val
-                    elif "организация" in key and "инн" in key:
-                        detail_data["organization_inn"] = val
-                    elif "образование" in key:
-                        detail_data["education"] = val
-                    elif "стаж" in key:
-                        match = re.search(r"\d+", val)
-                        if match:
-                            detail_data["experience_years"] = int(match.group())
+                    self.field_spec.apply(
+                        label.get_text(strip=True), value.get_text(strip=True), detail_data
+                    )
 
             detail_data["source_url"] = url
 
@@ -136,22 +130,40 @@ class AuditorsParser(BaseParser):
 
         return detail_data
 
-    def parse_to_objects(self, detailed: bool = False) -> List[Auditor]:
+    def parse_to_objects(
+        self, detailed: bool = False, compact: bool = False
+    ) -> List[Auditor]:
         """
         Парсинг реестра с преобразованием в объекты Auditor
 
         Args:
             detailed: Парсить ли детальные страницы
+            compact: Компактные записи (models/compact.py: __slots__, общие
+                строки и метка времени обхода)
 
         Returns:
             Список объектов Auditor
         """
-        data = self.parse_registry(detailed=detailed)
-        auditors = []
+        return list(self.iter_objects(detailed=detailed, compact=compact))
+
+    def iter_objects(
+        self, detailed: bool = False, compact: bool = False
+    ) -> Iterator[Auditor]:
+        """
+        Потоковый парсинг реестра с преобразованием в объекты Auditor
 
-        for item in data:
+        Args:
+            detailed: Парсить ли детальные страницы
+            compact: Компактные записи (models/compact.py: __slots__, общие
+                строки и метка времени обхода)
+
+        Yields:
+            Объекты Auditor в порядке реестра
+        """
+        model = self._record_model(Auditor, compact)
+        for item in self.iter_typed_records(detailed=detailed):
             try:
-                auditor = Auditor(
+                yield model(
                     full_name=item.get("full_name", ""),
                     ornz=item.get("ornz", ""),
                     certificate_number=item.get("certificate_number", ""),
@@ -162,13 +174,13 @@ class AuditorsParser(BaseParser):
                     qualification=item.get("qualification"),
                     organization_name=item.get("organization_name"),
                     organization_inn=item.get("organization_inn"),
+                    certificate_issue_date=item.get("certificate_issue_date"),
+                    membership_start_date=item.get("membership_start_date"),
+                    membership_end_date=item.get("membership_end_date"),
                     education=item.get("education"),
                     experience_years=item.get("experience_years"),
                     source_url=item.get("source_url"),
                 )
-                auditors.append(auditor)
             except Exception as e:
                 self.logger.error(f"Ошибка при создании объекта Auditor: {e}")
                 continue
-
-        return auditors
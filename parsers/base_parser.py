@@ -2,16 +2,46 @@
 Базовый парсер для реестров СРО ААС
 """
 
+import asyncio
+import queue
+import threading
 import requests
 import time
 import re
+import aiohttp
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import deque
+from functools import partial
+from typing import List, Optional, Dict, Any, Tuple, Iterator, AsyncIterator, Callable
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 from config import PARSER_CONFIG, BASE_URL
 from utils.logger import setup_logger
+from models.compact import COMPACT_MODELS
+from utils.rate_limiter import get_rate_limiter, parse_retry_after
+from utils.http_cache import get_http_cache
+from utils.archive import get_archive, get_replay_archive
+from utils.state_store import CrawlStateStore
+from utils.checkpoint import CrawlCheckpoint
+from utils.record_batch import RecordBatch
+from utils.normalizer import normalize_batch, normalize_records
+from utils.transport import get_session, create_async_session
+from parsers.fast_extract import ListTable, extract_table_lxml, extract_table_stream
+from parsers.column_schema import ColumnBatch, ColumnSchema
+from parsers.parse_profiles import PARSE_PROFILES
+from parsers.parse_pool import create_parse_pool, parse_html, parser_path
+from utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+    get_circuit_breaker,
+)
+
+# Коды ответа, которыми сервер просит снизить частоту запросов
+THROTTLE_STATUS_CODES = (429, 503)
 
 
 class BaseParser(ABC):
@@ -19,28 +49,122 @@ class BaseParser(ABC):
     Базовый класс для парсеров реестров СРО ААС
     """
 
-    def __init__(self, registry_url: str, registry_name: str):
+    # Профили частичного разбора страниц; парсер, которому нужны другие
+    # части страницы, переопределяет словарь
+    parse_profiles = PARSE_PROFILES
+
+    # Поля списочной таблицы по позициям колонок (None - имена из заголовка)
+    # и минимум ячеек в строке записи
+    list_columns: Optional[Tuple[str, ...]] = None
+    list_min_cells = 1
+
+    # Построение записей из таблицы списочной страницы: метод
+    # items_from_table(table: Optional[ListTable]) -> List[Dict[str, Any]].
+    # Парсеры, задающие его, поддерживают быстрое извлечение таблицы через
+    # lxml (parse_list_html); parse_list_page при этом должен давать тот же
+    # результат для extract_table_soup(soup). None - только parse_list_page
+    items_from_table: Optional[Callable[..., List[Dict[str, Any]]]] = None
+
+    # Модель записей реестра: поля и названия колонок RecordBatch
+    # (None - поля берутся из самих записей)
+    record_model: Optional[type] = None
+
+    def __init__(
+        self,
+        registry_url: str,
+        registry_name: str,
+        registry_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Инициализация парсера
 
         Args:
             registry_url: URL реестра
             registry_name: Название реестра
+            registry_key: Ключ реестра из config.REGISTRIES
+            session: Сессия requests (по умолчанию общая для процесса)
         """
         self.registry_url = registry_url
         self.registry_name = registry_name
+        self.registry_key = registry_key or self.__class__.__name__
         self.logger = setup_logger(f"{self.__class__.__name__}")
 
-        # Настройки сессии
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": PARSER_CONFIG["user_agent"]})
+        # Общая для процесса сессия (единый пул соединений)
+        self.session = session or get_session()
 
         self.timeout = PARSER_CONFIG["timeout"]
         self.delay = PARSER_CONFIG["delay_between_requests"]
         self.max_retries = PARSER_CONFIG["max_retries"]
+        self.max_retry_after = PARSER_CONFIG.get("max_retry_after", 300)
+        self.backoff_max = PARSER_CONFIG.get("backoff_max", 60)
+        self.breaker_mode = PARSER_CONFIG.get("breaker_mode", "fail")
+
+        # Общий для процесса ограничитель частоты запросов
+        self.rate_limiter = get_rate_limiter()
+
+        # Воспроизведение архива без сети либо архивирование текущего запуска
+        self.replay = get_replay_archive()
+        self.archive = get_archive()
+
+        # Дисковый кэш ответов (None, если отключен или идет воспроизведение)
+        self.cache = get_http_cache() if self.replay is None else None
+
+        # Настройки асинхронного движка
+        self.engine = PARSER_CONFIG.get("engine", "sync")
+        self.concurrency_per_host = PARSER_CONFIG.get(
+            "concurrent_requests_per_host", 4
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # Пул потоков для детальных страниц
+        self.detail_workers = max(1, PARSER_CONFIG.get("detail_workers", 1))
+
+        # Частичный разбор: в дерево попадают только таблица/пагинация и
+        # информационные блоки детальных страниц
+        self.partial_parse = PARSER_CONFIG.get("partial_parse", True)
+
+        # Извлечение таблицы списочных страниц: lxml (быстро) или bs4
+        self.list_backend = PARSER_CONFIG.get("list_backend", "lxml")
+        self._column_schema: Optional[ColumnSchema] = None
+
+        # Потоковый разбор страниц пагинации по мере загрузки тела ответа
+        self.stream_pages = PARSER_CONFIG.get("stream_pages", False)
+        self.stream_chunk_size = PARSER_CONFIG.get("stream_chunk_size", 64 * 1024)
+
+        # Пул процессов для разбора детальных страниц (0/1 - в текущем процессе)
+        self.parse_workers = max(0, PARSER_CONFIG.get("parse_workers", 0))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Глубина предзагрузки страниц пагинации (0 - без предзагрузки)
+        self.prefetch_pages = max(0, PARSER_CONFIG.get("prefetch_pages", 0))
+
+        # Инкрементальный режим: детальные страницы только для новых/измененных строк
+        self.incremental = PARSER_CONFIG.get("incremental", False)
+        self.state_store: Optional[CrawlStateStore] = None
+
+        # Контрольные точки полного обхода (--resume продолжает прерванный обход)
+        self.resume = PARSER_CONFIG.get("resume", False)
+        self.checkpoint: Optional[CrawlCheckpoint] = None
+
+        # Метка parsed_at компактных записей последнего обхода
+        self.run_timestamp: Optional[datetime] = None
+
+    @classmethod
+    def from_registry_key(cls, registry_key: str) -> "BaseParser":
+        """
+        Создание парсера по ключу реестра (используется воркерами разбора)
+
+        Args:
+            registry_key: Ключ реестра из config.REGISTRIES
+
+        Returns:
+            Экземпляр парсера
+        """
+        return cls()
 
     def _make_request(
-        self, url: str, params: Optional[Dict] = None
+        self, url: str, params: Optional[Dict] = None, stream: bool = False
     ) -> Optional[requests.Response]:
         """
         Выполнение HTTP-запроса с повторными попытками
@@ -48,45 +172,302 @@ class BaseParser(ABC):
         Args:
             url: URL для запроса
             params: Параметры запроса
+            stream: Не загружать тело ответа (читается через iter_content,
+                вызывающий код закрывает ответ); действует, только если
+                кэш и архив выключены
 
         Returns:
             Response объект или None в случае ошибки
         """
+        if self.replay is not None:
+            return self._replay_response(url, params)
+
+        stream = stream and self.cache is None and self.archive is None
+
+        cached = self.cache.get(url, params) if self.cache else None
+        headers = self.cache.conditional_headers(cached) if cached else None
+        breaker = get_circuit_breaker(url)
+
         for attempt in range(self.max_retries):
+            # Автомат защиты: при недоступности хоста - пауза или отказ
+            wait = self._breaker_wait(breaker)
+            while wait > 0:
+                time.sleep(wait)
+                wait = self._breaker_wait(breaker)
+
             try:
+                self.rate_limiter.acquire()
                 self.logger.debug(
                     f"Запрос к {url} (попытка {attempt + 1}/{self.max_retries})"
                 )
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                response.raise_for_status()
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+                if self._handle_throttling(
+                    url, response.status_code, response.headers.get("Retry-After"), attempt
+                ):
+                    self._record_outcome(breaker, response.status_code)
+                    response.close()
+                    continue
 
-                # Задержка между запросами
-                time.sleep(self.delay)
+                self._record_outcome(breaker, response.status_code)
+
+                if cached and response.status_code == 304:
+                    self.logger.debug(f"Страница не изменилась, ответ из кэша: {url}")
+                    self.cache.touch(cached)
+                    response = self.cache.build_response(cached)
+                else:
+                    response.raise_for_status()
+
+                    if self.cache:
+                        self.cache.store(
+                            url,
+                            params,
+                            response.content,
+                            response.headers,
+                            response.encoding,
+                        )
+
+                if self.archive:
+                    self.archive.store(url, params, response.content, response.encoding)
 
                 return response
 
             except requests.exceptions.RequestException as e:
                 self.logger.warning(f"Ошибка при запросе {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.delay * (attempt + 1))
+                if e.response is None:
+                    self._record_outcome(breaker, None)
                 else:
-                    self.logger.error(
-                        f"Не удалось выполнить запрос к {url} после {self.max_retries} попыток"
+                    e.response.close()
+                if attempt < self.max_retries - 1:
+                    time.sleep(backoff_delay(attempt, self.delay, self.backoff_max))
+
+        self.logger.error(
+            f"Не удалось выполнить запрос к {url} после {self.max_retries} попыток"
+        )
+        return None
+
+    def _replay_response(
+        self, url: str, params: Optional[Dict] = None
+    ) -> Optional[requests.Response]:
+        """
+        Ответ из архива воспроизводимого запуска
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            Response из архива или None, если страница не была сохранена
+        """
+        response = self.replay.load_response(url, params)
+        if response is None:
+            self.logger.warning(f"Страницы нет в архиве {self.replay.run_id}: {url}")
+        return response
+
+    def _handle_throttling(
+        self, url: str, status_code: int, retry_after: Optional[str], attempt: int
+    ) -> bool:
+        """
+        Обработка ответов 429/503: общая пауза ограничителя частоты
+
+        Args:
+            url: URL запроса
+            status_code: HTTP-код ответа
+            retry_after: Значение заголовка Retry-After
+            attempt: Номер попытки (с нуля)
+
+        Returns:
+            True, если сервер попросил снизить нагрузку и запрос нужно повторить
+        """
+        if status_code not in THROTTLE_STATUS_CODES:
+            return False
+
+        pause = parse_retry_after(retry_after)
+        if pause is None:
+            pause = backoff_delay(attempt, self.delay, self.backoff_max)
+        pause = min(pause, self.max_retry_after)
+
+        self.logger.warning(
+            f"Сервер ответил {status_code} на {url}, пауза запросов {pause:.1f} с"
+        )
+        self.rate_limiter.pause(pause)
+        return True
+
+    def _breaker_wait(self, breaker: CircuitBreaker) -> float:
+        """
+        Проверка автомата защиты хоста перед запросом
+
+        Args:
+            breaker: Автомат защиты хоста
+
+        Returns:
+            0, если запрос можно отправлять, иначе секунды паузы (режим pause)
+
+        Raises:
+            CircuitOpenError: Хост недоступен и breaker_mode = "fail"
+        """
+        wait = breaker.before_request()
+        if wait <= 0:
+            return 0.0
+
+        if self.breaker_mode != "pause":
+            raise CircuitOpenError(
+                f"Хост {breaker.host} недоступен: {breaker.failures} ошибок подряд, "
+                f"обход прерван"
+            )
+
+        self.logger.warning(
+            f"Хост {breaker.host} недоступен, ожидание {wait:.0f} с до пробного запроса"
+        )
+        return wait
+
+    def _record_outcome(self, breaker: CircuitBreaker, status_code: Optional[int]):
+        """
+        Учет результата запроса в автомате защиты хоста
+
+        Сетевые ошибки и ответы 5xx считаются отказами хоста,
+        любой другой ответ означает, что хост доступен.
+
+        Args:
+            breaker: Автомат защиты хоста
+            status_code: HTTP-код ответа или None при сетевой ошибке
+        """
+        if status_code is not None and status_code < 500:
+            breaker.record_success()
+        elif breaker.record_failure():
+            self.logger.error(
+                f"Хост {breaker.host}: {breaker.failures} ошибок подряд, "
+                f"новые запросы приостановлены на {breaker.cooldown:.0f} с"
+            )
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Семафор, ограничивающий число одновременных запросов к хосту
+
+        Args:
+            url: URL запроса
+
+        Returns:
+            Семафор для хоста из URL
+        """
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _make_request_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict] = None,
+    ) -> Optional[str]:
+        """
+        Асинхронный HTTP-запрос с повторными попытками
+
+        Повторяет семантику _make_request: то же число попыток, общий
+        ограничитель частоты и обработка 429/503, но одновременно к одному хосту выполняется не более
+        concurrent_requests_per_host запросов.
+
+        Args:
+            session: Сессия aiohttp
+            url: URL для запроса
+            params: Параметры запроса
+
+        Returns:
+            HTML-контент или None в случае ошибки
+        """
+        if self.replay is not None:
+            response = self._replay_response(url, params)
+            return response.text if response is not None else None
+
+        semaphore = self._get_host_semaphore(url)
+        cached = self.cache.get(url, params) if self.cache else None
+        headers = self.cache.conditional_headers(cached) if cached else None
+        breaker = get_circuit_breaker(url)
+
+        for attempt in range(self.max_retries):
+            # Автомат защиты: при недоступности хоста - пауза или отказ
+            wait = self._breaker_wait(breaker)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._breaker_wait(breaker)
+
+            try:
+                async with semaphore:
+                    await self.rate_limiter.acquire_async()
+                    self.logger.debug(
+                        f"Запрос к {url} (попытка {attempt + 1}/{self.max_retries})"
                     )
+                    async with session.get(
+                        url, params=params, headers=headers
+                    ) as response:
+                        if self._handle_throttling(
+                            url,
+                            response.status,
+                            response.headers.get("Retry-After"),
+                            attempt,
+                        ):
+                            self._record_outcome(breaker, response.status)
+                            continue
+
+                        self._record_outcome(breaker, response.status)
+
+                        if cached and response.status == 304:
+                            self.logger.debug(
+                                f"Страница не изменилась, ответ из кэша: {url}"
+                            )
+                            self.cache.touch(cached)
+                            body, encoding = cached.read_body(), cached.encoding
+                        else:
+                            response.raise_for_status()
+                            body, encoding = await response.read(), response.get_encoding()
+
+                            if self.cache:
+                                self.cache.store(
+                                    url, params, body, response.headers, encoding
+                                )
 
+                if self.archive:
+                    self.archive.store(url, params, body, encoding)
+
+                return body.decode(encoding or "utf-8", errors="replace")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Ошибка при запросе {url}: {e!r}")
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    self._record_outcome(breaker, None)
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(
+                        backoff_delay(attempt, self.delay, self.backoff_max)
+                    )
+
+        self.logger.error(
+            f"Не удалось выполнить запрос к {url} после {self.max_retries} попыток"
+        )
         return None
 
-    def _parse_html(self, html: str) -> BeautifulSoup:
+    def _parse_html(self, html: str, profile: Optional[str] = None) -> BeautifulSoup:
         """
         Парсинг HTML
 
         Args:
             html: HTML-контент
+            profile: Вид страницы ("list" или "detail") - при partial_parse
+                     строится только нужная парсеру часть дерева;
+                     None - весь документ
 
         Returns:
             BeautifulSoup объект
         """
-        return BeautifulSoup(html, "lxml")
+        strainer = self.parse_profiles.get(profile) if self.partial_parse else None
+        return BeautifulSoup(html, "lxml", parse_only=strainer)
 
     def _get_pagination_urls(self, base_url: str, soup: BeautifulSoup) -> List[str]:
         """
@@ -157,6 +538,130 @@ class BaseParser(ABC):
         """
         pass
 
+    def column_batch(self, table: ListTable) -> ColumnBatch:
+        """
+        Ячейки таблицы по колонкам схемы реестра
+
+        Схема определяется по заголовку первой таблицы; если заголовок
+        следующей страницы отличается, выводится предупреждение и схема
+        определяется заново.
+
+        Args:
+            table: Таблица списочной страницы
+
+        Returns:
+            ColumnBatch строк таблицы
+        """
+        schema = self._column_schema
+        if schema is None or not schema.matches(table.header):
+            if schema is not None:
+                self.logger.warning(
+                    f"Изменились колонки таблицы реестра {self.registry_name}: "
+                    f"{schema.header} -> {table.header}"
+                )
+            schema = self._column_schema = ColumnSchema(
+                table.header, self.list_columns, self.list_min_cells
+            )
+        return schema.extract(table.rows)
+
+    def parse_list_html(self, html: str) -> List[Dict[str, Any]]:
+        """
+        Парсинг списочной страницы из HTML
+
+        При list_backend="lxml" таблица извлекается напрямую через lxml без
+        построения дерева BeautifulSoup; если парсер не реализует
+        items_from_table (None) или документ не разбирается, используется
+        parse_list_page.
+
+        Args:
+            html: HTML-контент страницы
+
+        Returns:
+            Список словарей с данными
+        """
+        if self.list_backend == "lxml" and self.items_from_table is not None:
+            try:
+                table = extract_table_lxml(html)
+            except ValueError as e:
+                self.logger.debug(f"lxml не разобрал страницу, используется bs4: {e}")
+            else:
+                return self.items_from_table(table)
+
+        return self.parse_list_page(self._parse_html(html, "list"))
+
+    def _streams_list_pages(self) -> bool:
+        # Тело ответа не сохраняется целиком: кэш и архив должны быть выключены
+        return (
+            self.stream_pages
+            and self.list_backend == "lxml"
+            and self.replay is None
+            and self.cache is None
+            and self.archive is None
+            and self.items_from_table is not None
+        )
+
+    def _fetch_list_page(self, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Загрузка и разбор страницы пагинации
+
+        Args:
+            page_url: URL страницы
+
+        Returns:
+            Записи страницы или None, если страницу не удалось загрузить
+        """
+        if self._streams_list_pages():
+            return self._fetch_list_stream(page_url)
+
+        response = self._make_request(page_url)
+        if not response:
+            return None
+        return self.parse_list_html(response.text)
+
+    def _fetch_list_stream(self, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Потоковая загрузка страницы пагинации
+
+        Строки таблицы разбираются по мере поступления тела ответа, без
+        полной копии страницы в bytes и str.
+
+        Args:
+            page_url: URL страницы
+
+        Returns:
+            Записи страницы или None, если страницу не удалось загрузить
+        """
+        for attempt in range(self.max_retries):
+            response = self._make_request(page_url, stream=True)
+            if not response:
+                return None
+
+            try:
+                if response.encoding is None:
+                    # Кодировку без charset requests определяет по всему телу
+                    return self.parse_list_html(response.text)
+
+                chunks = response.iter_content(self.stream_chunk_size)
+                table = extract_table_stream(chunks, response.encoding)
+                # Остаток после таблицы дочитывается, чтобы соединение
+                # вернулось в пул
+                for _ in chunks:
+                    pass
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"Обрыв загрузки страницы {page_url}: {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(backoff_delay(attempt, self.delay, self.backoff_max))
+                continue
+            finally:
+                response.close()
+
+            return self.items_from_table(table)
+
+        self.logger.error(
+            f"Не удалось загрузить страницу {page_url} после {self.max_retries} попыток"
+        )
+        return None
+
     @abstractmethod
     def parse_detail_page(self, url: str, soup: BeautifulSoup) -> Dict[str, Any]:
         """
@@ -171,6 +676,286 @@ class BaseParser(ABC):
         """
         pass
 
+    def _fetch_detail_html(self, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Загрузка детальной страницы одной записи
+
+        Args:
+            item: Запись со списочной страницы
+
+        Returns:
+            HTML страницы или None, если страница не получена
+        """
+        detail_response = self._make_request(item["detail_url"])
+        if not detail_response:
+            return None
+        return detail_response.text
+
+    def _fetch_detail(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Загрузка и разбор детальной страницы одной записи
+
+        Args:
+            item: Запись со списочной страницы
+
+        Returns:
+            Словарь с детальными данными или None, если страница не получена
+        """
+        detail_html = self._fetch_detail_html(item)
+        if detail_html is None:
+            return None
+        detail_soup = self._parse_html(detail_html, "detail")
+        return self.parse_detail_page(item["detail_url"], detail_soup)
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Пул процессов разбора (создается при первом использовании)
+
+        Returns:
+            ProcessPoolExecutor или None, если разбор идет в текущем процессе
+        """
+        if self.parse_workers <= 1:
+            return None
+        if self._parse_pool is None:
+            self._parse_pool = create_parse_pool(self.parse_workers)
+            self.logger.info(f"Разбор страниц в {self.parse_workers} процессах")
+        return self._parse_pool
+
+    def _close_parse_pool(self):
+        """Остановка пула процессов разбора"""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+
+    def _parse_details_in_pool(
+        self, items: List[Dict[str, Any]], htmls: Iterator[Optional[str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Разбор загруженных детальных страниц в пуле процессов
+
+        Args:
+            items: Записи со списочной страницы
+            htmls: HTML детальных страниц в порядке записей (None - не получена)
+
+        Returns:
+            Детальные данные в порядке записей
+        """
+        pool = self._get_parse_pool()
+        path = parser_path(self)
+        futures = [
+            pool.submit(
+                parse_html, path, self.registry_key, "detail", item["detail_url"], html
+            )
+            if html is not None
+            else None
+            for item, html in zip(items, htmls)
+        ]
+        return [future.result() if future else None for future in futures]
+
+    def _select_detail_items(
+        self, page_data: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Отбор записей, для которых нужно загрузить детальную страницу
+
+        В инкрементальном режиме записи с неизменившейся строкой сразу
+        дополняются данными прошлого снимка и не попадают в результат.
+
+        Args:
+            page_data: Записи страницы
+
+        Returns:
+            Список пар (запись, отпечаток строки или None)
+        """
+        selected = []
+
+        for item in page_data:
+            if item.get("detail_url") is None:
+                continue
+
+            fingerprint = (
+                self.state_store.fingerprint(item) if self.state_store else None
+            )
+
+            # Детальная страница загружена до сбоя прошлого запуска
+            saved_detail = (
+                self.checkpoint.get_detail(item["detail_url"])
+                if self.checkpoint
+                else None
+            )
+            if saved_detail is not None:
+                self._merge_detail(item, fingerprint, saved_detail)
+                continue
+
+            if self.state_store is None:
+                selected.append((item, None))
+                continue
+
+            known_detail = self.state_store.recall(item, fingerprint)
+            if known_detail is not None:
+                item.update(known_detail)
+            else:
+                selected.append((item, fingerprint))
+
+        return selected
+
+    def _merge_detail(
+        self,
+        item: Dict[str, Any],
+        fingerprint: Optional[str],
+        detail_data: Optional[Dict[str, Any]],
+    ):
+        """
+        Слияние детальных данных с записью
+
+        Args:
+            item: Запись со списочной страницы
+            fingerprint: Отпечаток строки (инкрементальный режим)
+            detail_data: Результат parse_detail_page или None
+        """
+        if detail_data is None:
+            return
+
+        if self.state_store is not None and fingerprint is not None:
+            self.state_store.remember(item, fingerprint, detail_data)
+        if self.checkpoint is not None:
+            self.checkpoint.add_detail(item["detail_url"], detail_data)
+        item.update(detail_data)
+
+    def _open_state_store(self):
+        """Загрузка состояния прошлого обхода в инкрементальном режиме"""
+        self.state_store = (
+            CrawlStateStore(self.registry_key) if self.incremental else None
+        )
+
+    def _open_checkpoint(self, detailed: bool):
+        """
+        Подготовка контрольной точки полного обхода
+
+        Без флага resume контрольная точка прошлого запуска удаляется.
+
+        Args:
+            detailed: Режим обхода (контрольные точки ведутся только для полного)
+        """
+        if not detailed:
+            self.checkpoint = None
+            return
+
+        checkpoint = CrawlCheckpoint(self.registry_key)
+        if not (self.resume and checkpoint.load()):
+            checkpoint.reset()
+        self.checkpoint = checkpoint
+
+    def _start_checkpoint(self, pagination_urls: List[str]) -> List[str]:
+        """
+        Фиксация списка страниц в контрольной точке
+
+        При возобновлении используется список страниц прерванного обхода,
+        чтобы завершенные страницы совпадали с сохраненными записями.
+
+        Args:
+            pagination_urls: URL страниц пагинации текущего запуска
+
+        Returns:
+            URL страниц для обхода
+        """
+        if self.checkpoint is None:
+            return pagination_urls
+
+        self.checkpoint.start(pagination_urls)
+        return self.checkpoint.pagination_urls
+
+    def _page_done(self, page_url: str) -> bool:
+        """Завершена ли страница до сбоя прошлого запуска"""
+        return self.checkpoint is not None and self.checkpoint.is_page_done(page_url)
+
+    def _restore_page(self, page_url: str) -> List[Dict[str, Any]]:
+        """
+        Записи завершенной страницы из контрольной точки
+
+        Args:
+            page_url: URL страницы
+
+        Returns:
+            Записи страницы
+        """
+        page_data = self.checkpoint.read_page(page_url)
+        if self.state_store is not None:
+            for item in page_data:
+                self.state_store.carry_over(item)
+        return page_data
+
+    def _finish_checkpoint(self, complete: bool):
+        """
+        Завершение работы с контрольной точкой
+
+        Args:
+            complete: Все страницы обработаны - контрольная точка удаляется
+        """
+        if self.checkpoint is None:
+            return
+
+        if complete:
+            self.checkpoint.clear()
+        else:
+            self.checkpoint.save()
+            self.checkpoint.close()
+            self.logger.warning(
+                f"Обход не завершен, контрольная точка сохранена в "
+                f"{self.checkpoint.path}; для продолжения запустите с --resume"
+            )
+        self.checkpoint = None
+
+    def _parse_details(self, page_data: List[Dict[str, Any]]):
+        """
+        Дополнение записей страницы данными детальных страниц
+
+        При detail_workers > 1 страницы загружаются пулом потоков, при
+        parse_workers > 1 разбираются пулом процессов; результаты сливаются
+        в записи в исходном порядке строк.
+
+        Args:
+            page_data: Записи страницы (изменяются на месте)
+        """
+        selected = self._select_detail_items(page_data)
+        items = [item for item, _ in selected]
+
+        in_pool = self._get_parse_pool() is not None
+        fetch = self._fetch_detail_html if in_pool else self._fetch_detail
+
+        if self.detail_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+                results = list(executor.map(fetch, items))
+        else:
+            results = map(fetch, items)
+
+        if in_pool:
+            results = self._parse_details_in_pool(items, results)
+
+        for (item, fingerprint), detail_data in zip(selected, results):
+            self._merge_detail(item, fingerprint, detail_data)
+
+    def _record_model(self, model: type, compact: bool = False) -> Callable[..., Any]:
+        """
+        Конструктор создаваемых записей
+
+        При compact - компактный вариант модели (models/compact.py);
+        общая метка parsed_at компактных записей - время начала обхода
+        (run_timestamp парсера). Метка хранится в парсере, а не в процессе,
+        поэтому параллельные обходы реестров ее не перезаписывают.
+
+        Args:
+            model: Класс модели из models/
+            compact: Создавать компактные записи
+
+        Returns:
+            Класс или фабрика для создания записей
+        """
+        if not compact:
+            return model
+        self.run_timestamp = datetime.now()
+        return partial(COMPACT_MODELS[model], parsed_at=self.run_timestamp)
+
     def parse_registry(self, detailed: bool = False) -> List[Dict[str, Any]]:
         """
         Парсинг всего реестра
@@ -183,53 +968,467 @@ class BaseParser(ABC):
         Returns:
             Список собранных данных
         """
+        return list(self.iter_registry(detailed=detailed))
+
+    def _records_batch(
+        self, records: Iterator[Dict[str, Any]], parsed_at: datetime
+    ) -> RecordBatch:
+        """
+        Колоночный пакет из записей-словарей
+
+        Для парсеров с record_model колонки - поля модели с названиями из
+        export_columns, parsed_at - время начала обхода; даты, числа и
+        идентификаторы приводятся к типам модели (field_types) по колонкам.
+
+        Args:
+            records: Записи реестра
+            parsed_at: Время начала обхода
+
+        Returns:
+            RecordBatch с записями
+        """
+        model = self.record_model
+        if model is None:
+            return RecordBatch.from_records(records)
+
+        batch = RecordBatch.from_records(
+            records,
+            fields=list(model.export_columns),
+            display_names=model.export_columns,
+            field_types=model.field_types,
+        )
+        batch.fill("parsed_at", parsed_at)
+        normalize_batch(batch, model.field_types)
+        return batch
+
+    def parse_to_batch(self, detailed: bool = False) -> RecordBatch:
+        """
+        Парсинг всего реестра в один колоночный пакет записей
+
+        Записи добавляются в колонки по мере разбора страниц, без
+        промежуточных моделей и to_dict(). Пакет держит весь реестр в
+        памяти; для выгрузки с постоянной памятью - iter_batches.
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Returns:
+            RecordBatch с записями реестра
+        """
+        records = self.iter_registry(detailed=detailed)
+        return self._records_batch(records, datetime.now())
+
+    def iter_batches(self, detailed: bool = False) -> Iterator[RecordBatch]:
+        """
+        Потоковый парсинг реестра по колоночным пакетам
+
+        Каждая страница пагинации (с ее детальными страницами) выдается
+        отдельным пакетом, как в parse_to_batch; parsed_at у всех пакетов
+        обхода общий. В памяти одновременно находится одна страница.
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Yields:
+            RecordBatch записей очередной страницы
+        """
+        parsed_at = datetime.now()
+        for page_data in self.iter_pages(detailed=detailed):
+            yield self._records_batch(page_data, parsed_at)
+
+    def iter_registry(self, detailed: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Потоковый парсинг реестра по одной записи
+
+        Записи выдаются сразу после разбора своей страницы (и ее детальных
+        страниц), поэтому потребление памяти не растет с размером реестра.
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Yields:
+            Словари с данными записей в порядке реестра
+        """
+        for page_data in self.iter_pages(detailed=detailed):
+            yield from page_data
+
+    def iter_typed_records(self, detailed: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Потоковый парсинг реестра с приведением типов полей record_model
+
+        Даты, числа и идентификаторы каждой страницы преобразуются по
+        колонкам сразу после ее разбора (utils.normalizer), поэтому модели
+        получают значения нужных типов. Чекпоинт и состояние обхода
+        сохраняются до приведения, в исходном виде.
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Yields:
+            Словари с данными записей в порядке реестра
+        """
+        field_types = self.record_model.field_types if self.record_model else {}
+        for page_data in self.iter_pages(detailed=detailed):
+            normalize_records(page_data, field_types)
+            yield from page_data
+
+    def iter_pages(self, detailed: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Потоковый парсинг реестра по страницам
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Yields:
+            Записи очередной страницы пагинации
+        """
+        if self.engine == "async":
+            yield from self._iter_pages_async(detailed)
+            return
+
         self.logger.info(f"Начало парсинга реестра: {self.registry_name}")
-        all_data = []
+        total = 0
+        complete = False
+        if detailed:
+            self._open_state_store()
 
         # Получение первой страницы
         response = self._make_request(self.registry_url)
         if not response:
             self.logger.error("Не удалось получить первую страницу реестра")
-            return all_data
+            return
 
-        soup = self._parse_html(response.text)
+        # Контрольная точка открывается после первой страницы и закрывается
+        # в finally, чтобы сбой не оставил ее незавершенной
+        self._open_checkpoint(detailed)
+        list_pages = None
+        try:
+            soup = self._parse_html(response.text, "list")
 
-        # В режиме detailed=True парсим все страницы, иначе только первую
-        if detailed:
-            pagination_urls = self._get_pagination_urls(self.registry_url, soup)
-        else:
-            pagination_urls = [self.registry_url]
-            self.logger.info("Режим быстрого сканирования: только первая страница")
+            # В режиме detailed=True парсим все страницы, иначе только первую
+            if detailed:
+                pagination_urls = self._start_checkpoint(
+                    self._get_pagination_urls(self.registry_url, soup)
+                )
+            else:
+                pagination_urls = [self.registry_url]
+                self.logger.info("Режим быстрого сканирования: только первая страница")
+
+            if self.stream_pages and not self._streams_list_pages():
+                self.logger.info(
+                    "Потоковый разбор выключен: нужны lxml и выключенные кэш и архив"
+                )
 
-        # Парсинг каждой страницы
-        for page_num, page_url in enumerate(pagination_urls, 1):
-            self.logger.info(
-                f"Парсинг страницы {page_num}/{len(pagination_urls)}: {page_url}"
+            # Остальные страницы загружаются и разбираются (при prefetch_pages > 0 -
+            # заранее); страницы, завершенные до сбоя, не загружаются
+            list_pages = self._iter_list_pages(
+                [url for url in pagination_urls[1:] if not self._page_done(url)]
             )
 
-            if page_num > 1:  # Первую страницу уже получили
-                response = self._make_request(page_url)
-                if not response:
+            # Парсинг каждой страницы
+            failed_pages = 0
+            for page_num, page_url in enumerate(pagination_urls, 1):
+                self.logger.info(
+                    f"Парсинг страницы {page_num}/{len(pagination_urls)}: {page_url}"
+                )
+
+                if self._page_done(page_url):
+                    page_data = self._restore_page(page_url)
+                    self.logger.info(
+                        f"Записи страницы восстановлены из контрольной точки: "
+                        f"{len(page_data)}"
+                    )
+                    total += len(page_data)
+                    yield page_data
                     continue
-                soup = self._parse_html(response.text)
 
-            # Парсинг списка на странице
-            page_data = self.parse_list_page(soup)
-            self.logger.info(f"Найдено записей на странице: {len(page_data)}")
+                # Парсинг списка на странице (первую страницу уже получили)
+                if page_num == 1:
+                    page_data = self.parse_list_page(soup)
+                else:
+                    _, page_data = next(list_pages)
+                    if page_data is None:
+                        failed_pages += 1
+                        continue
+                self.logger.info(f"Найдено записей на странице: {len(page_data)}")
 
-            # Детальный парсинг, если требуется
-            if detailed:
-                for item in page_data:
-                    if "detail_url" in item and item["detail_url"] is not None:
-                        detail_response = self._make_request(item["detail_url"])
-                        if detail_response:
-                            detail_soup = self._parse_html(detail_response.text)
-                            detail_data = self.parse_detail_page(
-                                item["detail_url"], detail_soup
-                            )
-                            item.update(detail_data)
+                # Детальный парсинг, если требуется
+                if detailed:
+                    self._parse_details(page_data)
 
-            all_data.extend(page_data)
+                if self.checkpoint is not None:
+                    self.checkpoint.page_done(page_url, page_data)
+
+                total += len(page_data)
+                yield page_data
+            complete = failed_pages == 0
+        finally:
+            if list_pages is not None:
+                list_pages.close()
+            self._close_parse_pool()
+            self._finish_checkpoint(complete)
+
+        if self.state_store is not None:
+            self.state_store.save()
+
+        self.logger.info(f"Парсинг завершен. Всего записей: {total}")
+
+    def _iter_list_pages(
+        self, page_urls: List[str]
+    ) -> Iterator[Tuple[str, Optional[List[Dict[str, Any]]]]]:
+        """
+        Загрузка и разбор страниц пагинации с опережением
+
+        При prefetch_pages > 0 отдельный поток загружает и разбирает страницы
+        в ограниченную очередь, пока обрабатывается текущая страница, так что
+        сетевое ожидание и разбор перекрываются. Порядок страниц сохраняется.
+
+        Args:
+            page_urls: URL страниц в порядке обхода
+
+        Yields:
+            Пары (URL, записи страницы или None)
+        """
+        if self.prefetch_pages <= 0 or len(page_urls) < 2:
+            for page_url in page_urls:
+                yield page_url, self._fetch_list_page(page_url)
+            return
+
+        buffer: "queue.Queue" = queue.Queue(maxsize=self.prefetch_pages)
+        stop = threading.Event()
+        done = object()
+
+        def put(entry) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for page_url in page_urls:
+                    if not put((page_url, self._fetch_list_page(page_url))):
+                        return
+                put(done)
+            except BaseException as e:
+                put(e)
+
+        producer = threading.Thread(
+            target=produce, name=f"{self.__class__.__name__}-prefetch", daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                entry = buffer.get()
+                if entry is done:
+                    break
+                if isinstance(entry, BaseException):
+                    raise entry
+                yield entry
+        finally:
+            stop.set()
+            producer.join(timeout=self.timeout)
 
-        self.logger.info(f"Парсинг завершен. Всего записей: {len(all_data)}")
+    def _iter_pages_async(self, detailed: bool) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Синхронный итератор поверх aiter_pages
+
+        Асинхронный генератор продвигается по одному шагу в собственном
+        цикле событий, поэтому вызывающий код остается синхронным.
+        """
+        loop = asyncio.new_event_loop()
+        pages = self.aiter_pages(detailed=detailed)
+        try:
+            while True:
+                try:
+                    page_data = loop.run_until_complete(pages.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield page_data
+        finally:
+            loop.run_until_complete(pages.aclose())
+            loop.close()
+
+    async def parse_registry_async(
+        self, detailed: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Асинхронный парсинг всего реестра
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Returns:
+            Список собранных данных
+        """
+        all_data = []
+        async for page_data in self.aiter_pages(detailed=detailed):
+            all_data.extend(page_data)
         return all_data
+
+    async def aiter_pages(
+        self, detailed: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Асинхронный потоковый парсинг реестра по страницам
+
+        Страницы пагинации и детальные страницы загружаются параллельно
+        (с ограничением concurrent_requests_per_host), разбор выполняется
+        теми же parse_list_page/parse_detail_page. В работе одновременно
+        находится окно из нескольких страниц; страницы выдаются в порядке
+        реестра, как в синхронном движке.
+
+        Args:
+            detailed: Парсить ли детальные страницы
+
+        Yields:
+            Записи очередной страницы пагинации
+        """
+        self.logger.info(
+            f"Начало асинхронного парсинга реестра: {self.registry_name} "
+            f"(до {self.concurrency_per_host} запросов к хосту)"
+        )
+        total = 0
+        complete = False
+        self._host_semaphores = {}
+        if detailed:
+            self._open_state_store()
+
+        async with create_async_session(self.timeout) as session:
+            # Получение первой страницы
+            html = await self._make_request_async(session, self.registry_url)
+            if html is None:
+                self.logger.error("Не удалось получить первую страницу реестра")
+                return
+
+            # Контрольная точка открывается после первой страницы и
+            # закрывается в finally, чтобы сбой не оставил ее незавершенной
+            self._open_checkpoint(detailed)
+            pending = deque()
+
+            async def fetch_detail(item: Dict[str, Any], fingerprint: Optional[str]):
+                detail_html = await self._make_request_async(
+                    session, item["detail_url"]
+                )
+                if detail_html is None:
+                    return
+
+                pool = self._get_parse_pool()
+                if pool is not None:
+                    detail_data = await asyncio.get_running_loop().run_in_executor(
+                        pool,
+                        parse_html,
+                        parser_path(self),
+                        self.registry_key,
+                        "detail",
+                        item["detail_url"],
+                        detail_html,
+                    )
+                else:
+                    detail_soup = self._parse_html(detail_html, "detail")
+                    detail_data = self.parse_detail_page(item["detail_url"], detail_soup)
+                self._merge_detail(item, fingerprint, detail_data)
+
+            async def process_page(
+                page_url: str, soup: Optional[BeautifulSoup] = None
+            ) -> Optional[List[Dict[str, Any]]]:
+                if soup is None:
+                    page_html = await self._make_request_async(session, page_url)
+                    if page_html is None:
+                        return None
+                    page_data = self.parse_list_html(page_html)
+                else:
+                    page_data = self.parse_list_page(soup)
+
+                # Детальный парсинг, если требуется; при ошибке одной загрузки
+                # (например, CircuitOpenError) остальные отменяются, чтобы не
+                # отправлять запросы к недоступному хосту
+                if detailed:
+                    tasks = [
+                        asyncio.ensure_future(fetch_detail(item, fingerprint))
+                        for item, fingerprint in self._select_detail_items(page_data)
+                    ]
+                    try:
+                        await asyncio.gather(*tasks)
+                    except BaseException:
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        raise
+                return page_data
+
+            def schedule(page_url: str, soup: Optional[BeautifulSoup] = None):
+                # Страницы, завершенные до сбоя, не загружаются
+                if self._page_done(page_url):
+                    return page_url, None
+                return page_url, asyncio.ensure_future(process_page(page_url, soup))
+
+            try:
+                first_soup = self._parse_html(html, "list")
+
+                if detailed:
+                    pagination_urls = self._start_checkpoint(
+                        self._get_pagination_urls(self.registry_url, first_soup)
+                    )
+                else:
+                    pagination_urls = [self.registry_url]
+                    self.logger.info(
+                        "Режим быстрого сканирования: только первая страница"
+                    )
+
+                window = max(2, self.concurrency_per_host)
+                page_iter = iter(pagination_urls[1:])
+                pending.append(schedule(self.registry_url, first_soup))
+
+                page_num = 0
+                failed_pages = 0
+                while pending:
+                    # Поддерживаем окно страниц, загружаемых заранее
+                    for page_url in page_iter:
+                        pending.append(schedule(page_url))
+                        if len(pending) >= window:
+                            break
+
+                    page_url, task = pending.popleft()
+                    page_num += 1
+                    if task is None:
+                        page_data = self._restore_page(page_url)
+                        self.logger.info(
+                            f"Страница {page_num}/{len(pagination_urls)}: "
+                            f"восстановлено из контрольной точки {len(page_data)}"
+                        )
+                        total += len(page_data)
+                        yield page_data
+                        continue
+
+                    page_data = await task
+                    if page_data is None:
+                        failed_pages += 1
+                        continue
+
+                    if self.checkpoint is not None:
+                        self.checkpoint.page_done(page_url, page_data)
+
+                    self.logger.info(
+                        f"Страница {page_num}/{len(pagination_urls)}: "
+                        f"найдено записей {len(page_data)}"
+                    )
+                    total += len(page_data)
+                    yield page_data
+                complete = failed_pages == 0
+            finally:
+                tasks = [task for _, task in pending if task is not None]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self._close_parse_pool()
+                self._finish_checkpoint(complete)
+
+        if self.state_store is not None:
+            self.state_store.save()
+
+        self.logger.info(f"Парсинг завершен. Всего записей: {total}")
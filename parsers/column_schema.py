@@ -0,0 +1,134 @@
+"""
+Схема колонок списочной таблицы реестра
+
+Схема определяется один раз по заголовку первой страницы; на следующих
+страницах заголовок сверяется по хэшу, поэтому смена раскладки колонок
+посреди обхода обнаруживается сразу. Ячейки страницы раскладываются в
+заранее выделенные списки по колонкам (ColumnBatch).
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from parsers.fast_extract import TableRow
+
+# Ячейки нет в строке (строка короче заголовка)
+MISSING: Any = object()
+
+
+def header_hash(header: Sequence[str]) -> int:
+    """
+    Хэш заголовка таблицы
+
+    Args:
+        header: Тексты ячеек заголовка
+
+    Returns:
+        Хэш для сравнения заголовков страниц
+    """
+    return hash(tuple(header))
+
+
+class ColumnBatch(NamedTuple):
+    """Ячейки страницы по колонкам"""
+
+    names: List[str]  # имена колонок
+    columns: List[List[Any]]  # значения колонок, строки в порядке таблицы
+    hrefs: List[Optional[str]]  # ссылки строк
+    complete: bool = True  # в колонках нет MISSING
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Строки в виде словарей {имя колонки: значение} без отсутствующих ячеек
+
+        Yields:
+            Словари строк в порядке таблицы
+        """
+        names = self.names
+        if self.complete:
+            for values in zip(*self.columns):
+                yield dict(zip(names, values))
+            return
+
+        for values in zip(*self.columns):
+            yield {
+                name: value
+                for name, value in zip(names, values)
+                if value is not MISSING
+            }
+
+
+class ColumnSchema:
+    """
+    Раскладка колонок таблицы
+
+    Позиционная схема (fields задан) дает фиксированный набор колонок:
+    лишние ячейки отбрасываются, отсутствующие равны None. Схема без fields
+    берет имена из заголовка, ячейкам за пределами заголовка дает имена
+    col_<номер>, отсутствующие ячейки помечает MISSING.
+    """
+
+    def __init__(
+        self,
+        header: Sequence[str],
+        fields: Optional[Sequence[str]] = None,
+        min_cells: int = 1,
+    ):
+        """
+        Args:
+            header: Тексты ячеек заголовка первой страницы
+            fields: Имена полей по позициям колонок (None - из заголовка)
+            min_cells: Минимум ячеек в строке; более короткие строки пропускаются
+        """
+        self.header = list(header)
+        self.header_hash = header_hash(self.header)
+        self.positional = fields is not None
+        self.names = list(fields) if fields is not None else list(self.header)
+        self.min_cells = max(1, min_cells)
+
+    def matches(self, header: Sequence[str]) -> bool:
+        """
+        Совпадает ли заголовок страницы со схемой
+
+        Args:
+            header: Тексты ячеек заголовка
+
+        Returns:
+            True, если хэши заголовков равны
+        """
+        return header_hash(header) == self.header_hash
+
+    def extract(self, rows: Sequence[TableRow]) -> ColumnBatch:
+        """
+        Раскладка строк таблицы по колонкам
+
+        Args:
+            rows: Строки таблицы (без заголовка)
+
+        Returns:
+            ColumnBatch со строками, в которых не меньше min_cells ячеек
+        """
+        rows = [row for row in rows if len(row.cells) >= self.min_cells]
+        count = len(rows)
+
+        names = self.names
+        if self.positional:
+            missing = None
+        else:
+            missing = MISSING
+            width = max((len(row.cells) for row in rows), default=0)
+            if width > len(names):
+                names = names + [f"col_{i}" for i in range(len(names), width)]
+
+        width = len(names)
+        complete = True
+        if count and all(len(row.cells) == width for row in rows):
+            # Строки ровно по ширине схемы: транспонирование без цикла по ячейкам
+            columns = [list(column) for column in zip(*(row.cells for row in rows))]
+        else:
+            complete = self.positional or count == 0
+            columns = [[missing] * count for _ in range(width)]
+            for index, row in enumerate(rows):
+                for position, cell in enumerate(row.cells[:width]):
+                    columns[position][index] = cell
+
+        return ColumnBatch(names, columns, [row.href for row in rows], complete)
@@ -0,0 +1,257 @@
+"""
+Извлечение таблицы списочной страницы
+
+Списочные страницы реестров - одна таблица: строка заголовка и строки
+записей со ссылкой на детальную страницу. Таблица извлекается в
+ListTable одним из способов с одинаковым результатом:
+    extract_table_lxml - напрямую через lxml и заранее скомпилированные XPath
+    extract_table_soup - через дерево BeautifulSoup
+    extract_table_stream - по частям тела ответа, пока оно загружается
+"""
+
+import threading
+from typing import Iterable, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+
+class TableRow(NamedTuple):
+    """Строка таблицы: тексты ячеек td и href первой ссылки"""
+
+    cells: List[str]
+    href: Optional[str]
+
+
+class ListTable(NamedTuple):
+    """Таблица списочной страницы"""
+
+    header: List[str]  # тексты ячеек th/td первой строки
+    rows: List[TableRow]  # строки после первой
+
+
+# Тексты, которые BeautifulSoup не включает в get_text(): содержимое
+# script/style/template и ruby-аннотаций, комментарии
+_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]"
+)
+_FIRST_TABLE = etree.XPath("(//table)[1]")
+_ROWS = etree.XPath(".//tr")
+_HEADER_CELLS = etree.XPath(".//*[self::th or self::td]")
+_CELLS = etree.XPath(".//td")
+_FIRST_LINK = etree.XPath("(.//a)[1]")
+
+# Парсер lxml нельзя использовать из нескольких потоков одновременно
+_local = threading.local()
+
+
+def _html_parser() -> etree.HTMLParser:
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = etree.HTMLParser()
+    return parser
+
+
+def _text(element) -> str:
+    # Аналог get_text(strip=True): непустые строки без крайних пробелов подряд
+    return "".join(
+        stripped for stripped in (text.strip() for text in _TEXT(element)) if stripped
+    )
+
+
+def extract_table_lxml(html: str) -> Optional[ListTable]:
+    """
+    Извлечение первой таблицы страницы через lxml
+
+    Args:
+        html: HTML-контент
+
+    Returns:
+        ListTable или None, если таблицы на странице нет
+
+    Raises:
+        ValueError: Документ не удалось разобрать (пустой или с XML-декларацией
+            кодировки); вызывающий код переходит на BeautifulSoup
+    """
+    try:
+        root = etree.fromstring(html, _html_parser())
+    except etree.XMLSyntaxError as e:
+        raise ValueError(str(e)) from e
+    if root is None:
+        raise ValueError("Пустой документ")
+
+    tables = _FIRST_TABLE(root)
+    if not tables:
+        return None
+
+    rows = _ROWS(tables[0])
+    if not rows:
+        return ListTable([], [])
+
+    header = [_text(cell) for cell in _HEADER_CELLS(rows[0])]
+    table_rows = []
+    for row in rows[1:]:
+        links = _FIRST_LINK(row)
+        table_rows.append(
+            TableRow(
+                [_text(cell) for cell in _CELLS(row)],
+                links[0].get("href") if links else None,
+            )
+        )
+    return ListTable(header, table_rows)
+
+
+def extract_table_soup(soup: BeautifulSoup) -> Optional[ListTable]:
+    """
+    Извлечение первой таблицы страницы из дерева BeautifulSoup
+
+    Args:
+        soup: Parsed HTML страницы
+
+    Returns:
+        ListTable или None, если таблицы на странице нет
+    """
+    table = soup.find("table")
+    if not table:
+        return None
+
+    rows = table.find_all("tr")
+    if not rows:
+        return ListTable([], [])
+
+    header = [cell.get_text(strip=True) for cell in rows[0].find_all(["th", "td"])]
+    table_rows = []
+    for row in rows[1:]:
+        link = row.find("a")
+        href = link.get("href") if link else None
+        # Проверяем, что href - строка, а не список
+        if isinstance(href, list):
+            href = href[0] if href else None
+        table_rows.append(
+            TableRow([cell.get_text(strip=True) for cell in row.find_all("td")], href)
+        )
+    return ListTable(header, table_rows)
+
+
+class TableStream:
+    """
+    Потоковое извлечение первой таблицы страницы
+
+    Части тела ответа подаются в инкрементальный парсер lxml; строка
+    таблицы разбирается, как только закрывается ее тег tr, после чего
+    содержимое строки удаляется из дерева. Когда первая таблица закрыта,
+    остаток документа не нужен (done). Для таблиц без вложенных таблиц
+    результат совпадает с extract_table_lxml.
+    """
+
+    def __init__(self, encoding: Optional[str] = None):
+        """
+        Args:
+            encoding: Кодировка тела ответа (None - определяет lxml)
+        """
+        self._parser = etree.HTMLPullParser(
+            events=("start", "end"), tag=("table", "tr"), encoding=encoding
+        )
+        self._table = None
+        self.header: Optional[List[str]] = None
+        self.rows: List[TableRow] = []
+        self.done = False
+
+    def feed(self, data: bytes) -> List[TableRow]:
+        """
+        Очередная часть документа
+
+        Args:
+            data: Байты тела ответа
+
+        Returns:
+            Строки таблицы, закрытые этой частью
+        """
+        if self.done:
+            return []
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> Optional[ListTable]:
+        """
+        Завершение разбора
+
+        Returns:
+            ListTable или None, если таблицы на странице нет
+        """
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError:
+                # Пустой документ: таблицы нет
+                pass
+            else:
+                self._read_events()
+
+        if self._table is None:
+            return None
+        return ListTable(self.header or [], self.rows)
+
+    def _read_events(self) -> List[TableRow]:
+        closed = []
+        for event, element in self._parser.read_events():
+            if self.done:
+                break
+            if element.tag == "table":
+                if event == "start" and self._table is None:
+                    self._table = element
+                elif event == "end" and element is self._table:
+                    self.done = True
+                continue
+
+            if event != "end" or self._table is None:
+                continue
+            owner = next(element.iterancestors("table"), None)
+            if owner is not self._table and not any(
+                ancestor is self._table for ancestor in element.iterancestors("table")
+            ):
+                continue
+
+            if self.header is None:
+                self.header = [_text(cell) for cell in _HEADER_CELLS(element)]
+            else:
+                links = _FIRST_LINK(element)
+                row = TableRow(
+                    [_text(cell) for cell in _CELLS(element)],
+                    links[0].get("href") if links else None,
+                )
+                self.rows.append(row)
+                closed.append(row)
+
+            # Строка разобрана: ее содержимое в дереве больше не нужно
+            # (строки вложенных таблиц остаются до закрытия внешней строки)
+            if owner is self._table:
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+        return closed
+
+
+def extract_table_stream(
+    chunks: Iterable[bytes], encoding: Optional[str] = None
+) -> Optional[ListTable]:
+    """
+    Извлечение первой таблицы страницы по частям тела ответа
+
+    Чтение частей прекращается, как только первая таблица закрыта.
+
+    Args:
+        chunks: Части тела ответа (Response.iter_content)
+        encoding: Кодировка тела ответа (None - определяет lxml)
+
+    Returns:
+        ListTable или None, если таблицы на странице нет
+    """
+    stream = TableStream(encoding)
+    for chunk in chunks:
+        stream.feed(chunk)
+        if stream.done:
+            break
+    return stream.close()
@@ -0,0 +1,140 @@
+"""
+Декларативное сопоставление подписей детальной страницы с полями записи
+
+Спецификация реестра - список FieldRule: поле записи, ключевые слова
+подписи и преобразование значения. Ключевое слово совпадает с началом
+слова подписи ("тел" находит "тел." и "телефон", но не "руководитель"),
+несколько слов через "+" должны встретиться все. Правила проверяются в
+порядке объявления, побеждает первое подошедшее, поэтому пересекающиеся
+подписи разводятся порядком и группами из нескольких слов: правило
+"организац+инн" объявляется раньше "инн", "телефон" - раньше
+"руководител" ("Телефон руководителя" - телефон).
+
+FieldSpec компилируется один раз при импорте парсера; результат для уже
+встреченной подписи запоминается, поэтому разбор поля - поиск в словаре.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+_WORDS = re.compile(r"[0-9a-zа-я]+")
+
+
+def normalize_label(label: str) -> str:
+    """
+    Нормализация подписи: нижний регистр, "ё" -> "е", слова через пробел
+
+    Args:
+        label: Текст подписи
+
+    Returns:
+        Нормализованная подпись, например "e-mail:" -> "e mail"
+    """
+    return " ".join(_WORDS.findall(label.lower().replace("ё", "е")))
+
+
+def first_int(value: str) -> Optional[int]:
+    """
+    Первое целое число в значении ("12 лет" -> 12)
+
+    Args:
+        value: Текст значения
+
+    Returns:
+        Число или None, если цифр нет (поле не заполняется)
+    """
+    match = re.search(r"\d+", value)
+    return int(match.group()) if match else None
+
+
+class FieldRule(NamedTuple):
+    """Правило поля: подходит подпись, содержащая любую из групп keywords"""
+
+    field: str
+    keywords: Tuple[str, ...]  # группы ключевых слов, внутри группы через "+"
+    convert: Optional[Callable[[str], Any]] = None  # None результата - пропуск
+
+
+class FieldSpec:
+    """
+    Скомпилированная спецификация полей реестра
+    """
+
+    def __init__(self, rules: Sequence[FieldRule]):
+        """
+        Args:
+            rules: Правила полей; для подписи выбирается первое подошедшее
+                в порядке объявления
+        """
+        self._rules: List[Tuple[Tuple[Pattern, ...], FieldRule]] = []
+        for rule in rules:
+            for group in rule.keywords:
+                words = [normalize_label(word) for word in group.split("+")]
+                patterns = tuple(
+                    re.compile(r"(?:^| )" + re.escape(word)) for word in words
+                )
+                self._rules.append((patterns, rule))
+
+        # Подписи, совпадающие с ключевым словом целиком, разрешаются сразу
+        self._exact: Dict[str, Optional[FieldRule]] = {}
+        for rule in rules:
+            for group in rule.keywords:
+                if "+" not in group:
+                    label = normalize_label(group)
+                    self._exact.setdefault(label, self._match(label))
+
+        # Исходная подпись -> правило (None - подпись не относится к полям)
+        self._memo: Dict[str, Optional[FieldRule]] = {}
+
+    def _match(self, label: str) -> Optional[FieldRule]:
+        for patterns, rule in self._rules:
+            if all(pattern.search(label) for pattern in patterns):
+                return rule
+        return None
+
+    def lookup(self, label: str) -> Optional[FieldRule]:
+        """
+        Правило для подписи
+
+        Args:
+            label: Текст подписи как на странице
+
+        Returns:
+            FieldRule или None, если подпись не сопоставлена полю
+        """
+        try:
+            return self._memo[label]
+        except KeyError:
+            pass
+
+        normalized = normalize_label(label)
+        if normalized in self._exact:
+            rule = self._exact[normalized]
+        else:
+            rule = self._match(normalized)
+        self._memo[label] = rule
+        return rule
+
+    def apply(self, label: str, value: str, data: Dict[str, Any]) -> bool:
+        """
+        Запись значения в поле, соответствующее подписи
+
+        Args:
+            label: Текст подписи
+            value: Текст значения
+            data: Словарь детальных данных
+
+        Returns:
+            True, если значение записано
+        """
+        rule = self.lookup(label)
+        if rule is None:
+            return False
+        if rule.convert is not None:
+            converted = rule.convert(value)
+            if converted is None:
+                return False
+            data[rule.field] = converted
+        else:
+            data[rule.field] = value
+        return True
@@ -2,11 +2,13 @@
 Универсальный парсер для реестров с табличной структурой
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import requests
 
 from parsers.base_parser import BaseParser
+from parsers.fast_extract import ListTable, extract_table_soup
 from config import BASE_URL
 
 
@@ -16,67 +18,45 @@ class GenericRegistryParser(BaseParser):
     Может использоваться для реестров, где не требуется специальная обработка
     """
 
-    def __init__(self, registry_key: str):
+    def __init__(self, registry_key: str, session: Optional[requests.Session] = None):
         """
         Args:
             registry_key: Ключ реестра из config.REGISTRIES
+            session: Сессия requests (по умолчанию общая для процесса)
         """
         from config import REGISTRIES
 
         registry = REGISTRIES[registry_key]
-        super().__init__(registry["url"], registry["name"])
-        self.registry_key = registry_key
+        super().__init__(registry["url"], registry["name"], registry_key, session)
+
+    @classmethod
+    def from_registry_key(cls, registry_key: str) -> "GenericRegistryParser":
+        return cls(registry_key)
 
     def parse_list_page(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
         Универсальный парсинг таблицы
         """
+        return self.items_from_table(extract_table_soup(soup))
+
+    def items_from_table(self, table: Optional[ListTable]) -> List[Dict[str, Any]]:
+        """
+        Построение записей из таблицы: ключи - тексты заголовков колонок
+        """
         items = []
 
-        table = soup.find("table")
-        if not table:
+        if table is None:
             self.logger.warning("Таблица с данными не найдена")
             return items
 
-        # Получаем заголовки
-        headers = []
-        header_row = table.find("tr")
-        if header_row:
-            headers = [
-                th.get_text(strip=True) for th in header_row.find_all(["th", "td"])
-            ]
-
-        # Парсим строки
-        rows = table.find_all("tr")[1:]
-
-        for row in rows:
-            try:
-                cols = row.find_all("td")
-                if not cols:
-                    continue
-
-                item_data = {}
-
-                # Сопоставляем колонки с заголовками
-                for i, col in enumerate(cols):
-                    header_name = headers[i] if i < len(headers) else f"col_{i}"
-                    item_data[header_name] = col.get_text(strip=True)
-
-                # Ищем ссылку на детальную страницу
-                link = row.find("a")
-                if link:
-                    href = link.get("href")
-                    # Проверяем, что href - строка, а не список
-                    if isinstance(href, list):
-                        href = href[0] if href else None
-                    if href and isinstance(href, str):
-                        item_data["detail_url"] = urljoin(BASE_URL, href)
-
-                items.append(item_data)
-
-            except Exception as e:
-                self.logger.error(f"Ошибка при парсинге строки: {e}")
-                continue
+        # Ключи записей - тексты заголовков колонок схемы реестра
+        batch = self.column_batch(table)
+
+        for item_data, href in zip(batch.records(), batch.hrefs):
+            # Ссылка на детальную страницу
+            if href:
+                item_data["detail_url"] = urljoin(BASE_URL, href)
+            items.append(item_data)
 
         return items
 
@@ -2,15 +2,34 @@
 Парсер реестра аудиторских организаций
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-import re
+import requests
 
 from parsers.base_parser import BaseParser
+from parsers.fast_extract import ListTable, extract_table_soup
+from parsers.field_spec import FieldRule, FieldSpec, first_int
 from models.organization import Organization
 from config import BASE_URL
 
+# Поля детальной страницы организации (первое подошедшее правило)
+FIELD_SPEC = FieldSpec(
+    [
+        FieldRule("full_name", ("полное наименован", "полное назван")),
+        FieldRule("ogrn", ("огрн",)),
+        FieldRule("kpp", ("кпп",)),
+        FieldRule("email", ("email", "e-mail", "почта", "адрес+почт")),
+        FieldRule("address", ("адрес",)),
+        FieldRule("phone", ("телефон", "тел")),
+        FieldRule("website", ("сайт", "веб-сайт")),
+        FieldRule("director", ("руководител", "директор")),
+        FieldRule("registration_date", ("дата регистрац",)),
+        FieldRule("membership_start_date", ("дата начала членства", "дата вступлен")),
+        FieldRule("auditors_count", ("количество аудиторов",), first_int),
+    ]
+)
+
 
 class OrganizationsParser(BaseParser):
     """
@@ -18,11 +37,20 @@ class OrganizationsParser(BaseParser):
     https://sroaas.ru/reestr/organizatsiy/
     """
 
-    def __init__(self):
+    field_spec = FIELD_SPEC
+    record_model = Organization
+    list_columns = ("name", "ornz", "inn", "region", "status")
+    list_min_cells = 4
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: Сессия requests (по умолчанию общая для процесса)
+        """
         from config import REGISTRIES
 
         registry = REGISTRIES["organizations"]
-        super().__init__(registry["url"], registry["name"])
+        super().__init__(registry["url"], registry["name"], "organizations", session)
 
     def parse_list_page(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
@@ -31,60 +59,44 @@ class OrganizationsParser(BaseParser):
         Args:
             soup: Parsed HTML страницы
 
+        Returns:
+            Список словарей с данными организаций
+        """
+        return self.items_from_table(extract_table_soup(soup))
+
+    def items_from_table(self, table: Optional[ListTable]) -> List[Dict[str, Any]]:
+        """
+        Построение записей организаций из таблицы списочной страницы
+
+        Args:
+            table: Таблица страницы или None, если она не найдена
+
         Returns:
             Список словарей с данными организаций
         """
         organizations = []
 
-        # Поиск таблицы с данными
-        table = soup.find("table")
-        if not table:
+        if table is None:
             self.logger.warning("Таблица с данными не найдена на странице")
             return organizations
 
-        # Парсинг строк таблицы
-        rows = table.find_all("tr")[1:]  # Пропускаем заголовок
+        batch = self.column_batch(table)
+        names, ornzs, inns, regions, statuses = batch.columns
 
-        for row in rows:
-            try:
-                cols = row.find_all("td")
-                if len(cols) < 4:
-                    continue
-
-                # Извлечение данных
-                name = cols[0].get_text(strip=True)
-                ornz = cols[1].get_text(strip=True)
-                inn = cols[2].get_text(strip=True)
-                region = cols[3].get_text(strip=True)
-
-                # Статус (если есть)
-                status = cols[4].get_text(strip=True) if len(cols) > 4 else None
-
-                # URL детальной страницы (если есть ссылка)
-                detail_url = None
-                link = row.find("a")
-                if link:
-                    href = link.get("href")
-                    # Проверяем, что href - строка, а не список
-                    if isinstance(href, list):
-                        href = href[0] if href else None
-                    if href:
-                        detail_url = urljoin(BASE_URL, href)
-
-                org_data = {
+        for name, ornz, inn, region, status, href in zip(
+            names, ornzs, inns, regions, statuses, batch.hrefs
+        ):
+            organizations.append(
+                {
                     "name": name,
                     "ornz": ornz,
                     "inn": inn,
                     "region": region,
                     "status": status,
-                    "detail_url": detail_url,
+                    # URL детальной страницы (если есть ссылка)
+                    "detail_url": urljoin(BASE_URL, href) if href else None,
                 }
-
-                organizations.append(org_data)
-
-            except Exception as e:
-                self.logger.error(f"Ошибка при парсинге строки таблицы: {e}")
-                continue
+            )
 
         return organizations
 
@@ -111,35 +123,9 @@ class OrganizationsParser(BaseParser):
                 values = block.find_all(["dd", "div"], class_=["value", "info-value"])
 
                 for label, value in zip(labels, values):
-                    key = label.get_text(strip=True).lower()
-                    val = value.get_text(strip=True)
-
-                    # Маппинг полей
-                    if "полное наименование" in key or "полное название" in key:
-                        detail_data["full_name"] = val
-                    elif "огрн" in key:
-                        detail_data["ogrn"] = val
-                    elif "кпп" in key:
-                        detail_data["kpp"] = val
-                    elif "адрес" in key:
-                        detail_data["address"] = val
-                    elif "телефон" in key or "тел" in key:
-                        detail_data["phone"] = val
-                    elif "email" in key or "e-mail" in key or "почта" in key:
-                        detail_data["email"] = val
-                    elif "сайт" in key or "веб-сайт" in key:
-                        detail_data["website"] = val
-                    elif "руководитель" in key or "директор" in key:
-                        detail_data["director"] = val
-                    elif "дата регистрации" in key:
-                        detail_data["registration_date"] = val
-                    elif "дата начала членства" in key or "дата вступления" in key:
-                        detail_data["membership_start_date"] = val
-                    elif "количество аудиторов" in key:
-                        # Извлечение числа
-                        match = re.search(r"\d+", val)
-                        if match:
-                            detail_data["auditors_count"] = int(match.group())
+                    self.field_spec.apply(
+                        label.get_text(strip=True), value.get_text(strip=True), detail_data
+                    )
 
             # Поиск информации о сертификатах
             certificates_section = soup.find(
@@ -174,22 +160,40 @@ class OrganizationsParser(BaseParser):
 
         return detail_data
 
-    def parse_to_objects(self, detailed: bool = False) -> List[Organization]:
+    def parse_to_objects(
+        self, detailed: bool = False, compact: bool = False
+    ) -> List[Organization]:
         """
         Парсинг реестра с преобразованием в объекты Organization
 
         Args:
             detailed: Парсить ли детальные страницы
+            compact: Компактные записи (models/compact.py: __slots__, общие
+                строки и метка времени обхода)
 
         Returns:
             Список объектов Organization
         """
-        data = self.parse_registry(detailed=detailed)
-        organizations = []
+        return list(self.iter_objects(detailed=detailed, compact=compact))
+
+    def iter_objects(
+        self, detailed: bool = False, compact: bool = False
+    ) -> Iterator[Organization]:
+        """
+        Потоковый парсинг реестра с преобразованием в объекты Organization
+
+        Args:
+            detailed: Парсить ли детальные страницы
+            compact: Компактные записи (models/compact.py: __slots__, общие
+                строки и метка времени обхода)
 
-        for item in data:
+        Yields:
+            Объекты Organization в порядке реестра
+        """
+        model = self._record_model(Organization, compact)
+        for item in self.iter_typed_records(detailed=detailed):
             try:
-                org = Organization(
+                yield model(
                     name=item.get("name", ""),
                     ornz=item.get("ornz", ""),
                     inn=item.get("inn", ""),
@@ -203,14 +207,14 @@ class OrganizationsParser(BaseParser):
                     email=item.get("email"),
                     website=item.get("website"),
                     director=item.get("director"),
+                    registration_date=item.get("registration_date"),
+                    membership_start_date=item.get("membership_start_date"),
+                    membership_end_date=item.get("membership_end_date"),
                     auditors_count=item.get("auditors_count"),
                     certificates=item.get("certificates", []),
                     networks=item.get("networks", []),
                     source_url=item.get("source_url"),
                 )
-                organizations.append(org)
             except Exception as e:
                 self.logger.error(f"Ошибка при создании объекта Organization: {e}")
                 continue
-
-        return organizations
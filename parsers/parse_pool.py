@@ -0,0 +1,78 @@
+"""
+Пул процессов для разбора HTML-страниц на всех ядрах
+"""
+
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Tuple, Union, List
+
+from config import CACHE_CONFIG, ARCHIVE_CONFIG
+
+# Парсеры, созданные в процессе-воркере: (класс, реестр) -> экземпляр
+_parsers: Dict[Tuple[str, str], Any] = {}
+
+
+def parser_path(parser) -> str:
+    """
+    Полное имя класса парсера для передачи в воркер
+
+    Args:
+        parser: Экземпляр парсера
+
+    Returns:
+        Строка вида "parsers.auditors_parser.AuditorsParser"
+    """
+    cls = type(parser)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _init_worker():
+    # Воркер только разбирает HTML: кэш и архив в нем не открываются
+    CACHE_CONFIG["enabled"] = False
+    ARCHIVE_CONFIG["run_id"] = None
+    ARCHIVE_CONFIG["replay_run_id"] = None
+
+
+def _get_parser(path: str, registry_key: str):
+    parser = _parsers.get((path, registry_key))
+    if parser is None:
+        module_name, class_name = path.rsplit(".", 1)
+        cls = getattr(importlib.import_module(module_name), class_name)
+        parser = cls.from_registry_key(registry_key)
+        _parsers[(path, registry_key)] = parser
+    return parser
+
+
+def parse_html(
+    path: str, registry_key: str, kind: str, url: str, html: str
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Разбор одной страницы в процессе-воркере
+
+    Args:
+        path: Полное имя класса парсера (parser_path)
+        registry_key: Ключ реестра
+        kind: "list" - списочная страница, "detail" - детальная
+        url: URL страницы
+        html: HTML страницы
+
+    Returns:
+        Записи списочной страницы или словарь детальных данных
+    """
+    parser = _get_parser(path, registry_key)
+    if kind == "list":
+        return parser.parse_list_html(html)
+    return parser.parse_detail_page(url, parser._parse_html(html, "detail"))
+
+
+def create_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Создание пула процессов разбора
+
+    Args:
+        workers: Число процессов
+
+    Returns:
+        Экземпляр ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
@@ -0,0 +1,86 @@
+"""
+Профили частичного разбора HTML
+
+Профиль ограничивает дерево BeautifulSoup элементами, которые читает
+парсер страниц этого вида; меню, подвал и скрипты в дерево не попадают.
+Элемент верхнего уровня, прошедший фильтр, сохраняется вместе со всем
+своим содержимым.
+"""
+
+from typing import Callable, Dict, Mapping, Optional
+
+from bs4 import SoupStrainer
+
+# Классы блоков пагинации (_get_pagination_urls)
+PAGINATION_CLASSES = frozenset(["b-pagination-block", "pagination"])
+
+# Классы блоков детальных страниц (parse_detail_page всех парсеров)
+DETAIL_CLASSES = frozenset(
+    [
+        "info-block",
+        "detail-info",
+        "info",
+        "certificates",
+        "attestaty",
+        "networks",
+        "seti",
+    ]
+)
+
+
+def _classes(attrs: Mapping) -> frozenset:
+    value = attrs.get("class") or ()
+    if isinstance(value, str):
+        value = value.split()
+    return frozenset(value)
+
+
+class ProfileStrainer(SoupStrainer):
+    """
+    Фильтр тегов верхнего уровня по имени и атрибутам
+
+    SoupStrainer не позволяет объединить условия через "или" (таблица либо
+    div пагинации), поэтому условие задается функцией match(name, attrs).
+    Поддерживаются обе версии API BeautifulSoup: allow_tag_creation
+    (4.13+) и search_tag (до 4.13).
+    """
+
+    def __init__(self, match: Callable[[str, Mapping], bool]):
+        """
+        Args:
+            match: Функция (имя тега, атрибуты) -> оставить ли элемент
+        """
+        super().__init__()
+        self._match = match
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs) -> bool:
+        return self._match(name, attrs or {})
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Текст вне выбранных элементов не нужен
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return self._match(markup_name, markup_attrs or {})
+
+
+def _list_match(name: str, attrs: Mapping) -> bool:
+    if name == "table":
+        return True
+    return name in ("div", "ul") and not PAGINATION_CLASSES.isdisjoint(_classes(attrs))
+
+
+def _detail_match(name: str, attrs: Mapping) -> bool:
+    return name in ("div", "table") and not DETAIL_CLASSES.isdisjoint(_classes(attrs))
+
+
+# Списочная страница: таблицы и блок пагинации
+LIST_PROFILE = ProfileStrainer(_list_match)
+
+# Детальная страница: info-block/detail-info/info, аттестаты и сети
+DETAIL_PROFILE = ProfileStrainer(_detail_match)
+
+PARSE_PROFILES: Dict[str, SoupStrainer] = {
+    "list": LIST_PROFILE,
+    "detail": DETAIL_PROFILE,
+}
@@ -0,0 +1,65 @@
+"""
+Общие фикстуры тестов: локальный реестр и изолированные настройки
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_server import MockRegistry, start_mock_server  # noqa: E402
+from config import (  # noqa: E402
+    CACHE_CONFIG,
+    CHECKPOINT_CONFIG,
+    EXPORT_CONFIG,
+    LOGGING_CONFIG,
+    PARSER_CONFIG,
+    REGISTRIES,
+    STATE_CONFIG,
+)
+
+
+@pytest.fixture
+def isolated_config(monkeypatch, tmp_path):
+    """Настройки без кэша, пауз и записи в data/ репозитория"""
+    monkeypatch.setitem(CACHE_CONFIG, "enabled", False)
+    monkeypatch.setitem(EXPORT_CONFIG, "output_dir", str(tmp_path / "exports"))
+    monkeypatch.setitem(STATE_CONFIG, "state_dir", str(tmp_path / "state"))
+    monkeypatch.setitem(CHECKPOINT_CONFIG, "checkpoint_dir", str(tmp_path / "checkpoints"))
+    monkeypatch.setitem(LOGGING_CONFIG, "level", "WARNING")
+    for key, value in {
+        "requests_per_second": 0,
+        "delay_between_requests": 0.01,
+        "backoff_max": 0.01,
+        "incremental": False,
+        "resume": False,
+        "prefetch_pages": 0,
+    }.items():
+        monkeypatch.setitem(PARSER_CONFIG, key, value)
+    return tmp_path
+
+
+@pytest.fixture
+def mock_registry(monkeypatch, isolated_config):
+    """
+    Фабрика локальных реестров: mock_registry(registry_key, **MockRegistry)
+
+    URL реестра в REGISTRIES подменяется адресом локального сервера.
+    """
+    servers = []
+
+    def start(registry_key: str, **options) -> MockRegistry:
+        registry = MockRegistry(**options)
+        server, base = start_mock_server(registry)
+        servers.append(server)
+        monkeypatch.setitem(
+            REGISTRIES, registry_key, dict(REGISTRIES[registry_key], url=f"{base}/reestr/x/")
+        )
+        return registry
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
@@ -0,0 +1,59 @@
+"""
+Архив HTML-страниц: воспроизведение запуска без сети
+"""
+
+import pytest
+
+from config import ARCHIVE_CONFIG, PARSER_CONFIG
+from parsers.auditors_parser import AuditorsParser
+from utils import archive as archive_module
+from utils.archive import HtmlArchive
+
+
+@pytest.fixture
+def archive_config(monkeypatch, isolated_config):
+    """Архив во временной директории без экземпляров прошлых тестов"""
+    monkeypatch.setattr(archive_module, "_archives", {})
+    monkeypatch.setitem(ARCHIVE_CONFIG, "archive_dir", str(isolated_config / "archive"))
+    monkeypatch.setitem(ARCHIVE_CONFIG, "run_id", None)
+    monkeypatch.setitem(ARCHIVE_CONFIG, "replay_run_id", None)
+    return ARCHIVE_CONFIG
+
+
+def test_identical_bodies_stored_once(tmp_path):
+    archive = HtmlArchive(str(tmp_path), "run-1")
+    archive.store("http://mock.test/a", {"page": 1}, b"<html/>", "utf-8")
+    archive.store("http://mock.test/b", None, b"<html/>", "utf-8")
+
+    objects = list((tmp_path / "objects").rglob("*.gz"))
+    assert len(objects) == 1
+
+    replay = HtmlArchive(str(tmp_path), "run-1", readonly=True)
+    assert replay.load_text("http://mock.test/a", {"page": 1}) == "<html/>"
+    assert replay.load("http://mock.test/a") is None
+    assert HtmlArchive.list_runs(str(tmp_path)) == ["run-1"]
+
+
+def test_unknown_run_is_rejected(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        HtmlArchive(str(tmp_path), "missing", readonly=True)
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_replay_reproduces_live_records(
+    mock_registry, monkeypatch, archive_config, engine
+):
+    registry = mock_registry("auditors", pages=2, per_page=3)
+    monkeypatch.setitem(PARSER_CONFIG, "engine", engine)
+
+    archive_config["run_id"] = "live"
+    live = AuditorsParser().parse_registry(detailed=True)
+    requests_made = registry.list_requests + registry.detail_requests
+
+    archive_config["run_id"] = None
+    archive_config["replay_run_id"] = "live"
+    replayed = AuditorsParser().parse_registry(detailed=True)
+
+    assert len(live) == 6
+    assert replayed == live
+    assert registry.list_requests + registry.detail_requests == requests_made
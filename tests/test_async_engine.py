@@ -0,0 +1,41 @@
+"""
+Асинхронный движок: отмена загрузок детальных страниц при сбое
+"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.mock_server import MockRegistry
+from config import PARSER_CONFIG
+from parsers.auditors_parser import AuditorsParser
+from utils.circuit_breaker import CircuitOpenError
+
+
+def test_detail_failure_cancels_sibling_fetches(isolated_config, monkeypatch):
+    monkeypatch.setitem(PARSER_CONFIG, "parse_workers", 0)
+    registry = MockRegistry(pages=1, per_page=5)
+    parser = AuditorsParser()
+    finished = []
+
+    async def fake_request(session, url, *args, **kwargs):
+        if "/detail/" not in url:
+            return registry.list_page("http://mock.test", "auditory", 1)
+        if url.endswith("/detail/1/"):
+            raise CircuitOpenError("хост недоступен")
+        await asyncio.sleep(0.2)
+        finished.append(url)
+        return registry.detail_page(int(url.rstrip("/").rsplit("/", 1)[1]))
+
+    monkeypatch.setattr(parser, "_make_request_async", fake_request)
+
+    async def crawl():
+        with pytest.raises(CircuitOpenError):
+            async for _ in parser.aiter_pages(detailed=True):
+                pass
+        # Оставшиеся загрузки успели бы завершиться, если бы не были отменены
+        await asyncio.sleep(0.4)
+
+    asyncio.run(crawl())
+
+    assert finished == []
@@ -0,0 +1,109 @@
+"""
+Колоночный пакет записей: обмен между парсером и экспортом
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from openpyxl import load_workbook
+
+import main
+from config import EXPORT_CONFIG
+from models.organization import Organization
+from utils.excel_exporter import SheetSpool
+from utils.normalizer import format_column, normalize_batch
+from utils.record_batch import RecordBatch
+
+
+def _sheet_rows(filepath):
+    workbook = load_workbook(filepath, read_only=True)
+    rows = list(workbook.worksheets[0].iter_rows(values_only=True))
+    workbook.close()
+    return rows
+
+
+@pytest.mark.parametrize("batch_in_memory", [False, True])
+def test_crawl_registry_exports_model_batch(
+    mock_registry, monkeypatch, batch_in_memory
+):
+    mock_registry("organizations", pages=1, per_page=3)
+    monkeypatch.setitem(EXPORT_CONFIG, "batch_in_memory", batch_in_memory)
+
+    summary = main.crawl_registry("organizations", detailed=True)
+
+    assert summary["error"] is None
+    assert summary["records"] == 3
+    header, *rows = _sheet_rows(summary["filepath"])
+    assert list(header) == list(Organization.export_columns.values())
+    record = dict(zip(header, rows[0]))
+    assert record["Наименование"] == "Запись 1"
+    assert record["КПП"] == "770101001"
+    assert record["Дата регистрации"] == "01.02.2003"
+    assert record["Количество аудиторов"] == 2
+    assert record["Сертификаты"] == "Аттестат 1"
+    datetime.strptime(record["Дата сбора данных"], "%d.%m.%Y %H:%M:%S")
+
+
+def test_single_workbook_spools_model_batches(mock_registry):
+    mock_registry("auditors", pages=2, per_page=3)
+    mock_registry("certificates", pages=1, per_page=2)
+
+    summaries = [
+        main.crawl_registry(key, detailed=True, single_workbook=True)
+        for key in ("auditors", "certificates")
+    ]
+    assert all(isinstance(summary["spool"], SheetSpool) for summary in summaries)
+    filepath = main.export_single_workbook(summaries)
+
+    workbook = load_workbook(filepath, read_only=True)
+    auditors = list(workbook["Аудиторы"].iter_rows(values_only=True))
+    workbook.close()
+    assert len(auditors) == 7
+    assert auditors[0][:2] == ("ФИО", "ОРНЗ")
+    assert auditors[1][:2] == ("Запись 1", "12000000001")
+
+
+def test_to_pandas_shares_typed_columns():
+    batch = RecordBatch.from_records(
+        [
+            {"name": "А", "registration_date": "01.02.2003", "auditors_count": "5"},
+            {"name": "Б", "registration_date": None, "auditors_count": None},
+        ],
+        fields=["name", "registration_date", "auditors_count"],
+        field_types=Organization.field_types,
+    )
+    normalize_batch(batch, Organization.field_types)
+
+    dates = batch.column("registration_date")
+    assert dates.dtype.kind == "M"
+    assert str(batch.column("auditors_count").dtype) == "Int64"
+
+    df = batch.to_pandas(display=False)
+    assert np.shares_memory(df["registration_date"].to_numpy(), dates)
+    assert np.shares_memory(df["name"].to_numpy(), batch.column("name"))
+    assert df["auditors_count"].tolist()[0] == 5
+
+
+def test_unparsed_date_text_is_kept():
+    batch = RecordBatch.from_records(
+        [
+            {"registration_date": "01.02.2003"},
+            {"registration_date": "по решению от 2003 г."},
+            {"registration_date": ""},
+        ],
+        fields=["registration_date"],
+        field_types={"registration_date": "date"},
+    )
+    normalize_batch(batch, batch.field_types)
+
+    assert list(batch.column("registration_date")) == [
+        datetime(2003, 2, 1),
+        "по решению от 2003 г.",
+        None,
+    ]
+    assert format_column(batch.column("registration_date"), "date") == [
+        "01.02.2003",
+        "по решению от 2003 г.",
+        "",
+    ]
@@ -0,0 +1,90 @@
+"""
+Восстановление записей страниц из контрольной точки
+"""
+
+import json
+
+import pytest
+
+from config import CHECKPOINT_CONFIG, PARSER_CONFIG
+from parsers.auditors_parser import AuditorsParser
+from utils.checkpoint import CrawlCheckpoint
+
+PAGES = [f"https://example.test/reestr/?PAGEN_1={number}" for number in range(1, 6)]
+
+
+def records(page_url):
+    return [{"id": page_url.rsplit("=", 1)[1]}]
+
+
+def open_checkpoint(tmp_path):
+    checkpoint = CrawlCheckpoint("auditors", checkpoint_dir=str(tmp_path), interval=0)
+    if not checkpoint.load():
+        checkpoint.reset()
+    checkpoint.start(PAGES)
+    return checkpoint
+
+
+def crawl(checkpoint, failing):
+    """Проход по страницам: завершенные читаются, failing - не завершаются"""
+    restored = {}
+    for page_url in checkpoint.pagination_urls:
+        if checkpoint.is_page_done(page_url):
+            restored[page_url] = checkpoint.read_page(page_url)
+        elif page_url not in failing:
+            checkpoint.page_done(page_url, records(page_url))
+    checkpoint.close()
+    return restored
+
+
+def test_pages_restored_by_url_across_resumes(tmp_path):
+    # 1-й запуск: страницы 3 и 5 не загрузились
+    crawl(open_checkpoint(tmp_path), failing={PAGES[2], PAGES[4]})
+    # 2-й запуск: страница 3 завершена, 5 снова не загрузилась
+    crawl(open_checkpoint(tmp_path), failing={PAGES[4]})
+    # 3-й запуск: записи 1-4 страниц восстанавливаются под своими URL
+    checkpoint = open_checkpoint(tmp_path)
+    restored = crawl(checkpoint, failing=set())
+
+    assert restored == {page_url: records(page_url) for page_url in PAGES[:4]}
+
+
+def test_uncommitted_page_line_is_dropped(tmp_path):
+    checkpoint = open_checkpoint(tmp_path)
+    checkpoint.page_done(PAGES[0], records(PAGES[0]))
+    # Строка страницы дописана, но meta.json не обновлен (сбой процесса)
+    with open(checkpoint.records_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"page": PAGES[1], "records": records(PAGES[1])}) + "\n")
+
+    resumed = open_checkpoint(tmp_path)
+
+    assert not resumed.is_page_done(PAGES[1])
+    assert resumed.read_page(PAGES[0]) == records(PAGES[0])
+    resumed.page_done(PAGES[1], [{"id": "new"}])
+    resumed.close()
+    assert open_checkpoint(tmp_path).read_page(PAGES[1]) == [{"id": "new"}]
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_first_page_failure_leaves_checkpoint_untouched(
+    mock_registry, monkeypatch, isolated_config, engine
+):
+    mock_registry("auditors", error_rate=1.0)
+    monkeypatch.setitem(PARSER_CONFIG, "engine", engine)
+    monkeypatch.setitem(PARSER_CONFIG, "resume", True)
+    monkeypatch.setitem(PARSER_CONFIG, "max_retries", 1)
+    checkpoint_dir = CHECKPOINT_CONFIG["checkpoint_dir"]
+    previous = CrawlCheckpoint("auditors", checkpoint_dir=checkpoint_dir, interval=0)
+    previous.reset()
+    previous.start(PAGES)
+    previous.page_done(PAGES[0], records(PAGES[0]))
+    previous.close()
+
+    parser = AuditorsParser()
+    assert list(parser.iter_pages(detailed=True)) == []
+
+    assert parser.checkpoint is None
+    resumed = CrawlCheckpoint("auditors", checkpoint_dir=checkpoint_dir)
+    assert resumed.load()
+    assert resumed.read_page(PAGES[0]) == records(PAGES[0])
+    resumed.close()
@@ -0,0 +1,71 @@
+"""
+Схема колонок списочной таблицы: сверка заголовков страниц
+"""
+
+from parsers.column_schema import MISSING, ColumnSchema
+from parsers.fast_extract import ListTable, TableRow
+from parsers.generic_parser import GenericRegistryParser
+
+
+def row(*cells, href=None):
+    return TableRow(list(cells), href)
+
+
+def test_header_hash_detects_changed_layout():
+    schema = ColumnSchema(["ФИО", "ОРНЗ"])
+
+    assert schema.matches(["ФИО", "ОРНЗ"])
+    assert not schema.matches(["ОРНЗ", "ФИО"])
+    assert not schema.matches(["ФИО", "ОРНЗ", "Статус"])
+
+
+def test_positional_schema_pads_and_truncates():
+    schema = ColumnSchema(["ФИО", "ОРНЗ"], fields=("full_name", "ornz"))
+
+    batch = schema.extract([row("Иванов"), row("Петров", "2", "лишняя")])
+
+    assert batch.complete
+    assert list(batch.records()) == [
+        {"full_name": "Иванов", "ornz": None},
+        {"full_name": "Петров", "ornz": "2"},
+    ]
+
+
+def test_header_schema_marks_missing_and_names_extra_cells():
+    schema = ColumnSchema(["ФИО", "ОРНЗ"])
+
+    batch = schema.extract([row("Иванов"), row("Петров", "2", "x"), row()])
+
+    assert not batch.complete
+    assert batch.names == ["ФИО", "ОРНЗ", "col_2"]
+    assert batch.columns[1][0] is MISSING
+    assert list(batch.records()) == [
+        {"ФИО": "Иванов"},
+        {"ФИО": "Петров", "ОРНЗ": "2", "col_2": "x"},
+    ]
+
+
+def test_header_mismatch_rebuilds_schema(isolated_config, monkeypatch):
+    parser = GenericRegistryParser("certificates")
+    warnings = []
+    monkeypatch.setattr(parser.logger, "warning", warnings.append)
+
+    first = parser.items_from_table(
+        ListTable(["Номер", "Статус"], [row("1", "действует", href="/detail/1/")])
+    )
+    schema = parser._column_schema
+    same = parser.items_from_table(ListTable(["Номер", "Статус"], [row("2", "нет")]))
+
+    assert parser._column_schema is schema
+    assert warnings == []
+
+    changed = parser.items_from_table(
+        ListTable(["Статус", "Номер", "Дата"], [row("действует", "3", "01.02.2003")])
+    )
+
+    assert len(warnings) == 1
+    assert "Номер" in warnings[0] and "Дата" in warnings[0]
+    assert parser._column_schema is not schema
+    assert first[0]["Номер"] == "1" and first[0]["detail_url"].endswith("/detail/1/")
+    assert same == [{"Номер": "2", "Статус": "нет"}]
+    assert changed == [{"Статус": "действует", "Номер": "3", "Дата": "01.02.2003"}]
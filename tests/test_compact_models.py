@@ -0,0 +1,49 @@
+"""
+Компактные модели: метка времени обхода и совпадение с обычными моделями
+"""
+
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+
+from benchmarks.memory_models import CASES
+from parsers.auditors_parser import AuditorsParser
+
+
+@pytest.mark.parametrize("name, model, compact, make_fields", CASES)
+def test_compact_matches_regular_model(name, model, compact, make_fields):
+    parsed_at = datetime(2024, 1, 31, 2, 0, 0)
+    fields = make_fields(7)
+
+    regular = model(**fields, parsed_at=parsed_at)
+    compact_record = compact(**fields, parsed_at=parsed_at)
+
+    assert compact_record.to_dict() == regular.to_dict()
+    assert asdict(compact_record) == asdict(regular)
+    assert not hasattr(compact_record, "__dict__")
+
+
+@pytest.mark.parametrize("name, model, compact, make_fields", CASES)
+def test_compact_requires_parsed_at(name, model, compact, make_fields):
+    with pytest.raises(TypeError):
+        compact(**make_fields(1))
+
+
+def test_parsed_at_is_per_parser(mock_registry):
+    mock_registry("auditors", pages=1, per_page=3)
+
+    # Обходы идут вперемешку, как реестры в run_all_mode
+    first = AuditorsParser()
+    first_records = first.iter_objects(compact=True)
+    first_head = next(first_records)
+
+    time.sleep(0.01)
+    second = AuditorsParser()
+    second_records = list(second.iter_objects(compact=True))
+    first_records = [first_head, *first_records]
+
+    assert first.run_timestamp != second.run_timestamp
+    assert {record.parsed_at for record in first_records} == {first.run_timestamp}
+    assert {record.parsed_at for record in second_records} == {second.run_timestamp}
@@ -0,0 +1,45 @@
+"""
+Код выхода неинтерактивного запуска (run_cron_mode)
+"""
+
+import pytest
+
+import main
+from config import PARSER_CONFIG
+
+
+def test_cron_exit_code_success(mock_registry):
+    mock_registry("auditors", pages=2, per_page=5)
+
+    with pytest.raises(SystemExit) as exit_info:
+        main.run_cron_mode("auditors", "quick")
+
+    assert exit_info.value.code == 0
+
+
+@pytest.mark.parametrize("registry_key", ["auditors", "organizations", "certificates"])
+def test_cron_exit_code_on_outage_fail(mock_registry, monkeypatch, registry_key):
+    # Все ответы 503: автомат защиты размыкается, обход прерывается
+    mock_registry(registry_key, pages=2, per_page=5, error_rate=1.0)
+    monkeypatch.setitem(PARSER_CONFIG, "breaker_mode", "fail")
+    monkeypatch.setitem(PARSER_CONFIG, "breaker_failure_threshold", 2)
+    monkeypatch.setitem(PARSER_CONFIG, "breaker_cooldown", 60)
+
+    with pytest.raises(SystemExit) as exit_info:
+        main.run_cron_mode(registry_key, "quick")
+
+    assert exit_info.value.code == 1
+
+
+@pytest.mark.parametrize(
+    "registry_arg, expected",
+    [
+        ("auditors", ["auditors"]),
+        ("auditors,", ["auditors"]),
+        (" Auditors ", ["auditors"]),
+        ("auditors, Organizations", ["auditors", "organizations"]),
+        (",", []),
+    ],
+)
+def test_resolve_registry_keys(registry_arg, expected):
+    assert main.resolve_registry_keys(registry_arg) == expected
@@ -0,0 +1,74 @@
+"""
+Сопоставление подписей детальных страниц с полями записей
+"""
+
+import pytest
+
+from parsers.auditors_parser import FIELD_SPEC as AUDITOR_SPEC
+from parsers.organizations_parser import FIELD_SPEC as ORGANIZATION_SPEC
+from parsers.field_spec import FieldRule, FieldSpec, normalize_label
+
+
+def field(spec, label):
+    rule = spec.lookup(label)
+    return rule.field if rule else None
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("Телефон руководителя", "phone"),
+        ("Email руководителя", "email"),
+        ("Руководитель", "director"),
+        ("Генеральный директор:", "director"),
+        ("Тел.:", "phone"),
+        ("Телефон", "phone"),
+        ("E-mail", "email"),
+        ("Адрес электронной почты", "email"),
+        ("Юридический адрес", "address"),
+        ("Полное наименование", "full_name"),
+        ("ОГРН", "ogrn"),
+        ("Дата регистрации", "registration_date"),
+        ("Количество аудиторов", "auditors_count"),
+        ("Примечание", None),
+    ],
+)
+def test_organization_labels(label, expected):
+    assert field(ORGANIZATION_SPEC, label) == expected
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("ИНН", "inn"),
+        ("ИНН организации", "organization_inn"),
+        ("Организация, ИНН", "organization_inn"),
+        ("СНИЛС", "snils"),
+        ("Квалификация", "qualification"),
+        ("Номер квалификационного аттестата", None),
+        ("Наименование организации", "organization_name"),
+        ("Образование", "education"),
+        ("Стаж работы", "experience_years"),
+    ],
+)
+def test_auditor_labels(label, expected):
+    assert field(AUDITOR_SPEC, label) == expected
+
+
+def test_apply_converts_and_skips_empty_numbers():
+    data = {}
+    assert AUDITOR_SPEC.apply("Стаж", "12 лет", data)
+    assert not AUDITOR_SPEC.apply("Стаж", "нет данных", data)
+    assert data == {"experience_years": 12}
+
+
+def test_first_declared_rule_wins():
+    spec = FieldSpec([FieldRule("first", ("дата",)), FieldRule("second", ("дата+выдачи",))])
+    assert field(spec, "Дата выдачи") == "first"
+
+
+def test_keywords_match_word_starts():
+    assert normalize_label("Ё-mail:  Адрес") == "е mail адрес"
+    spec = FieldSpec([FieldRule("phone", ("тел",))])
+    assert field(spec, "Тел.") == "phone"
+    assert field(spec, "Руководитель") is None
@@ -0,0 +1,108 @@
+"""
+Кэш HTTP-ответов: условные запросы и ответ 304 из кэша
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import pytest
+
+from parsers.auditors_parser import AuditorsParser
+from utils.http_cache import HttpCache
+
+ETAG = '"v1"'
+BODY = "<html><body>Реестр</body></html>".encode("utf-8")
+
+
+@pytest.fixture
+def etag_server():
+    """Сервер, отвечающий 304 на запрос с совпадающим If-None-Match"""
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if_none_match = self.headers.get("If-None-Match")
+            seen.append(if_none_match)
+            if if_none_match == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/reestr/x/", seen
+    server.shutdown()
+
+
+@pytest.fixture
+def cached_parser(isolated_config):
+    parser = AuditorsParser()
+    parser.cache = HttpCache(str(isolated_config / "http_cache"))
+    return parser
+
+
+def test_store_requires_validator(tmp_path):
+    cache = HttpCache(str(tmp_path))
+
+    cache.store("http://mock.test/a", None, BODY, {"Content-Type": "text/html"})
+    cache.store("http://mock.test/b", {"page": 2}, BODY, {"Last-Modified": "x"})
+
+    assert cache.get("http://mock.test/a") is None
+    assert cache.get("http://mock.test/b") is None
+    entry = cache.get("http://mock.test/b", {"page": 2})
+    assert entry.read_body() == BODY
+    assert cache.conditional_headers(entry) == {"If-Modified-Since": "x"}
+
+
+def test_expired_entry_is_ignored(tmp_path):
+    cache = HttpCache(str(tmp_path), ttl_days=0)
+    cache.store("http://mock.test/a", None, BODY, {"ETag": ETAG})
+
+    assert cache.get("http://mock.test/a") is None
+
+
+def test_revalidation_serves_304_from_cache(cached_parser, etag_server):
+    url, seen = etag_server
+
+    first = cached_parser._make_request(url, {"page": 1})
+    stored_at = cached_parser.cache.get(url, {"page": 1}).stored_at
+    second = cached_parser._make_request(url, {"page": 1})
+
+    assert seen == [None, ETAG]
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content == BODY
+    assert second.text == BODY.decode("utf-8")
+    # Ревалидация продлевает запись
+    assert cached_parser.cache.get(url, {"page": 1}).stored_at >= stored_at
+
+
+def test_async_revalidation_serves_304_from_cache(cached_parser, etag_server):
+    url, seen = etag_server
+
+    async def fetch_twice():
+        async with aiohttp.ClientSession() as session:
+            return [
+                await cached_parser._make_request_async(session, url),
+                await cached_parser._make_request_async(session, url),
+            ]
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert seen == [None, ETAG]
+    assert first == second == BODY.decode("utf-8")
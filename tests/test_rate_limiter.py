@@ -0,0 +1,95 @@
+"""
+Ограничитель частоты запросов: интервалы GCRA и ограничение Retry-After
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from config import PARSER_CONFIG
+from parsers.auditors_parser import AuditorsParser
+from utils import rate_limiter as rate_limiter_module
+from utils.rate_limiter import RateLimiter, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Управляемые часы вместо time.monotonic"""
+    state = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        rate_limiter_module, "time", SimpleNamespace(monotonic=lambda: state.now)
+    )
+    return state
+
+
+def test_burst_then_steady_interval(clock):
+    limiter = RateLimiter(rate=10, burst=3)
+
+    waits = [limiter.reserve() for _ in range(5)]
+
+    # Первые burst запросов без ожидания, дальше - по одному на интервал
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1)
+    assert waits[4] == pytest.approx(0.2)
+
+
+def test_idle_time_restores_burst_but_not_more(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    for _ in range(2):
+        limiter.reserve()
+
+    clock.now += 60
+
+    waits = [limiter.reserve() for _ in range(3)]
+    assert waits == [0.0, 0.0, pytest.approx(0.1)]
+
+
+def test_zero_rate_never_waits(clock):
+    limiter = RateLimiter(rate=0)
+
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+
+
+def test_pause_resumes_without_burst(clock):
+    limiter = RateLimiter(rate=10, burst=3)
+
+    limiter.pause(5)
+    waits = [limiter.reserve() for _ in range(3)]
+
+    # После паузы запросы идут с обычным интервалом, без накопленного всплеска
+    assert waits == [pytest.approx(5.0), pytest.approx(5.1), pytest.approx(5.2)]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("120", 120.0),
+        (" 7 ", 7.0),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", 0.0),
+        ("", None),
+        (None, None),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_retry_after_capped_by_max_retry_after(
+    isolated_config, monkeypatch, clock, status_code
+):
+    monkeypatch.setitem(PARSER_CONFIG, "max_retry_after", 30)
+    parser = AuditorsParser()
+    parser.rate_limiter = RateLimiter(rate=0)
+
+    assert parser._handle_throttling("http://mock.test/", status_code, "3600", 0)
+    assert parser.rate_limiter.reserve() == pytest.approx(30.0)
+
+
+def test_other_statuses_do_not_pause(isolated_config, clock):
+    parser = AuditorsParser()
+    parser.rate_limiter = RateLimiter(rate=0)
+
+    assert not parser._handle_throttling("http://mock.test/", 500, "3600", 0)
+    assert parser.rate_limiter.reserve() == 0.0
@@ -0,0 +1,61 @@
+"""
+Инкрементальный обход: детальные страницы неизменившихся строк из состояния
+"""
+
+import json
+
+import pytest
+
+from config import PARSER_CONFIG, STATE_CONFIG
+from parsers.auditors_parser import AuditorsParser
+from utils.state_store import CrawlStateStore
+
+
+@pytest.fixture
+def incremental(monkeypatch, isolated_config):
+    monkeypatch.setitem(PARSER_CONFIG, "incremental", True)
+
+
+def test_state_keeps_only_records_seen_in_current_run(tmp_path):
+    first = CrawlStateStore("auditors", state_dir=str(tmp_path))
+    kept, dropped = {"ornz": "1"}, {"detail_url": "/detail/2/"}
+    first.remember(kept, first.fingerprint(kept), {"inn": "1"})
+    first.remember(dropped, first.fingerprint(dropped), {"inn": "2"})
+    first.save()
+
+    second = CrawlStateStore("auditors", state_dir=str(tmp_path))
+    assert second.recall(kept, second.fingerprint(kept)) == {"inn": "1"}
+    assert second.recall(dropped, "другой отпечаток") is None
+    second.save()
+
+    third = CrawlStateStore("auditors", state_dir=str(tmp_path))
+    assert third.recall(kept, third.fingerprint(kept)) == {"inn": "1"}
+    assert third.recall(dropped, third.fingerprint(dropped)) is None
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_unchanged_rows_reuse_previous_details(
+    mock_registry, monkeypatch, incremental, engine
+):
+    registry = mock_registry("auditors", pages=2, per_page=3)
+    monkeypatch.setitem(PARSER_CONFIG, "engine", engine)
+
+    first = AuditorsParser().parse_registry(detailed=True)
+    assert registry.detail_requests == 6
+
+    second = AuditorsParser().parse_registry(detailed=True)
+    assert registry.detail_requests == 6
+    assert second == first
+
+    # Строка с изменившимся отпечатком загружается заново
+    path = f"{STATE_CONFIG['state_dir']}/auditors.json"
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    changed = next(iter(state))
+    state[changed]["fingerprint"] = "устарел"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+
+    third = AuditorsParser().parse_registry(detailed=True)
+    assert registry.detail_requests == 7
+    assert third == first
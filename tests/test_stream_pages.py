@@ -0,0 +1,59 @@
+"""
+Потоковый разбор страниц пагинации: те же строки, что и при полной загрузке
+"""
+
+import pytest
+
+from benchmarks.mock_server import MockRegistry
+from config import PARSER_CONFIG
+from parsers import base_parser
+from parsers.auditors_parser import AuditorsParser
+from parsers.fast_extract import extract_table_lxml, extract_table_stream
+from parsers.generic_parser import GenericRegistryParser
+from parsers.organizations_parser import OrganizationsParser
+
+PARSERS = {
+    "auditors": AuditorsParser,
+    "organizations": OrganizationsParser,
+    "certificates": lambda: GenericRegistryParser("certificates"),
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_stream_extract_matches_lxml(chunk_size):
+    html = MockRegistry(per_page=5, padding_kb=4).list_page(
+        "http://mock.test", "auditory", 1
+    )
+    body = html.encode("utf-8")
+    chunks = (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+
+    assert extract_table_stream(chunks, "utf-8") == extract_table_lxml(html)
+
+
+@pytest.mark.parametrize("registry_key", sorted(PARSERS))
+def test_stream_pages_matches_buffered_rows(mock_registry, monkeypatch, registry_key):
+    mock_registry(registry_key, pages=3, per_page=4, padding_kb=8)
+    monkeypatch.setitem(PARSER_CONFIG, "engine", "sync")
+    monkeypatch.setitem(PARSER_CONFIG, "list_backend", "lxml")
+    monkeypatch.setitem(PARSER_CONFIG, "stream_chunk_size", 1024)
+
+    monkeypatch.setitem(PARSER_CONFIG, "stream_pages", False)
+    buffered = PARSERS[registry_key]().parse_registry(detailed=True)
+
+    streamed_pages = []
+
+    def spy(chunks, encoding=None):
+        table = extract_table_stream(chunks, encoding)
+        streamed_pages.append(table)
+        return table
+
+    monkeypatch.setattr(base_parser, "extract_table_stream", spy)
+    monkeypatch.setitem(PARSER_CONFIG, "stream_pages", True)
+    parser = PARSERS[registry_key]()
+    assert parser._streams_list_pages()
+    streamed = parser.parse_registry(detailed=True)
+
+    assert len(buffered) == 12
+    # Первая страница загружается целиком: по ней определяется пагинация
+    assert len(streamed_pages) == 2
+    assert streamed == buffered
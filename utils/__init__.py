@@ -4,5 +4,17 @@
 
 from .logger import setup_logger
 from .excel_exporter import ExcelExporter
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .http_cache import HttpCache, get_http_cache
+from .transport import get_session, get_transport_stats
 
-__all__ = ["setup_logger", "ExcelExporter"]
+__all__ = [
+    "setup_logger",
+    "ExcelExporter",
+    "RateLimiter",
+    "get_rate_limiter",
+    "HttpCache",
+    "get_http_cache",
+    "get_session",
+    "get_transport_stats",
+]
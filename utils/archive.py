@@ -0,0 +1,258 @@
+"""
+Архив исходных HTML-страниц обхода для повторного разбора без сети
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Optional, Dict, List, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import ARCHIVE_CONFIG
+from utils.logger import setup_logger
+
+
+class HtmlArchive:
+    """
+    Архив тел ответов одного запуска
+
+    Тела хранятся сжатыми (gzip) и адресуются по SHA-256 содержимого, поэтому
+    одинаковые страницы разных запусков занимают место один раз:
+        objects/<xx>/<sha256>.gz - тело ответа
+        runs/<run_id>.jsonl      - индекс запуска: URL -> хэш и кодировка
+
+    Индекс дописывается построчно, так что архив прерванного запуска
+    тоже можно воспроизвести.
+    """
+
+    def __init__(self, archive_dir: str, run_id: str, readonly: bool = False):
+        """
+        Args:
+            archive_dir: Директория архива
+            run_id: Идентификатор запуска
+            readonly: Режим воспроизведения (только чтение)
+        """
+        self.archive_dir = archive_dir
+        self.run_id = run_id
+        self.readonly = readonly
+        self.index_path = os.path.join(archive_dir, "runs", f"{run_id}.jsonl")
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self._index: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+        if readonly:
+            self._load_index()
+        else:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+
+    @staticmethod
+    def full_url(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Итоговый URL запроса с параметрами
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            URL, под которым страница хранится в индексе
+        """
+        if not params:
+            return url
+        return requests.Request("GET", url, params=params).prepare().url
+
+    @staticmethod
+    def list_runs(archive_dir: Optional[str] = None) -> List[str]:
+        """
+        Идентификаторы сохраненных запусков
+
+        Args:
+            archive_dir: Директория архива
+
+        Returns:
+            Отсортированный список run_id
+        """
+        runs_dir = os.path.join(archive_dir or ARCHIVE_CONFIG["archive_dir"], "runs")
+        if not os.path.isdir(runs_dir):
+            return []
+        return sorted(
+            name[: -len(".jsonl")]
+            for name in os.listdir(runs_dir)
+            if name.endswith(".jsonl")
+        )
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.archive_dir, "objects", digest[:2], f"{digest}.gz")
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            raise FileNotFoundError(
+                f"Запуск {self.run_id} не найден в архиве {self.archive_dir}"
+            )
+
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Недописанная строка прерванного запуска
+                    continue
+                self._index[entry["url"]] = (entry["sha256"], entry.get("encoding"))
+
+        self.logger.info(
+            f"Загружен индекс архива {self.run_id}: {len(self._index)} страниц"
+        )
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict],
+        body: bytes,
+        encoding: Optional[str] = None,
+    ):
+        """
+        Сохранение тела ответа в архив запуска
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+            body: Тело ответа
+            encoding: Кодировка тела
+        """
+        if self.readonly:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        full_url = self.full_url(url, params)
+
+        try:
+            if not os.path.exists(object_path):
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(object_path), suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(gzip.compress(body))
+                    os.replace(tmp_path, object_path)
+                except OSError:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+
+            line = json.dumps(
+                {"url": full_url, "sha256": digest, "encoding": encoding},
+                ensure_ascii=False,
+            )
+            with self._lock:
+                if self._index.get(full_url) == (digest, encoding):
+                    return
+                self._index[full_url] = (digest, encoding)
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            self.logger.warning(f"Не удалось сохранить {url} в архив: {e}")
+
+    def load(
+        self, url: str, params: Optional[Dict] = None
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Тело ответа из архива запуска
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            Пара (тело, кодировка) или None, если страницы нет в архиве
+        """
+        entry = self._index.get(self.full_url(url, params))
+        if entry is None:
+            return None
+
+        digest, encoding = entry
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                return gzip.decompress(f.read()), encoding
+        except OSError as e:
+            self.logger.warning(f"Не удалось прочитать {url} из архива: {e}")
+            return None
+
+    def load_text(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
+        """Тело ответа из архива как строка"""
+        loaded = self.load(url, params)
+        if loaded is None:
+            return None
+        body, encoding = loaded
+        return body.decode(encoding or "utf-8", errors="replace")
+
+    def load_response(
+        self, url: str, params: Optional[Dict] = None
+    ) -> Optional[requests.Response]:
+        """
+        Построение Response из архива
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            Response с кодом 200 или None, если страницы нет в архиве
+        """
+        loaded = self.load(url, params)
+        if loaded is None:
+            return None
+
+        body, encoding = loaded
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.full_url(url, params)
+        response.headers = CaseInsensitiveDict({"Content-Type": "text/html"})
+        response.encoding = encoding
+        response._content = body
+        return response
+
+
+_archives: Dict[bool, Optional[HtmlArchive]] = {}
+_archives_lock = threading.Lock()
+
+
+def _shared_archive(run_id: Optional[str], readonly: bool) -> Optional[HtmlArchive]:
+    if not run_id:
+        return None
+
+    with _archives_lock:
+        archive = _archives.get(readonly)
+        if archive is None or archive.run_id != run_id:
+            archive = HtmlArchive(ARCHIVE_CONFIG["archive_dir"], run_id, readonly)
+            _archives[readonly] = archive
+        return archive
+
+
+def get_archive() -> Optional[HtmlArchive]:
+    """
+    Общий для процесса архив текущего запуска
+
+    Returns:
+        Экземпляр HtmlArchive или None, если архивирование выключено
+    """
+    if ARCHIVE_CONFIG.get("replay_run_id"):
+        return None
+    return _shared_archive(ARCHIVE_CONFIG.get("run_id"), readonly=False)
+
+
+def get_replay_archive() -> Optional[HtmlArchive]:
+    """
+    Архив воспроизводимого запуска (режим --replay)
+
+    Returns:
+        Экземпляр HtmlArchive только для чтения или None вне режима воспроизведения
+    """
+    return _shared_archive(ARCHIVE_CONFIG.get("replay_run_id"), readonly=True)
@@ -0,0 +1,268 @@
+"""
+Контрольные точки обхода реестра для возобновления после сбоя
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Optional, Dict, Any, List, Set
+
+from config import CHECKPOINT_CONFIG
+from utils.logger import setup_logger
+
+
+class CrawlCheckpoint:
+    """
+    Контрольная точка полного обхода одного реестра
+
+    Хранится в директории data/checkpoints/<реестр>/:
+        meta.json     - список страниц пагинации, завершенные страницы и
+                        детальные данные записей незавершенных страниц
+        records.jsonl - записи завершенных страниц, по строке на страницу
+                        ({"page": URL, "records": [...]}) в порядке
+                        завершения; при возобновлении строки ищутся по URL
+
+    Записи страницы дописываются сразу после ее завершения, meta.json
+    обновляется после каждой страницы и не реже чем раз в interval секунд.
+    """
+
+    META_FILE = "meta.json"
+    RECORDS_FILE = "records.jsonl"
+
+    def __init__(
+        self,
+        registry_key: str,
+        checkpoint_dir: Optional[str] = None,
+        interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            registry_key: Ключ реестра
+            checkpoint_dir: Корневая директория контрольных точек
+            interval: Максимальный интервал между сохранениями meta.json (сек)
+        """
+        root = checkpoint_dir or CHECKPOINT_CONFIG["checkpoint_dir"]
+        self.path = os.path.join(root, registry_key)
+        self.interval = (
+            interval if interval is not None else CHECKPOINT_CONFIG.get("interval", 30)
+        )
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self.pagination_urls: List[str] = []
+        self.completed_pages: Set[str] = set()
+        self.details: Dict[str, Dict[str, Any]] = {}
+
+        self._completed_order: List[str] = []
+        # Смещение строки страницы в records.jsonl: {URL страницы: смещение}
+        self._page_offsets: Dict[str, int] = {}
+        self._records_reader = None
+        self._saved_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(self.path, self.META_FILE)
+
+    @property
+    def records_path(self) -> str:
+        return os.path.join(self.path, self.RECORDS_FILE)
+
+    def load(self) -> bool:
+        """
+        Загрузка контрольной точки с диска
+
+        Returns:
+            True, если контрольная точка найдена
+        """
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Не удалось прочитать контрольную точку: {e}")
+            return False
+
+        self.pagination_urls = meta.get("pagination_urls", [])
+        self._completed_order = meta.get("completed_pages", [])
+        self.completed_pages = set(self._completed_order)
+        self.details = meta.get("details", {})
+
+        # В records.jsonl могут быть строки страниц, не попавших в meta.json,
+        # если процесс упал между записью страницы и meta.json
+        self._index_records()
+
+        self.logger.info(
+            f"Возобновление обхода: завершено страниц {len(self.completed_pages)}"
+            f"/{len(self.pagination_urls)}, сохранено детальных страниц "
+            f"{len(self.details)}"
+        )
+        return True
+
+    def reset(self):
+        """Удаление контрольной точки и начало нового обхода"""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.pagination_urls = []
+        self.completed_pages = set()
+        self._completed_order = []
+        self._page_offsets = {}
+        self.details = {}
+
+    def start(self, pagination_urls: List[str]):
+        """
+        Фиксация списка страниц обхода
+
+        Args:
+            pagination_urls: URL страниц пагинации
+        """
+        if not self.pagination_urls:
+            self.pagination_urls = list(pagination_urls)
+        os.makedirs(self.path, exist_ok=True)
+        self.save()
+
+    def is_page_done(self, page_url: str) -> bool:
+        """Завершена ли страница в прошлом запуске"""
+        return page_url in self.completed_pages
+
+    def read_page(self, page_url: str) -> List[Dict[str, Any]]:
+        """
+        Чтение записей завершенной страницы
+
+        Args:
+            page_url: URL страницы
+
+        Returns:
+            Записи страницы (пустой список, если страница не сохранена)
+        """
+        offset = self._page_offsets.get(page_url)
+        if offset is None:
+            self.logger.warning(
+                f"Записи страницы {page_url} не найдены в контрольной точке"
+            )
+            return []
+        if self._records_reader is None:
+            self._records_reader = open(self.records_path, "rb")
+        self._records_reader.seek(offset)
+        return json.loads(self._records_reader.readline())["records"]
+
+    def get_detail(self, detail_url: str) -> Optional[Dict[str, Any]]:
+        """Детальные данные, сохраненные до сбоя"""
+        return self.details.get(detail_url)
+
+    def add_detail(self, detail_url: str, detail: Dict[str, Any]):
+        """
+        Сохранение детальных данных записи незавершенной страницы
+
+        Args:
+            detail_url: URL детальной страницы
+            detail: Результат parse_detail_page
+        """
+        with self._lock:
+            self.details[detail_url] = detail
+            due = time.monotonic() - self._saved_at >= self.interval
+        if due:
+            self.save()
+
+    def page_done(self, page_url: str, records: List[Dict[str, Any]]):
+        """
+        Фиксация завершенной страницы
+
+        Args:
+            page_url: URL страницы
+            records: Записи страницы вместе с детальными данными
+        """
+        line = json.dumps(
+            {"page": page_url, "records": records}, ensure_ascii=False, default=str
+        )
+        with self._lock:
+            with open(self.records_path, "ab") as f:
+                self._page_offsets[page_url] = f.tell()
+                f.write((line + "\n").encode("utf-8"))
+            self.completed_pages.add(page_url)
+            self._completed_order.append(page_url)
+            for record in records:
+                self.details.pop(record.get("detail_url"), None)
+        self.save()
+
+    def save(self):
+        """Атомарная запись meta.json"""
+        with self._lock:
+            meta = {
+                "pagination_urls": self.pagination_urls,
+                "completed_pages": list(self._completed_order),
+                "details": dict(self.details),
+                "updated_at": time.time(),
+            }
+            self._saved_at = time.monotonic()
+
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.meta_path)
+        except OSError as e:
+            self.logger.error(f"Не удалось сохранить контрольную точку: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def close(self):
+        """Закрытие файла записей"""
+        if self._records_reader is not None:
+            self._records_reader.close()
+            self._records_reader = None
+
+    def clear(self):
+        """Удаление контрольной точки после успешного завершения обхода"""
+        self.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _index_records(self):
+        """
+        Индекс строк records.jsonl по URL страницы
+
+        Строки страниц, не отмеченных завершенными в meta.json, удаляются
+        (для повторной страницы остается последняя строка).
+        """
+        self._page_offsets = {}
+        if not os.path.exists(self.records_path):
+            return
+
+        lines: Dict[str, bytes] = {}
+        dropped = 0
+        with open(self.records_path, "rb") as f:
+            for line in f:
+                try:
+                    page_url = json.loads(line)["page"]
+                except (ValueError, KeyError, TypeError):
+                    page_url = None
+                if page_url in self.completed_pages:
+                    lines[page_url] = line
+                else:
+                    dropped += 1
+
+        if dropped or len(lines) < len(self.completed_pages):
+            # Завершенные страницы без записей обходятся заново
+            missing = self.completed_pages.difference(lines)
+            if missing:
+                self.logger.warning(
+                    f"В контрольной точке нет записей {len(missing)} страниц, "
+                    f"они будут загружены заново"
+                )
+                self.completed_pages -= missing
+                self._completed_order = [
+                    url for url in self._completed_order if url not in missing
+                ]
+            with open(self.records_path, "wb") as f:
+                for page_url, line in lines.items():
+                    self._page_offsets[page_url] = f.tell()
+                    f.write(line)
+            return
+
+        offset = 0
+        for page_url, line in lines.items():
+            self._page_offsets[page_url] = offset
+            offset += len(line)
@@ -0,0 +1,130 @@
+"""
+Экспоненциальная задержка повторов и автомат защиты (circuit breaker) по хостам
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import PARSER_CONFIG
+
+
+class CircuitOpenError(Exception):
+    """Хост недоступен: автомат защиты разомкнут"""
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Экспоненциальная задержка с полным джиттером
+
+    Args:
+        attempt: Номер попытки (с нуля)
+        base: Базовая задержка в секундах
+        cap: Максимальная задержка в секундах
+
+    Returns:
+        Случайная задержка из [0, min(cap, base * 2 ** attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+class CircuitBreaker:
+    """
+    Автомат защиты для одного хоста
+
+    После failure_threshold неудачных запросов подряд автомат размыкается
+    и на cooldown секунд запрещает новые запросы. По истечении паузы
+    пропускается один пробный запрос: успех замыкает автомат, неудача
+    снова размыкает его.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 10, cooldown: float = 60):
+        """
+        Args:
+            host: Имя хоста
+            failure_threshold: Число неудач подряд до размыкания
+            cooldown: Пауза после размыкания в секундах
+        """
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_until = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> float:
+        """
+        Проверка перед отправкой запроса
+
+        Returns:
+            0, если запрос можно отправлять, иначе секунды до конца паузы
+        """
+        with self._lock:
+            if self.failures < self.failure_threshold:
+                return 0.0
+
+            remaining = self.opened_until - time.monotonic()
+            if remaining > 0:
+                return remaining
+
+            # Пауза истекла: пропускаем один пробный запрос
+            if self._probe_in_flight:
+                return min(1.0, self.cooldown)
+            self._probe_in_flight = True
+            return 0.0
+
+    def record_success(self):
+        """Успешный ответ сервера"""
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Неудачный запрос
+
+        Returns:
+            True, если автомат разомкнулся в результате этой неудачи
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.failures < self.failure_threshold:
+                return False
+
+            # Неудачи запросов, отправленных до размыкания, паузу не продлевают
+            was_open = self.opened_until > now
+            if not was_open:
+                self.opened_until = now + self.cooldown
+            return not was_open
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    Общий для процесса автомат защиты хоста из URL
+
+    Args:
+        url: URL запроса
+
+    Returns:
+        Экземпляр CircuitBreaker
+    """
+    host = urlparse(url).netloc
+    with _breakers_lock:
+        breaker: Optional[CircuitBreaker] = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=PARSER_CONFIG.get("breaker_failure_threshold", 10),
+                cooldown=PARSER_CONFIG.get("breaker_cooldown", 60),
+            )
+            _breakers[host] = breaker
+        return breaker
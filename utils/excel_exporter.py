@@ -3,15 +3,353 @@
 """
 
 import os
+import re
+import json
+import tempfile
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import (
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 
 from config import EXPORT_CONFIG
 from utils.logger import setup_logger
+from utils.record_batch import RecordBatch
+from utils.normalizer import format_column
+
+
+# Стили оформления листов
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+CELL_ALIGNMENT = Alignment(horizontal="left", vertical="top", wrap_text=True)
+
+HEADER_STYLE_NAME = "registry_header"
+CELL_STYLE_NAME = "registry_cell"
+
+
+def _header_style() -> NamedStyle:
+    """Именованный стиль шапки (создается заново для каждой книги)"""
+    return NamedStyle(
+        name=HEADER_STYLE_NAME,
+        font=HEADER_FONT,
+        fill=HEADER_FILL,
+        alignment=HEADER_ALIGNMENT,
+    )
+
+
+def _cell_style() -> NamedStyle:
+    """Именованный стиль ячеек данных (создается заново для каждой книги)"""
+    return NamedStyle(name=CELL_STYLE_NAME, alignment=CELL_ALIGNMENT)
+
+
+def _excel_value(value: Any) -> Any:
+    """Приведение значения к типу, который можно записать в ячейку"""
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _sample(values: Sequence[Any], limit: int) -> Sequence[Any]:
+    """Равномерная выборка не более limit значений (0 - все значения)"""
+    if limit and len(values) > limit:
+        return values[:: -(-len(values) // limit)]
+    return values
+
+
+def _value_lengths(values: pd.Series) -> pd.Series:
+    """
+    Длины значений колонки в ячейках, векторно (пустые значения - 0)
+
+    Args:
+        values: Колонка (dtype object, исходные значения)
+
+    Returns:
+        Длины текстового представления значений
+    """
+    if pd.api.types.infer_dtype(values, skipna=True) in ("mixed", "mixed-integer"):
+        # Списки и словари записываются в ячейку текстом (_excel_value)
+        values = values.map(_excel_value, na_action="ignore")
+    filled = values.notna() & values.astype(bool)
+    return values.astype(str).str.len().where(filled, 0)
+
+
+def _max_length(values: Sequence[Any]) -> int:
+    """Максимальная длина значения колонки"""
+    if not len(values):
+        return 0
+    return int(_value_lengths(pd.Series(values, dtype=object)).max())
+
+
+def _max_lengths(frame: pd.DataFrame) -> Dict[str, int]:
+    """Максимальная длина значения по колонкам таблицы"""
+    if frame.empty:
+        return {name: 0 for name in frame.columns}
+    return {name: int(_value_lengths(values).max()) for name, values in frame.items()}
+
+
+def _records_layout(
+    rows: Sequence[Dict[str, Any]],
+) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Колонки записей-словарей и максимальные длины значений
+
+    Длины считаются векторно по выборке записей (не более
+    EXPORT_CONFIG["width_sample_rows"]).
+
+    Args:
+        rows: Записи
+
+    Returns:
+        Колонки в порядке появления и длины {колонка: длина}
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    sample = _sample(rows, EXPORT_CONFIG["width_sample_rows"])
+    frame = pd.DataFrame(list(sample), columns=columns, dtype=object)
+    return columns, _max_lengths(frame)
+
+
+def _column_widths(columns: Sequence[str], max_lengths: Dict[str, int]) -> List[int]:
+    """Ширины колонок по названию и самому длинному значению (не более 50)"""
+    return [
+        min(max(len(str(name)), max_lengths.get(name, 0)) + 2, 50) for name in columns
+    ]
+
+
+# Ограничения Excel на названия листов
+SHEET_TITLE_MAX_LENGTH = 31
+SHEET_TITLE_INVALID = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheet_titles(names: Iterable[str]) -> List[str]:
+    """
+    Допустимые и уникальные названия листов
+
+    Запрещенные символы заменяются, названия обрезаются до 31 символа,
+    повторы получают суффикс " (2)", " (3)", ...
+
+    Args:
+        names: Желаемые названия листов
+
+    Returns:
+        Названия в том же порядке
+    """
+    titles: List[str] = []
+    used = set()
+    for name in names:
+        base = SHEET_TITLE_INVALID.sub("_", str(name)).strip() or "Лист"
+        title = base[:SHEET_TITLE_MAX_LENGTH]
+        number = 1
+        while title.lower() in used:
+            number += 1
+            suffix = f" ({number})"
+            title = base[: SHEET_TITLE_MAX_LENGTH - len(suffix)] + suffix
+        used.add(title.lower())
+        titles.append(title)
+    return titles
+
+
+def _cell_values(values: Any) -> List[Any]:
+    """Колонка пакета списком значений Python (пустые значения - None)"""
+    if isinstance(values, list):
+        return values
+    series = pd.Series(values, copy=False).astype(object)
+    return series.where(series.notna(), None).tolist()
+
+
+def _batch_values(batch: RecordBatch) -> List[List[Any]]:
+    """
+    Значения колонок пакета для ячеек
+
+    Даты форматируются по field_types пакета один раз на колонку.
+
+    Args:
+        batch: Пакет записей
+
+    Returns:
+        Списки значений в порядке колонок пакета
+    """
+    return [
+        _cell_values(format_column(values, batch.field_types.get(field)))
+        for field, values in batch.columns()
+    ]
+
+
+class SheetSpool:
+    """
+    Записи одного листа во временном файле на диске
+
+    Записи (словари или объекты с to_dict()) сохраняются построчно в
+    JSON, одновременно собираются состав колонок и их ширины. Лист
+    затем записывается из файла за один проход, поэтому память не
+    зависит от числа записей. Можно заполнять в одном потоке, а
+    записывать в книгу - в другом.
+    """
+
+    # Записей в пачке для векторного подсчета длин значений
+    chunk_rows = 1000
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        # Максимальная длина значения по колонкам (в порядке появления)
+        self._max_lengths: Dict[str, int] = {}
+        # Записи, длины значений которых еще не учтены
+        self._pending: List[Dict[str, Any]] = []
+        self.rows = 0
+
+    def add(self, record: Any):
+        """
+        Добавление записи
+
+        Args:
+            record: Словарь или объект с to_dict()
+        """
+        row = record.to_dict() if hasattr(record, "to_dict") else record
+        self._pending.append(row)
+        if len(self._pending) >= self.chunk_rows:
+            self._measure()
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._file.write("\n")
+        self.rows += 1
+
+    def extend(self, records: Iterable[Any]):
+        """
+        Добавление записей из итератора
+
+        Args:
+            records: Записи; исключения итератора не перехватываются
+        """
+        for record in records:
+            self.add(record)
+
+    def add_batch(self, batch: RecordBatch):
+        """
+        Добавление записей колоночного пакета
+
+        Колонки пакета форматируются целиком (_batch_values), записи
+        сохраняются под названиями display_names пакета.
+
+        Args:
+            batch: Пакет записей, например страница BaseParser.iter_batches
+        """
+        columns = batch.display_columns()
+        for row in zip(*_batch_values(batch)):
+            self.add(dict(zip(columns, row)))
+
+    def extend_batches(self, batches: Iterable[RecordBatch]):
+        """
+        Добавление записей пакетов из итератора
+
+        Args:
+            batches: Пакеты; исключения итератора не перехватываются
+        """
+        for batch in batches:
+            self.add_batch(batch)
+
+    def _measure(self):
+        # Учет длин значений накопленной пачки записей
+        if not self._pending:
+            return
+        columns, lengths = _records_layout(self._pending)
+        self._pending = []
+        for name in columns:
+            self._max_lengths[name] = max(self._max_lengths.get(name, 0), lengths[name])
+
+    @property
+    def columns(self) -> List[str]:
+        """Колонки в порядке появления"""
+        self._measure()
+        return list(self._max_lengths)
+
+    def widths(self) -> List[int]:
+        """Ширины колонок"""
+        self._measure()
+        return _column_widths(self.columns, self._max_lengths)
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        """
+        Записи с начала файла
+
+        Yields:
+            Значения записи в порядке columns
+        """
+        columns = self.columns
+        self._file.seek(0)
+        for line in self._file:
+            row = json.loads(line)
+            yield [row.get(name) for name in columns]
+
+    def close(self):
+        """Удаление временного файла"""
+        self._file.close()
+
+    def __enter__(self) -> "SheetSpool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BatchSheet:
+    """
+    Лист из колоночного пакета записей (RecordBatch) в памяти
+
+    Повторяет интерфейс SheetSpool (rows, columns, widths(), iter_rows(),
+    close()). Заголовки - названия display_names пакета, даты
+    форматируются по field_types пакета один раз на колонку. Хранит все
+    значения листа, поэтому память растет с числом записей; для потоковой
+    выгрузки пакеты добавляются в SheetSpool (add_batch).
+    """
+
+    def __init__(self, batch: RecordBatch):
+        """
+        Args:
+            batch: Пакет записей (BaseParser.parse_to_batch)
+        """
+        self.rows = len(batch)
+        self.columns = batch.display_columns()
+        self._values = _batch_values(batch)
+
+    def widths(self) -> List[int]:
+        """Ширины колонок"""
+        sample = EXPORT_CONFIG["width_sample_rows"]
+        return [
+            min(max(len(str(name)), _max_length(_sample(values, sample))) + 2, 50)
+            for name, values in zip(self.columns, self._values)
+        ]
+
+    def iter_rows(self) -> Iterator[Sequence[Any]]:
+        """
+        Записи пакета
+
+        Yields:
+            Значения записи в порядке columns
+        """
+        return zip(*self._values)
+
+    def close(self):
+        """Освобождение значений листа"""
+        self._values = []
+
+    def __enter__(self) -> "BatchSheet":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 class ExcelExporter:
@@ -28,6 +366,7 @@ class ExcelExporter:
         """
         self.output_dir = output_dir or EXPORT_CONFIG["output_dir"]
         self.logger = setup_logger(self.__class__.__name__)
+        self.rows_exported = 0
 
         # Создание директории, если не существует
         os.makedirs(self.output_dir, exist_ok=True)
@@ -42,6 +381,11 @@ class ExcelExporter:
         """
         Экспорт данных в Excel файл
 
+        Лист пишется за один проход в write-only книгу: ширины колонок
+        считаются заранее по данным, стили шапки и ячеек, ширины и
+        закрепление шапки задаются при записи, без повторного открытия
+        файла.
+
         Args:
             data: Список словарей с данными
             filename: Имя файла (без расширения)
@@ -63,16 +407,15 @@ class ExcelExporter:
         filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
 
         try:
-            # Создание DataFrame
-            df = pd.DataFrame(data)
+            # Колонки в порядке появления и максимальные длины значений
+            columns, max_lengths = _records_layout(data)
+            widths = _column_widths(columns, max_lengths)
+            rows = ([row.get(name) for name in columns] for row in data)
 
-            # Экспорт в Excel
             self.logger.info(f"Экспорт {len(data)} записей в {filepath}")
-            df.to_excel(filepath, sheet_name=sheet_name, index=False, engine="openpyxl")
-
-            # Применение форматирования
-            if auto_format:
-                self._format_excel(filepath, sheet_name)
+            workbook = Workbook(write_only=True)
+            self._write_sheet(workbook, sheet_name, columns, rows, widths, auto_format)
+            workbook.save(filepath)
 
             self.logger.info(f"Данные успешно экспортированы в {filepath}")
             return filepath
@@ -81,66 +424,297 @@ class ExcelExporter:
             self.logger.error(f"Ошибка при экспорте в Excel: {e}")
             return None
 
-    def _format_excel(self, filepath: str, sheet_name: str):
+    def export_stream(
+        self,
+        records: Iterable[Any],
+        filename: str = None,
+        sheet_name: str = "Данные",
+        auto_format: bool = True,
+    ) -> Optional[str]:
         """
-        Применение форматирования к Excel файлу
+        Потоковый экспорт записей в Excel файл
+
+        Записи (словари или объекты с to_dict()) читаются из итератора
+        по одной и буферизуются во временном файле на диске, пока
+        собираются состав колонок и их ширины. Затем лист записывается
+        в режиме write-only, поэтому память не зависит от числа записей.
+        Количество выгруженных записей сохраняется в rows_exported.
+        Исключения, возникшие при чтении записей, не перехватываются.
 
         Args:
-            filepath: Путь к файлу
+            records: Итератор записей
+            filename: Имя файла (без расширения)
             sheet_name: Название листа
+            auto_format: Применять ли автоформатирование
+
+        Returns:
+            Путь к созданному файлу или None
+        """
+        return self._export_spooled(
+            lambda spool: spool.extend(records), filename, sheet_name, auto_format
+        )
+
+    def export_batches(
+        self,
+        batches: Iterable[RecordBatch],
+        filename: str = None,
+        sheet_name: str = "Данные",
+        auto_format: bool = True,
+    ) -> Optional[str]:
+        """
+        Потоковый экспорт колоночных пакетов записей в Excel файл
+
+        Пакеты (например, страницы BaseParser.iter_batches) форматируются
+        по колонкам и буферизуются во временном файле на диске, как в
+        export_stream, поэтому память не зависит от числа записей.
+        Заголовки - названия display_names пакетов. Количество выгруженных
+        записей сохраняется в rows_exported. Исключения, возникшие при
+        чтении пакетов, не перехватываются.
+
+        Args:
+            batches: Итератор пакетов
+            filename: Имя файла (без расширения)
+            sheet_name: Название листа
+            auto_format: Применять ли автоформатирование
+
+        Returns:
+            Путь к созданному файлу или None
+        """
+        return self._export_spooled(
+            lambda spool: spool.extend_batches(batches),
+            filename,
+            sheet_name,
+            auto_format,
+        )
+
+    def _export_spooled(
+        self,
+        fill: Callable[[SheetSpool], None],
+        filename: Optional[str],
+        sheet_name: str,
+        auto_format: bool,
+    ) -> Optional[str]:
+        """
+        Экспорт листа через временный файл SheetSpool
+
+        Args:
+            fill: Заполнение SheetSpool записями
+            filename: Имя файла (без расширения)
+            sheet_name: Название листа
+            auto_format: Применять ли автоформатирование
+
+        Returns:
+            Путь к созданному файлу или None
+        """
+        self.rows_exported = 0
+
+        if not filename:
+            timestamp = datetime.now().strftime(EXPORT_CONFIG["date_format"])
+            filename = f"export_{timestamp}"
+
+        filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
+
+        # Ошибки источника записей (сеть, парсинг) пробрасываются вызывающему коду
+        with SheetSpool() as spool:
+            fill(spool)
+            self.rows_exported = spool.rows
+
+            if not spool.rows:
+                self.logger.warning("Нет данных для экспорта")
+                return None
+
+            try:
+                self.logger.info(f"Экспорт {spool.rows} записей в {filepath}")
+                workbook = Workbook(write_only=True)
+                self._write_sheet(
+                    workbook,
+                    sheet_name,
+                    spool.columns,
+                    spool.iter_rows(),
+                    spool.widths(),
+                    auto_format,
+                )
+                workbook.save(filepath)
+
+            except Exception as e:
+                self.logger.error(f"Ошибка при экспорте в Excel: {e}")
+                return None
+
+        self.logger.info(f"Данные успешно экспортированы в {filepath}")
+        return filepath
+
+    def export_spools(
+        self,
+        spools: Iterable[Tuple[str, Any]],
+        filename: str = None,
+        auto_format: bool = True,
+    ) -> Optional[str]:
+        """
+        Экспорт нескольких буферизованных листов в одну книгу
+
+        Все листы пишутся в одну write-only книгу, которая сохраняется
+        один раз. Пустые листы пропускаются, названия приводятся к
+        ограничениям Excel (31 символ, без повторов). Количество
+        выгруженных записей сохраняется в rows_exported.
+
+        Args:
+            spools: Пары (название листа, SheetSpool или BatchSheet) в
+                порядке листов
+            filename: Имя файла (без расширения)
+            auto_format: Применять ли автоформатирование
+
+        Returns:
+            Путь к созданному файлу или None
         """
+        self.rows_exported = 0
+        spools = [(name, spool) for name, spool in spools if spool.rows]
+        if not spools:
+            self.logger.warning("Нет данных для экспорта")
+            return None
+
+        if not filename:
+            timestamp = datetime.now().strftime(EXPORT_CONFIG["date_format"])
+            filename = f"export_multi_{timestamp}"
+
+        filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
+
         try:
-            wb = load_workbook(filepath)
-            ws = wb[sheet_name]
-
-            # Стили
-            header_fill = PatternFill(
-                start_color="4472C4", end_color="4472C4", fill_type="solid"
-            )
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            header_alignment = Alignment(
-                horizontal="center", vertical="center", wrap_text=True
-            )
-
-            cell_alignment = Alignment(
-                horizontal="left", vertical="top", wrap_text=True
-            )
-
-            # Форматирование заголовков
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-
-            # Форматирование ячеек данных
-            for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-                for cell in row:
-                    cell.alignment = cell_alignment
-
-            # Автоподбор ширины столбцов
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
-
-                for cell in column:
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-
-                adjusted_width = min(max_length + 2, 50)  # Максимум 50 символов
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-            # Закрепление первой строки
-            ws.freeze_panes = "A2"
-
-            # Сохранение
-            wb.save(filepath)
-            self.logger.debug(f"Форматирование применено к {filepath}")
+            self.logger.info(f"Экспорт {len(spools)} листов в {filepath}")
+            workbook = Workbook(write_only=True)
+            titles = _sheet_titles(name for name, _ in spools)
+            for title, (_, spool) in zip(titles, spools):
+                self._write_sheet(
+                    workbook,
+                    title,
+                    spool.columns,
+                    spool.iter_rows(),
+                    spool.widths(),
+                    auto_format,
+                )
+                self.rows_exported += spool.rows
+            workbook.save(filepath)
 
         except Exception as e:
-            self.logger.error(f"Ошибка при форматировании Excel: {e}")
+            self.logger.error(f"Ошибка при экспорте в Excel: {e}")
+            self.rows_exported = 0
+            return None
+
+        self.logger.info(f"Данные успешно экспортированы в {filepath}")
+        return filepath
+
+    def export_batch(
+        self,
+        batch: RecordBatch,
+        filename: str = None,
+        sheet_name: str = "Данные",
+        auto_format: bool = True,
+    ) -> Optional[str]:
+        """
+        Экспорт колоночного пакета записей в Excel файл
+
+        Колонки пакета читаются напрямую (без DataFrame и построчных
+        словарей), заголовки - названия display_names пакета. Даты
+        форматируются по field_types пакета один раз на колонку.
+        Пакет и отформатированные значения листа целиком находятся в
+        памяти; для выгрузки с постоянной памятью - export_batches.
+        Количество выгруженных записей сохраняется в rows_exported.
+
+        Args:
+            batch: Пакет записей (BaseParser.parse_to_batch)
+            filename: Имя файла (без расширения)
+            sheet_name: Название листа
+            auto_format: Применять ли автоформатирование
+
+        Returns:
+            Путь к созданному файлу или None
+        """
+        self.rows_exported = 0
+
+        if not len(batch):
+            self.logger.warning("Нет данных для экспорта")
+            return None
+
+        if not filename:
+            timestamp = datetime.now().strftime(EXPORT_CONFIG["date_format"])
+            filename = f"export_{timestamp}"
+
+        filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
+
+        self.rows_exported = len(batch)
+        with BatchSheet(batch) as sheet:
+            try:
+                self.logger.info(f"Экспорт {sheet.rows} записей в {filepath}")
+                workbook = Workbook(write_only=True)
+                self._write_sheet(
+                    workbook,
+                    sheet_name,
+                    sheet.columns,
+                    sheet.iter_rows(),
+                    sheet.widths(),
+                    auto_format,
+                )
+                workbook.save(filepath)
+
+            except Exception as e:
+                self.logger.error(f"Ошибка при экспорте в Excel: {e}")
+                return None
+
+        self.logger.info(f"Данные успешно экспортированы в {filepath}")
+        return filepath
+
+    def _write_sheet(
+        self,
+        workbook: Workbook,
+        sheet_name: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        widths: Sequence[float],
+        auto_format: bool = True,
+    ):
+        """
+        Запись листа в write-only книгу за один проход
+
+        Ширины колонок, закрепление шапки и стили задаются до записи
+        строк, поэтому книгу не нужно перечитывать для форматирования.
+
+        Args:
+            workbook: Книга в режиме write_only
+            sheet_name: Название листа
+            columns: Названия колонок
+            rows: Итератор строк (значения в порядке columns)
+            widths: Ширины колонок
+            auto_format: Применять ли автоформатирование
+        """
+        ws = workbook.create_sheet(title=sheet_name)
+
+        if not auto_format:
+            ws.append(list(columns))
+            for row in rows:
+                ws.append([_excel_value(value) for value in row])
+            return
+
+        if HEADER_STYLE_NAME not in workbook.named_styles:
+            workbook.add_named_style(_header_style())
+            workbook.add_named_style(_cell_style())
+
+        for idx, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
+        ws.freeze_panes = "A2"
+
+        header = []
+        for name in columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.style = HEADER_STYLE_NAME
+            header.append(cell)
+        ws.append(header)
+
+        for row in rows:
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=_excel_value(value))
+                cell.style = CELL_STYLE_NAME
+                cells.append(cell)
+            ws.append(cells)
 
     def export_organizations(
         self, organizations: List[Any], filename: str = None
@@ -175,6 +749,11 @@ class ExcelExporter:
         """
         Экспорт данных в Excel с несколькими листами
 
+        Все листы записываются за один проход в одну write-only книгу
+        (стили, ширины колонок и закрепление шапки - при записи), книга
+        сохраняется один раз. Названия листов приводятся к ограничениям
+        Excel (31 символ, без повторов).
+
         Args:
             sheets_data: Словарь {название_листа: данные}
             filename: Имя файла
@@ -182,6 +761,7 @@ class ExcelExporter:
         Returns:
             Путь к созданному файлу
         """
+        sheets_data = {name: data for name, data in sheets_data.items() if data}
         if not sheets_data:
             self.logger.warning("Нет данных для экспорта")
             return None
@@ -194,20 +774,16 @@ class ExcelExporter:
         filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
 
         try:
-            with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-                for sheet_name, data in sheets_data.items():
-                    if data:
-                        df = pd.DataFrame(data)
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+            workbook = Workbook(write_only=True)
+            for title, data in zip(_sheet_titles(sheets_data), sheets_data.values()):
+                columns, max_lengths = _records_layout(data)
+                rows = ([row.get(name) for name in columns] for row in data)
+                self._write_sheet(
+                    workbook, title, columns, rows, _column_widths(columns, max_lengths)
+                )
+            workbook.save(filepath)
 
             self.logger.info(f"Данные успешно экспортированы в {filepath}")
-
-            # Форматирование каждого листа
-            wb = load_workbook(filepath)
-            for sheet_name in sheets_data.keys():
-                if sheet_name in wb.sheetnames:
-                    self._format_excel(filepath, sheet_name)
-
             return filepath
 
         except Exception as e:
@@ -0,0 +1,313 @@
+"""
+Дисковый кэш HTTP-ответов с условной ревалидацией
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Mapping
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import CACHE_CONFIG
+from utils.logger import setup_logger
+
+
+@dataclass
+class CacheEntry:
+    """Запись кэша: метаданные ответа и путь к телу"""
+
+    key: str
+    url: str
+    body_path: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+    def read_body(self) -> bytes:
+        """Чтение тела ответа с диска"""
+        with open(self.body_path, "rb") as f:
+            return f.read()
+
+    def read_text(self) -> str:
+        """Чтение тела ответа как строки"""
+        return self.read_body().decode(self.encoding or "utf-8", errors="replace")
+
+
+class HttpCache:
+    """
+    Дисковый кэш ответов, ключ - URL с параметрами запроса
+
+    Хранит тело ответа, ETag и Last-Modified. При повторном запросе
+    парсер отправляет If-None-Match/If-Modified-Since и при ответе 304
+    получает тело из кэша. Записи старше ttl удаляются, при превышении
+    max_size удаляются давно не использованные записи.
+    """
+
+    def __init__(self, cache_dir: str, ttl_days: float = 7, max_size_mb: float = 1024):
+        """
+        Args:
+            cache_dir: Директория кэша
+            ttl_days: Время жизни записи в днях
+            max_size_mb: Максимальный размер кэша в мегабайтах
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl_days * 86400
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.logger = setup_logger(self.__class__.__name__)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.prune()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Ключ кэша для URL и параметров запроса
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            SHA-256 от итогового URL
+        """
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        return hashlib.sha256(full_url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        directory = os.path.join(self.cache_dir, key[:2])
+        return (
+            os.path.join(directory, f"{key}.json"),
+            os.path.join(directory, f"{key}.body"),
+        )
+
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[CacheEntry]:
+        """
+        Получение записи кэша
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            CacheEntry или None, если записи нет или она устарела
+        """
+        key = self.make_key(url, params)
+        meta_path, body_path = self._paths(key)
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("stored_at", 0) > self.ttl or not os.path.exists(
+            body_path
+        ):
+            return None
+
+        return CacheEntry(
+            key=key,
+            url=meta.get("url", url),
+            body_path=body_path,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            encoding=meta.get("encoding"),
+            headers=meta.get("headers", {}),
+            stored_at=meta.get("stored_at", 0),
+        )
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        """
+        Заголовки условного запроса для записи кэша
+
+        Args:
+            entry: Запись кэша
+
+        Returns:
+            Словарь с If-None-Match и/или If-Modified-Since
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict],
+        body: bytes,
+        headers: Mapping[str, str],
+        encoding: Optional[str] = None,
+    ):
+        """
+        Сохранение ответа в кэш
+
+        Ответы без ETag и Last-Modified не сохраняются: их нельзя
+        ревалидировать.
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+            body: Тело ответа
+            headers: Заголовки ответа
+            encoding: Кодировка тела
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        key = self.make_key(url, params)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": encoding,
+            "headers": {"Content-Type": headers.get("Content-Type", "")},
+            "stored_at": time.time(),
+        }
+
+        try:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            self._write_atomic(body_path, body)
+            self._write_atomic(
+                meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")
+            )
+        except OSError as e:
+            self.logger.warning(f"Не удалось сохранить ответ {url} в кэш: {e}")
+
+    def touch(self, entry: CacheEntry):
+        """
+        Продление записи после успешной ревалидации (ответ 304)
+
+        Args:
+            entry: Запись кэша
+        """
+        meta_path, _ = self._paths(entry.key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["stored_at"] = time.time()
+            self._write_atomic(
+                meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")
+            )
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Не удалось обновить запись кэша {entry.url}: {e}")
+
+    @staticmethod
+    def build_response(entry: CacheEntry) -> requests.Response:
+        """
+        Построение Response из записи кэша
+
+        Args:
+            entry: Запись кэша
+
+        Returns:
+            Response с кодом 200 и телом из кэша
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry.url
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = entry.encoding
+        response._content = entry.read_body()
+        return response
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def prune(self):
+        """Удаление устаревших записей и вытеснение по размеру кэша"""
+        now = time.time()
+        entries = []
+        total_size = 0
+        removed = 0
+
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(root, name)
+                body_path = meta_path[: -len(".json")] + ".body"
+                try:
+                    mtime = os.path.getmtime(meta_path)
+                    size = os.path.getsize(meta_path)
+                    if os.path.exists(body_path):
+                        size += os.path.getsize(body_path)
+                except OSError:
+                    continue
+
+                if now - mtime > self.ttl:
+                    self._remove(meta_path, body_path)
+                    removed += 1
+                    continue
+
+                entries.append((mtime, size, meta_path, body_path))
+                total_size += size
+
+        # Вытеснение давно не использованных записей
+        if total_size > self.max_size:
+            entries.sort()
+            for _, size, meta_path, body_path in entries:
+                if total_size <= self.max_size:
+                    break
+                self._remove(meta_path, body_path)
+                total_size -= size
+                removed += 1
+
+        if removed:
+            self.logger.info(f"Из кэша удалено записей: {removed}")
+
+    @staticmethod
+    def _remove(*paths: str):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Общий для процесса кэш HTTP-ответов
+
+    Returns:
+        Экземпляр HttpCache или None, если кэш отключен в CACHE_CONFIG
+    """
+    global _shared_cache
+    if not CACHE_CONFIG.get("enabled", True):
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache(
+                cache_dir=CACHE_CONFIG["cache_dir"],
+                ttl_days=CACHE_CONFIG.get("ttl_days", 7),
+                max_size_mb=CACHE_CONFIG.get("max_size_mb", 1024),
+            )
+        return _shared_cache
@@ -0,0 +1,253 @@
+"""
+Приведение типов значений реестра по колонкам
+
+Значения приходят из парсеров строками ("01.02.2003", "12 лет",
+"123-456-789 00"). Нормализатор преобразует колонку целиком: даты
+разбираются векторно через pandas, каждый уникальный текст - один раз,
+с кэшем формата по колонке; из чисел и идентификаторов (ИНН, ОРНЗ,
+СНИЛС, ОГРН, КПП) извлекаются цифры.
+
+Типы полей задает модель (field_types):
+    "date"     - дата (datetime)
+    "datetime" - дата и время (datetime), например parsed_at
+    "int"      - целое число
+    "digits"   - идентификатор из цифр (str)
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Sequence
+
+import pandas as pd
+
+from utils.record_batch import RecordBatch, object_array
+
+# Форматы дат в реестрах, в порядке проверки
+DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%d.%m.%y")
+
+# Дата внутри текста ("с 01.02.2003 г.")
+_DATE_TEXT = r"(\d{1,2}\.\d{1,2}\.\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\.\d{1,2}\.\d{2})(?!\d)"
+
+# Годы раньше этого считаются ошибкой разбора
+_MIN_YEAR = 1900
+
+# Формат, подошедший колонке в прошлый раз: {ключ колонки: формат}
+_format_cache: Dict[str, str] = {}
+
+# Форматы выгрузки дат в Excel
+EXPORT_DATE_FORMATS = {"date": "%d.%m.%Y", "datetime": "%d.%m.%Y %H:%M:%S"}
+
+
+def _texts(values: Sequence[Any]) -> List[str]:
+    # Уникальные непустые строки колонки
+    return list(dict.fromkeys(v for v in values if isinstance(v, str) and v.strip()))
+
+
+def parse_dates(values: Sequence[Any], key: str = "") -> List[Any]:
+    """
+    Разбор колонки дат
+
+    Текст, в котором дату распознать не удалось, сохраняется как есть,
+    чтобы исходное значение реестра не терялось при выгрузке.
+
+    Args:
+        values: Значения колонки (строки, datetime или None)
+        key: Ключ колонки для кэша формата (обычно имя поля)
+
+    Returns:
+        datetime, исходная строка (дата не распознана) или None (пусто)
+    """
+    parsed: Dict[str, datetime] = {}
+    texts = _texts(values)
+    if texts:
+        extracted = pd.Series(texts, dtype=object).str.extract(_DATE_TEXT, expand=False)
+        remaining = extracted[extracted.notna()]
+
+        # Сначала формат, подошедший этой колонке в прошлый раз
+        cached = _format_cache.get(key)
+        formats = ([cached] if cached else []) + [f for f in DATE_FORMATS if f != cached]
+        for fmt in formats:
+            if remaining.empty:
+                break
+            converted = pd.to_datetime(remaining, format=fmt, errors="coerce")
+            matched = converted[converted.notna()]
+            matched = matched[[ts.year >= _MIN_YEAR for ts in matched]]
+            if matched.empty:
+                continue
+            if cached is None:
+                _format_cache[key] = cached = fmt
+            for index, ts in matched.items():
+                parsed[texts[index]] = ts.to_pydatetime()
+            remaining = remaining.drop(matched.index)
+
+    return [
+        value
+        if isinstance(value, datetime)
+        else parsed.get(value, value)
+        if isinstance(value, str) and value.strip()
+        else None
+        for value in values
+    ]
+
+
+def parse_ints(values: Sequence[Any], key: str = "") -> List[Optional[int]]:
+    """
+    Первое целое число из каждого значения колонки ("12 лет" -> 12)
+
+    Args:
+        values: Значения колонки (строки, числа или None)
+        key: Ключ колонки (не используется)
+
+    Returns:
+        int или None, если цифр нет
+    """
+    parsed: Dict[str, int] = {}
+    texts = _texts(values)
+    if texts:
+        numbers = pd.Series(texts, dtype=object).str.extract(r"(\d+)", expand=False)
+        for text, number in zip(texts, numbers):
+            if isinstance(number, str):
+                parsed[text] = int(number)
+
+    return [
+        value
+        if isinstance(value, int) and not isinstance(value, bool)
+        else parsed.get(value) if isinstance(value, str) else None
+        for value in values
+    ]
+
+
+def clean_digits(values: Sequence[Any], key: str = "") -> List[Optional[str]]:
+    """
+    Идентификаторы из цифр: пробелы, дефисы и префиксы удаляются
+
+    Args:
+        values: Значения колонки ("123-456-789 00", "ИНН 7701...", None)
+        key: Ключ колонки (не используется)
+
+    Returns:
+        Строка цифр или None, если цифр нет
+    """
+    cleaned: Dict[str, str] = {}
+    texts = _texts(values)
+    if texts:
+        digits = pd.Series(texts, dtype=object).str.replace(r"\D+", "", regex=True)
+        for text, value in zip(texts, digits):
+            if value:
+                cleaned[text] = value
+
+    return [
+        str(value)
+        if isinstance(value, int) and not isinstance(value, bool)
+        else cleaned.get(value) if isinstance(value, str) else None
+        for value in values
+    ]
+
+
+CONVERTERS: Dict[str, Callable[[Sequence[Any], str], List[Any]]] = {
+    "date": parse_dates,
+    "datetime": parse_dates,
+    "int": parse_ints,
+    "digits": clean_digits,
+}
+
+
+def normalize_column(values: Sequence[Any], kind: str, key: str = "") -> List[Any]:
+    """
+    Приведение колонки к типу
+
+    Args:
+        values: Значения колонки
+        kind: Тип поля ("date", "datetime", "int", "digits")
+        key: Ключ колонки для кэша формата
+
+    Returns:
+        Новые значения колонки
+    """
+    return CONVERTERS[kind](values, key)
+
+
+def normalize_records(
+    records: Sequence[MutableMapping[str, Any]], field_types: Mapping[str, str]
+):
+    """
+    Приведение типов в записях-словарях (на месте) по колонкам
+
+    Args:
+        records: Записи, например страница iter_pages
+        field_types: Типы полей {поле: тип}
+    """
+    if not records:
+        return
+    for name, kind in field_types.items():
+        present = [record for record in records if name in record]
+        if not present:
+            continue
+        values = normalize_column([record[name] for record in present], kind, name)
+        for record, value in zip(present, values):
+            record[name] = value
+
+
+def typed_array(values: Sequence[Any], kind: str):
+    """
+    Типизированный массив колонки для RecordBatch
+
+    Args:
+        values: Приведенные значения колонки (normalize_column)
+        kind: Тип поля
+
+    Returns:
+        datetime64 для дат (object, если в колонке есть нераспознанный
+        текст), Int64 (pandas) для чисел, иначе массив object
+    """
+    if kind in ("date", "datetime") and not any(isinstance(v, str) for v in values):
+        return pd.to_datetime(pd.Series(values, dtype=object)).to_numpy()
+    if kind == "int":
+        return pd.array(values, dtype="Int64")
+    return object_array(values)
+
+
+def normalize_batch(batch: RecordBatch, field_types: Mapping[str, str]):
+    """
+    Приведение типов колонок пакета (на месте)
+
+    Колонки заменяются типизированными массивами (typed_array); уже
+    типизированные колонки (например, заполненные fill) не меняются.
+
+    Args:
+        batch: Пакет записей
+        field_types: Типы полей {поле: тип}
+    """
+    for name, kind in field_types.items():
+        if name not in batch.fields:
+            continue
+        column = batch.column(name)
+        if column.dtype != object:
+            continue
+        values = normalize_column(column, kind, name)
+        batch.replace_column(name, typed_array(values, kind))
+
+
+def format_column(values: Sequence[Any], kind: Optional[str]) -> Sequence[Any]:
+    """
+    Значения колонки для выгрузки: даты - строками в формате реестра
+
+    Args:
+        values: Значения колонки
+        kind: Тип поля (None - без преобразования)
+
+    Returns:
+        Значения для записи в ячейки (пустые даты - "", нераспознанный
+        текст - как есть); колонки других типов возвращаются без копирования
+    """
+    date_format = EXPORT_DATE_FORMATS.get(kind)
+    if date_format is None:
+        return values
+
+    series = pd.Series(values, copy=False)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime(date_format).fillna("").tolist()
+
+    # Даты форматируются векторно, на месте NaT возвращается исходный текст
+    is_text = series.map(lambda value: isinstance(value, str)).astype(bool)
+    dates = pd.to_datetime(series.mask(is_text), errors="coerce")
+    return dates.dt.strftime(date_format).fillna(series.where(is_text, "")).tolist()
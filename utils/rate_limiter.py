@@ -0,0 +1,126 @@
+"""
+Ограничение частоты запросов (token bucket)
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from config import PARSER_CONFIG
+
+
+class RateLimiter:
+    """
+    Потокобезопасный ограничитель частоты запросов
+
+    Реализует token bucket в форме GCRA: не более rate запросов в секунду
+    в среднем и не более burst запросов подряд без ожидания. Поддерживает
+    общую паузу (например, по заголовку Retry-After), после которой
+    запросы возобновляются с обычным интервалом, без всплеска.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Запросов в секунду (0 - без ограничения)
+            burst: Максимальное число запросов подряд без ожидания
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._tolerance = self._interval * (self.burst - 1)
+        self._tat = 0.0  # теоретическое время следующего запроса
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Резервирование слота для одного запроса
+
+        Returns:
+            Время ожидания в секундах до разрешенного момента запроса
+        """
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            start = max(tat - self._tolerance, self._paused_until, now)
+            self._tat = max(tat, start) + self._interval
+            return start - now
+
+    def acquire(self):
+        """Блокирующее ожидание разрешения на запрос"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Асинхронное ожидание разрешения на запрос"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Приостановка всех запросов через этот ограничитель
+
+        Args:
+            seconds: Длительность паузы в секундах
+        """
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            self._paused_until = max(self._paused_until, until)
+            self._tat = max(self._tat, self._paused_until + self._tolerance)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Разбор заголовка Retry-After
+
+    Args:
+        value: Значение заголовка (число секунд или HTTP-дата)
+
+    Returns:
+        Задержка в секундах или None, если заголовок отсутствует или некорректен
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Общий для процесса ограничитель частоты запросов
+
+    Создается при первом обращении по настройкам PARSER_CONFIG
+    и используется всеми экземплярами парсеров.
+
+    Returns:
+        Экземпляр RateLimiter
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(
+                rate=PARSER_CONFIG.get("requests_per_second", 2.0),
+                burst=PARSER_CONFIG.get("burst", 4),
+            )
+        return _shared_limiter
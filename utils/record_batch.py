@@ -0,0 +1,262 @@
+"""
+Колоночный пакет записей реестра
+
+RecordBatch хранит записи по колонкам и служит форматом обмена между
+парсером и экспортом: парсер добавляет записи, экспорт и pandas читают
+колонки напрямую, без промежуточных словарей, моделей и to_dict().
+Пока пакет заполняется, колонки - списки; при чтении они становятся
+массивами numpy (object), а после приведения типов (utils.normalizer) -
+типизированными массивами (datetime64, Int64), которые to_pandas
+передает в DataFrame без копирования. Русские названия колонок
+применяются только при выдаче (to_pandas, to_arrow, display_columns).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+# Колонка пакета: список (при заполнении) или массив numpy/pandas
+Column = Any
+
+
+def object_array(values: Iterable[Any]) -> np.ndarray:
+    """
+    Одномерный массив numpy (object) из значений
+
+    В отличие от np.array, списки и кортежи значений не разворачиваются
+    в дополнительные измерения.
+
+    Args:
+        values: Значения
+
+    Returns:
+        Массив dtype=object
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    array = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+def _is_array(values: Any) -> bool:
+    return isinstance(values, (np.ndarray, ExtensionArray))
+
+
+def _as_list(column: Column) -> List[Any]:
+    # Массив колонки обратно в список (пустые значения - None)
+    if isinstance(column, list):
+        return column
+    series = pd.Series(column, copy=False).astype(object)
+    return series.where(series.notna(), None).tolist()
+
+
+class RecordBatch:
+    """
+    Записи реестра по колонкам
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        display_names: Optional[Mapping[str, str]] = None,
+        field_types: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Args:
+            fields: Поля пакета в порядке колонок (None - по мере появления
+                в записях; новое поле заполняется None для прежних записей)
+            display_names: Названия колонок при выдаче {поле: название}
+            field_types: Типы полей {поле: тип} (см. utils.normalizer)
+        """
+        self._fixed = fields is not None
+        self._columns: Dict[str, Column] = {name: [] for name in fields or ()}
+        self._length = 0
+        self.display_names: Dict[str, str] = dict(display_names or {})
+        self.field_types: Dict[str, str] = dict(field_types or {})
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        fields: Optional[Sequence[str]] = None,
+        display_names: Optional[Mapping[str, str]] = None,
+        field_types: Optional[Mapping[str, str]] = None,
+    ) -> "RecordBatch":
+        """
+        Пакет из записей-словарей
+
+        Args:
+            records: Записи
+            fields: Поля пакета (None - все поля записей)
+            display_names: Названия колонок при выдаче
+            field_types: Типы полей {поле: тип}
+
+        Returns:
+            Заполненный RecordBatch
+        """
+        batch = cls(fields, display_names, field_types)
+        batch.extend(records)
+        return batch
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def fields(self) -> List[str]:
+        """Поля пакета в порядке колонок"""
+        return list(self._columns)
+
+    def append(self, record: Mapping[str, Any]):
+        """
+        Добавление записи
+
+        Args:
+            record: Запись {поле: значение}; отсутствующие поля - None,
+                поля вне fields (если он задан) не сохраняются. Колонки,
+                уже ставшие массивами, снова превращаются в списки
+        """
+        columns = self._columns
+        if not self._fixed:
+            for name in record:
+                if name not in columns:
+                    columns[name] = [None] * self._length
+        for name, column in columns.items():
+            if not isinstance(column, list):
+                column = columns[name] = _as_list(column)
+            column.append(record.get(name))
+        self._length += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any]]):
+        """
+        Добавление нескольких записей
+
+        Args:
+            records: Записи {поле: значение}
+        """
+        for record in records:
+            self.append(record)
+
+    def fill(self, name: str, value: Any):
+        """
+        Одно значение во всех записях колонки (например, время сбора)
+
+        Args:
+            name: Поле
+            value: Значение (datetime - колонка datetime64)
+        """
+        if isinstance(value, datetime):
+            self._columns[name] = np.full(self._length, np.datetime64(value, "ns"))
+        else:
+            self._columns[name] = object_array([value] * self._length)
+
+    def replace_column(self, name: str, values: Sequence[Any]):
+        """
+        Замена значений колонки (например, после приведения типов)
+
+        Args:
+            name: Поле
+            values: Новые значения, по одному на запись; массивы numpy и
+                pandas сохраняются как есть, остальное - массивом object
+
+        Raises:
+            ValueError: Число значений не совпадает с числом записей
+        """
+        if len(values) != self._length:
+            raise ValueError(
+                f"Колонка {name}: {len(values)} значений на {self._length} записей"
+            )
+        self._columns[name] = values if _is_array(values) else object_array(values)
+
+    def _seal(self):
+        # Колонки-списки в массивы numpy (один раз, до следующего append)
+        for name, column in self._columns.items():
+            if isinstance(column, list):
+                self._columns[name] = object_array(column)
+
+    def column(self, name: str) -> Column:
+        """
+        Значения колонки
+
+        Args:
+            name: Поле
+
+        Returns:
+            Массив numpy или pandas в порядке записей (без копирования)
+        """
+        self._seal()
+        return self._columns[name]
+
+    def columns(self) -> Iterator[Tuple[str, Column]]:
+        """
+        Колонки пакета
+
+        Yields:
+            Пары (поле, массив значений)
+        """
+        self._seal()
+        return iter(self._columns.items())
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Записи построчно
+
+        Yields:
+            Кортежи значений в порядке колонок (пустые значения - None)
+        """
+        return zip(*(_as_list(column) for column in self._columns.values()))
+
+    def display_columns(self) -> List[str]:
+        """
+        Названия колонок для выгрузки
+
+        Returns:
+            Названия из display_names или сами имена полей
+        """
+        return [self.display_names.get(name, name) for name in self._columns]
+
+    def to_pandas(self, display: bool = True) -> pd.DataFrame:
+        """
+        DataFrame из колонок пакета
+
+        Массивы колонок передаются в DataFrame без копирования;
+        построчные словари не создаются.
+
+        Args:
+            display: Переименовать колонки в display_names
+
+        Returns:
+            DataFrame с колонками в порядке пакета
+        """
+        self._seal()
+        names = self.display_columns() if display else list(self._columns)
+        return pd.DataFrame(dict(zip(names, self._columns.values())), copy=False)
+
+    def to_arrow(self, display: bool = True):
+        """
+        Таблица pyarrow из колонок пакета (pyarrow не входит в зависимости)
+
+        Args:
+            display: Переименовать колонки в display_names
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            ImportError: pyarrow не установлен
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "Для RecordBatch.to_arrow нужен pyarrow: pip install pyarrow"
+            ) from e
+
+        self._seal()
+        names = self.display_columns() if display else list(self._columns)
+        return pa.table(
+            [pa.array(column) for column in self._columns.values()], names=names
+        )
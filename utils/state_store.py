@@ -0,0 +1,162 @@
+"""
+Хранилище состояния инкрементального обхода реестра
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Optional, Dict, Any
+
+from config import STATE_CONFIG
+from utils.logger import setup_logger
+
+
+class CrawlStateStore:
+    """
+    Отпечатки строк списочных страниц и детальные данные прошлого обхода
+
+    Запись идентифицируется по ОРНЗ, а при его отсутствии - по detail_url.
+    Если отпечаток строки совпадает с сохраненным, детальная страница не
+    загружается, а ее поля берутся из прошлого снимка. После обхода
+    в файл сохраняются только записи, встреченные в текущем запуске.
+    """
+
+    def __init__(self, registry_key: str, state_dir: Optional[str] = None):
+        """
+        Args:
+            registry_key: Ключ реестра (имя файла состояния)
+            state_dir: Директория файлов состояния
+        """
+        self.registry_key = registry_key
+        self.state_dir = state_dir or STATE_CONFIG["state_dir"]
+        self.path = os.path.join(self.state_dir, f"{registry_key}.json")
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self._previous: Dict[str, Dict[str, Any]] = self._load()
+        self._current: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.reused = 0
+        self.fetched = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Не удалось прочитать состояние {self.path}: {e}")
+            return {}
+
+        self.logger.info(f"Загружено состояние прошлого обхода: {len(records)} записей")
+        return records
+
+    @staticmethod
+    def record_key(item: Dict[str, Any]) -> Optional[str]:
+        """
+        Идентификатор записи: ОРНЗ или URL детальной страницы
+
+        Args:
+            item: Запись со списочной страницы
+
+        Returns:
+            Ключ записи или None
+        """
+        return item.get("ornz") or item.get("detail_url")
+
+    @staticmethod
+    def fingerprint(item: Dict[str, Any]) -> str:
+        """
+        Отпечаток строки списочной страницы
+
+        Args:
+            item: Запись со списочной страницы (до слияния с детальными данными)
+
+        Returns:
+            SHA-1 от сериализованной строки
+        """
+        payload = json.dumps(item, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def recall(self, item: Dict[str, Any], fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Детальные данные прошлого обхода для неизменившейся строки
+
+        Args:
+            item: Запись со списочной страницы
+            fingerprint: Отпечаток строки
+
+        Returns:
+            Сохраненные детальные данные или None, если страницу нужно загрузить
+        """
+        key = self.record_key(item)
+        if key is None:
+            return None
+
+        previous = self._previous.get(key)
+        if not previous or previous.get("fingerprint") != fingerprint:
+            return None
+
+        with self._lock:
+            self._current[key] = previous
+            self.reused += 1
+        return previous.get("detail", {})
+
+    def remember(
+        self, item: Dict[str, Any], fingerprint: str, detail: Dict[str, Any]
+    ):
+        """
+        Сохранение детальных данных загруженной записи
+
+        Args:
+            item: Запись со списочной страницы
+            fingerprint: Отпечаток строки, вычисленный до загрузки
+            detail: Результат parse_detail_page
+        """
+        key = self.record_key(item)
+        if key is None:
+            return
+
+        with self._lock:
+            self._current[key] = {"fingerprint": fingerprint, "detail": detail}
+            self.fetched += 1
+
+    def carry_over(self, item: Dict[str, Any]):
+        """
+        Перенос записи прошлого снимка в текущий без сверки отпечатка
+
+        Используется для записей, восстановленных из контрольной точки:
+        их строка списочной страницы уже недоступна.
+
+        Args:
+            item: Запись реестра
+        """
+        key = self.record_key(item)
+        previous = self._previous.get(key) if key is not None else None
+        if previous is None:
+            return
+
+        with self._lock:
+            self._current.setdefault(key, previous)
+
+    def save(self):
+        """Атомарная запись состояния текущего обхода"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._current, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.error(f"Не удалось сохранить состояние {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self.logger.info(
+            f"Состояние сохранено: {len(self._current)} записей "
+            f"(из прошлого снимка: {self.reused}, загружено: {self.fetched})"
+        )
@@ -0,0 +1,204 @@
+"""
+Общий HTTP-транспорт для всех парсеров процесса
+"""
+
+import threading
+from typing import Optional, Dict
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from config import PARSER_CONFIG
+
+
+class TransportStats:
+    """
+    Счетчики HTTP-транспорта процесса
+
+    Считает выполненные запросы и открытые соединения;
+    переиспользованными считаются запросы без нового соединения.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def request_done(self):
+        with self._lock:
+            self.requests += 1
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Снимок счетчиков"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(0, self.requests - self.connections_opened),
+            }
+
+    def summary(self) -> str:
+        """Строка для лога"""
+        stats = self.as_dict()
+        return (
+            f"запросов {stats['requests']}, соединений открыто "
+            f"{stats['connections_opened']}, переиспользовано "
+            f"{stats['connections_reused']}"
+        )
+
+
+_stats = TransportStats()
+
+
+def get_transport_stats() -> TransportStats:
+    """Счетчики транспорта процесса"""
+    return _stats
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _stats.connection_opened()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _stats.connection_opened()
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter, считающий новые соединения в пулах urllib3"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def accept_encoding() -> str:
+    """
+    Значение Accept-Encoding с учетом доступных декодеров
+
+    Brotli объявляется, только если установлен модуль brotli
+    (или brotlicffi), иначе ответ невозможно было бы распаковать.
+
+    Returns:
+        Строка для заголовка Accept-Encoding
+    """
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+
+            encodings.append("br")
+        except ImportError:
+            pass
+    return ", ".join(encodings)
+
+
+def _default_headers() -> Dict[str, str]:
+    return {
+        "User-Agent": PARSER_CONFIG["user_agent"],
+        "Accept-Encoding": accept_encoding(),
+    }
+
+
+def _count_response(response, *args, **kwargs):
+    _stats.request_done()
+
+
+def create_session() -> requests.Session:
+    """
+    Создание сессии requests с настроенным пулом keep-alive соединений
+
+    Размер пула задается pool_maxsize в PARSER_CONFIG и должен покрывать
+    число потоков, одновременно выполняющих запросы.
+
+    Returns:
+        Экземпляр requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(_default_headers())
+    session.hooks["response"].append(_count_response)
+
+    adapter = PooledHTTPAdapter(
+        pool_connections=PARSER_CONFIG.get("pool_connections", 10),
+        pool_maxsize=PARSER_CONFIG.get("pool_maxsize", 32),
+        pool_block=False,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_async_session(timeout: float) -> aiohttp.ClientSession:
+    """
+    Создание сессии aiohttp с тем же пулом, заголовками и счетчиками
+
+    Должна вызываться внутри работающего цикла событий.
+
+    Args:
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        Экземпляр aiohttp.ClientSession
+    """
+
+    async def on_connection_create_end(session, context, params):
+        _stats.connection_opened()
+
+    async def on_request_end(session, context, params):
+        _stats.request_done()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+
+    connector = aiohttp.TCPConnector(
+        limit=PARSER_CONFIG.get("pool_maxsize", 32),
+        limit_per_host=PARSER_CONFIG.get("concurrent_requests_per_host", 4),
+    )
+    return aiohttp.ClientSession(
+        headers=_default_headers(),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=connector,
+        trace_configs=[trace_config],
+    )
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Общая для процесса сессия requests
+
+    Все парсеры используют один пул соединений, поэтому при обходе
+    нескольких реестров соединения с хостом переиспользуются.
+
+    Returns:
+        Экземпляр requests.Session
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session